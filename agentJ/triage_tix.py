@@ -1,8 +1,16 @@
 import os
 import sys
+import json
+import math
+import queue
+import sqlite3
+import threading
+import time
 import requests
+import urllib3
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +23,18 @@ JIRA_TOKEN = os.getenv("JIRA_API_TOKEN")
 JIRA_BASE_URL = os.getenv("JIRA_BASE_URL")
 
 JQL = 'project = TRIAGE AND status = "Waiting For Support"'  # Customize
+FIELDS = "summary,description,priority,reporter,updated"
+
+# What earlier runs did, so unchanged issues are neither fetched nor re-alerted
+STATE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "triage_state.db")
+WATERMARK_OVERLAP_MINUTES = 5  # re-read this much before the last run, for clock skew
+
+PAGE_SIZE = 100         # issues per search request
+WORKERS = 8             # tickets checked / commented on concurrently
+QUEUE_SIZE = 200        # issues buffered between the search and the workers
+MAX_RETRIES = 3         # retries for 429, 5xx and connection errors
+RETRY_BACKOFF = 1.0     # seconds, doubled on each retry
+REQUEST_TIMEOUT = 30    # seconds per HTTP request
 
 HEADERS = {
     "Accept": "application/json",
@@ -23,6 +43,8 @@ HEADERS = {
 
 AUTH = (JIRA_EMAIL, JIRA_TOKEN)
 
+_local = threading.local()
+
 # Setup logging
 def setup_logging():
     # Create logs directory if it doesn't exist
@@ -64,26 +86,151 @@ def log(message, level="INFO"):
     
     logging.log(log_level, message)
 
-def fetch_issues():
-    log("Fetching issues from JIRA...")
-    log(f"Using JQL: {JQL}")
-    
+def session():
+    """One requests session per thread, reusing its connections"""
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+        _local.session.auth = AUTH
+        _local.session.headers.update(HEADERS)
+    return _local.session
+
+def never_sent(error):
+    """Whether a failed request provably never reached Jira (connect timeout, refused, DNS)"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, urllib3.exceptions.NewConnectionError)
+
+def jira_request(method, url, **kwargs):
+    """
+    Send a Jira API request, retrying rate limits, server errors and
+    connection failures with exponential backoff (or Retry-After).
+    A POST is only retried when it provably never reached Jira: a 429 or a
+    failed connect. A timeout, dropped connection or 5xx may mean it landed.
+    Returns (response, attempts); raises RequestException when out of retries.
+    """
+    idempotent = method != "POST"
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = session().request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            if attempt == MAX_RETRIES or not (idempotent or never_sent(e)):
+                raise
+            delay = RETRY_BACKOFF * 2 ** attempt
+        else:
+            retryable = response.status_code == 429 or idempotent and response.status_code >= 500
+            if not retryable or attempt == MAX_RETRIES:
+                response.raise_for_status()
+                return response, attempt + 1
+            retry_after = response.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else RETRY_BACKOFF * 2 ** attempt
+        log(f"Retrying {method} {url} in {delay:.1f}s (attempt {attempt + 2}/{MAX_RETRIES + 1})", "WARNING")
+        time.sleep(delay)
+
+class TriageState:
+    """
+    Local SQLite record of earlier runs: per issue, the `updated` time last
+    processed and the missing-field set its reporter was alerted about, plus
+    the start of the last complete run (the watermark).
+    """
+
+    def __init__(self, path=STATE_FILE):
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS issues (
+                issue_key TEXT PRIMARY KEY,
+                updated TEXT,
+                missing_fields TEXT,
+                alerted_at TEXT
+            );
+            CREATE TABLE IF NOT EXISTS runs (
+                id INTEGER PRIMARY KEY CHECK (id = 1),
+                watermark REAL NOT NULL
+            );
+        """)
+        self.issues = {key: (updated, missing) for key, updated, missing in
+                       self.conn.execute("SELECT issue_key, updated, missing_fields FROM issues")}
+
+    def watermark(self):
+        row = self.conn.execute("SELECT watermark FROM runs WHERE id = 1").fetchone()
+        return row[0] if row else None
+
+    def unchanged(self, issue):
+        """Whether the issue is exactly as the last run left it"""
+        known = self.issues.get(issue["key"])
+        return known is not None and known[0] == issue["fields"].get("updated")
+
+    def alerted(self, issue, missing_fields):
+        """Whether the reporter was already alerted about these missing fields"""
+        known = self.issues.get(issue["key"])
+        return known is not None and known[1] == json.dumps(sorted(missing_fields))
+
+    def save(self, outcomes, watermark=None):
+        """Record processed issues [(issue, missing, status)] in one transaction"""
+        now = datetime.now().isoformat(timespec="seconds")
+        with self.conn:
+            for issue, missing, status in outcomes:
+                key, updated = issue["key"], issue["fields"].get("updated")
+                if status == "complete":
+                    self.conn.execute("INSERT OR REPLACE INTO issues VALUES (?, ?, NULL, NULL)",
+                                      (key, updated))
+                elif status == "alerted":
+                    self.conn.execute("INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?)",
+                                      (key, updated, json.dumps(sorted(missing)), now))
+                elif status in ("duplicate", "unchanged"):
+                    self.conn.execute("UPDATE issues SET updated = ? WHERE issue_key = ?",
+                                      (updated, key))
+            if watermark is not None:
+                self.conn.execute("INSERT OR REPLACE INTO runs VALUES (1, ?)", (watermark,))
+
+    def close(self):
+        self.conn.close()
+
+def incremental_jql(watermark):
+    """JQL limited to issues updated since the watermark (relative, so no timezone issues)"""
+    if watermark is None:
+        return JQL
+    minutes = math.ceil((time.time() - watermark) / 60) + WATERMARK_OVERLAP_MINUTES
+    return f'({JQL}) AND updated >= "-{minutes}m"'
+
+def fetch_pages(page_size=PAGE_SIZE, jql=JQL):
+    """Yield each page of issues matching jql until the search is exhausted"""
     url = f"{JIRA_BASE_URL}/rest/api/3/search"
-    params = {
-        "jql": JQL,
-        "fields": "summary,description,priority,reporter",
-        "expand": "names"
-    }
-    
+    params = {"jql": jql, "fields": FIELDS, "maxResults": page_size, "startAt": 0}
+    page = 0
+
+    while True:
+        start = time.perf_counter()
+        response, attempts = jira_request("GET", url, params=params)
+        data = response.json()
+        issues = data.get("issues", [])
+        page += 1
+        log(f"page={page} start_at={params['startAt']} issues={len(issues)} "
+            f"total={data.get('total', '?')} attempts={attempts} "
+            f"elapsed_ms={(time.perf_counter() - start) * 1000:.0f}")
+        if issues:
+            yield issues
+
+        params["startAt"] += len(issues)
+        if not issues or params["startAt"] >= data.get("total", 0):
+            return
+
+def produce_issues(work, workers, stats):
+    """Producer: page through the JQL into the work queue, then stop the workers"""
+    log("Fetching issues from JIRA...")
+    log(f"Using JQL: {stats['jql']}")
     try:
-        response = requests.get(url, headers=HEADERS, auth=AUTH, params=params)
-        response.raise_for_status()
-        issues = response.json().get("issues", [])
-        log(f"Successfully fetched {len(issues)} issue(s)")
-        return issues
+        for issues in fetch_pages(stats["page_size"], stats["jql"]):
+            for issue in issues:
+                work.put((stats["fetched"], issue))
+                stats["fetched"] += 1
+        log(f"Successfully fetched {stats['fetched']} issue(s)")
     except requests.exceptions.RequestException as e:
         log(f"Error fetching issues: {e}", "ERROR")
-        return []
+        stats["fetch_failed"] = True
+    finally:
+        for _ in range(workers):
+            work.put(None)
 
 def check_fields(issue):
     missing = []
@@ -95,10 +242,24 @@ def check_fields(issue):
     #if not fields.get("environment"): missing.append("Environment")
     return missing
 
+def adf_text(node):
+    """Plain text of an Atlassian Document Format node"""
+    if isinstance(node, list):
+        return "".join(adf_text(child) for child in node)
+    if not isinstance(node, dict):
+        return ""
+    return node.get("text", "") + adf_text(node.get("content", []))
+
+def comment_posted(comment_url, text):
+    """Whether a recent comment on the issue already contains text"""
+    response, _ = jira_request("GET", comment_url, params={"orderBy": "-created", "maxResults": 50})
+    return any(text in adf_text(comment.get("body")) for comment in response.json().get("comments", []))
+
 def alert_reporter(issue, missing_fields, dry_run=False):
     issue_key = issue["key"]
-    reporter_name = issue["fields"]["reporter"]["displayName"]
-    reporter_account_id = issue["fields"]["reporter"]["accountId"]
+    reporter = issue["fields"].get("reporter") or {}
+    reporter_name = reporter.get("displayName", "Unknown")
+    reporter_account_id = reporter.get("accountId")
     
     if dry_run:
         log(f"[DRY RUN] Would comment on {issue_key} (Reporter: {reporter_name})")
@@ -107,25 +268,125 @@ def alert_reporter(issue, missing_fields, dry_run=False):
     log(f"Posting comment to {issue_key} (Reporter: {reporter_name})")
     
     comment_url = f"{JIRA_BASE_URL}/rest/api/3/issue/{issue_key}/comment"
+    request_text = f", please update the following fields: {', '.join(missing_fields)}"
+    # Without a reporter account (anonymous or deleted user) there is nobody to mention
+    greeting = [{ "type": "mention", "attrs": { "id": reporter_account_id } }] if reporter_account_id else []
     payload = { "body": { "type": "doc", "version": 1, "content": [
         {
             "type": "paragraph",
             "content": [
-                { "type": "text", "text": "Hi " },
-                { "type": "mention", "attrs": { "id": reporter_account_id } },
-                { "type": "text", "text": f", please update the following fields: {', '.join(missing_fields)}" }
+                { "type": "text", "text": "Hi" if not greeting else "Hi " },
+                *greeting,
+                { "type": "text", "text": request_text }
             ]
         }
     ]}}
     
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            _, attempts = jira_request("POST", comment_url, json=payload)
+            log(f"✓ Successfully commented on {issue_key}" + (f" after {attempt + attempts} attempts" if attempt + attempts > 1 else ""), "SUCCESS")
+            return True
+        except requests.exceptions.RequestException as e:
+            response = getattr(e, "response", None)
+            if attempt == MAX_RETRIES or response is not None and response.status_code < 500:
+                log(f"✗ Failed to comment on {issue_key}: {e}", "ERROR")
+                return False
+            # The POST may have landed: look for it before posting again
+            try:
+                if comment_posted(comment_url, request_text):
+                    log(f"✓ Comment on {issue_key} was posted despite: {e}", "SUCCESS")
+                    return True
+            except requests.exceptions.RequestException as check_error:
+                log(f"✗ Failed to comment on {issue_key}: {e} (could not check for it: {check_error})", "ERROR")
+                return False
+            log(f"Comment on {issue_key} not found after: {e}; posting again", "WARNING")
+            time.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+def process_alert(issue, missing_fields, dry_run):
+    """Alert one reporter and log the ticket's timing; returns True on success"""
+    start = time.perf_counter()
     try:
-        response = requests.post(comment_url, headers=HEADERS, auth=AUTH, json=payload)
-        response.raise_for_status()
-        log(f"✓ Successfully commented on {issue_key}", "SUCCESS")
-        return True
-    except requests.exceptions.RequestException as e:
-        log(f"✗ Failed to comment on {issue_key}: {e}", "ERROR")
-        return False
+        ok = alert_reporter(issue, missing_fields, dry_run)
+    except Exception as e:
+        log(f"✗ Failed to comment on {issue.get('key')}: {e!r}", "ERROR")
+        ok = False
+    log(f"ticket={issue['key']} action={'dry-run' if dry_run else 'comment'} "
+        f"result={'ok' if ok else 'failed'} elapsed_ms={(time.perf_counter() - start) * 1000:.0f}")
+    return ok
+
+def triage_worker(work, action, state, results, lock):
+    """
+    Worker: check fields for queued issues and, given an action, alert
+    reporters. Issues the state store shows as unchanged or already
+    alerted about the same fields are skipped.
+    """
+    while True:
+        item = work.get()
+        if item is None:
+            return
+        index, issue = item
+        start = time.perf_counter()
+        missing = []
+        try:
+            if state and state.unchanged(issue):
+                status = "unchanged"
+            else:
+                missing = check_fields(issue)
+                if not missing:
+                    status = "complete"
+                elif state and state.alerted(issue, missing):
+                    status = "duplicate"
+                else:
+                    log(f"  {issue['key']}: Missing {len(missing)} field(s)")
+                    status = "pending"
+                    if action:
+                        ok = process_alert(issue, missing, action == 'dry-run')
+                        status = "alerted" if ok else "failed"
+        except Exception as e:
+            # One bad issue must not stop this worker: the producer would block on the queue
+            log(f"ticket={issue.get('key')} action=check result=failed error={e!r}", "ERROR")
+            status = "failed"
+        if status not in ("alerted", "failed"):
+            log(f"ticket={issue['key']} action=check result={status} "
+                f"elapsed_ms={(time.perf_counter() - start) * 1000:.0f}")
+        with lock:
+            results.append((index, issue, missing, status))
+
+def triage_issues(action=None, workers=WORKERS, page_size=PAGE_SIZE, state=None, jql=JQL):
+    """
+    Page through jql on a producer thread while a bounded pool of workers
+    checks fields (and, given an action, alerts reporters) as issues arrive.
+    Returns (outcomes, stats): [(issue, missing, status)] in search order.
+    """
+    work = queue.Queue(maxsize=QUEUE_SIZE)
+    results, lock = [], threading.Lock()
+    stats = {"fetched": 0, "page_size": page_size, "jql": jql, "fetch_failed": False}
+
+    threads = [threading.Thread(target=triage_worker, args=(work, action, state, results, lock))
+               for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    produce_issues(work, workers, stats)
+    for thread in threads:
+        thread.join()
+
+    results.sort(key=lambda result: result[0])
+    return [result[1:] for result in results], stats
+
+def post_alerts(issues_to_alert, dry_run, workers=WORKERS):
+    """Alert reporters concurrently; returns a success flag per alert"""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda item: process_alert(*item, dry_run), issues_to_alert))
+
+def save_state(state, outcomes, stats, run_started):
+    """Remember what was done; the watermark only moves when nothing is left to retry"""
+    complete = not stats["fetch_failed"] and all(status != "failed" for *_, status in outcomes)
+    state.save(outcomes, run_started if complete else None)
+
+def log_throughput(label, count, elapsed):
+    rate = count / elapsed if elapsed > 0 else 0
+    log(f"throughput stage={label} tickets={count} elapsed_s={elapsed:.2f} tickets_per_s={rate:.1f}")
 
 def display_summary(issues_to_alert):
     print("\n" + "="*60)
@@ -140,8 +401,8 @@ def display_summary(issues_to_alert):
     
     for issue, missing in issues_to_alert:
         issue_key = issue["key"]
-        reporter_name = issue["fields"]["reporter"]["displayName"]
-        summary = issue["fields"].get("summary", "No summary")[:50]
+        reporter_name = (issue["fields"].get("reporter") or {}).get("displayName", "Unknown")
+        summary = (issue["fields"].get("summary") or "No summary")[:50]
         
         print(f"  • {issue_key}: {summary}...")
         print(f"    Reporter: {reporter_name}")
@@ -175,30 +436,8 @@ def run(args=None):
     elif args and args.execute:
         log("Running in EXECUTE mode (command-line flag)")
     
-    # Fetch issues
-    issues = fetch_issues()
-    if not issues:
-        log("No issues found or error occurred")
-        return
-    
-    # Check for missing fields
-    issues_to_alert = []
-    log("Checking for missing required fields...")
-    
-    for issue in issues:
-        missing = check_fields(issue)
-        if len(missing) >= 1:
-            issues_to_alert.append((issue, missing))
-            log(f"  {issue['key']}: Missing {len(missing)} field(s)")
-    
-    # Display summary
-    display_summary(issues_to_alert)
-    
-    if not issues_to_alert:
-        log("No actions required")
-        return
-    
-    # Prompt for action (or use command-line argument)
+    # With a mode on the command line, workers alert reporters as issues
+    # arrive; interactively, alerts wait for the summary and the prompt
     skip_prompt = False
     default_action = None
     
@@ -209,25 +448,72 @@ def run(args=None):
         elif args.execute:
             skip_prompt = True
             default_action = 'execute'
+    workers = args.workers if args else WORKERS
+    page_size = args.page_size if args else PAGE_SIZE
+    
+    # Only issues updated since the last complete run are fetched
+    state = TriageState()
+    run_started = time.time()
+    watermark = None if args and args.full else state.watermark()
+    if watermark is not None:
+        log(f"Incremental run: issues updated since {datetime.fromtimestamp(watermark):%Y-%m-%d %H:%M:%S}")
+    
+    # Fetch issues and check for missing fields
+    log(f"Checking for missing required fields ({workers} workers)...")
+    start = time.perf_counter()
+    outcomes, stats = triage_issues(default_action, workers, page_size, state, incremental_jql(watermark))
+    log_throughput("triage", stats["fetched"], time.perf_counter() - start)
+    if not stats["fetched"]:
+        log("No issues found or error occurred")
+    counts = {}
+    for _, _, status in outcomes:
+        counts[status] = counts.get(status, 0) + 1
+    if counts.get("unchanged") or counts.get("duplicate"):
+        log(f"Skipped {counts.get('unchanged', 0)} unchanged issue(s) and "
+            f"{counts.get('duplicate', 0)} already alerted about the same fields")
     
-    action = prompt_user(skip_prompt, default_action)
+    issues_to_alert = [(issue, missing) for issue, missing, status in outcomes
+                       if status in ("pending", "alerted", "failed")]
+    
+    # In execute mode the workers have already posted; record it before anything else can fail
+    if default_action == 'execute':
+        save_state(state, outcomes, stats, run_started)
+    
+    # Display summary
+    display_summary(issues_to_alert)
+    
+    # Prompt for action (or use command-line argument)
+    action = prompt_user(skip_prompt, default_action) if issues_to_alert else 'execute'
     
     if action == 'cancel':
         log("Operation cancelled by user")
+        state.close()
         return
     
     # Process alerts
     dry_run = (action == 'dry-run')
     mode_text = "[DRY RUN MODE] " if dry_run else ""
     
-    print("\n" + "="*60)
-    log(f"{mode_text}Processing alerts...")
-    print("="*60)
+    if issues_to_alert and not skip_prompt:
+        print("\n" + "="*60)
+        log(f"{mode_text}Processing alerts...")
+        print("="*60)
+        
+        start = time.perf_counter()
+        alerted = iter(post_alerts(issues_to_alert, dry_run, workers))
+        log_throughput("alerts", len(issues_to_alert), time.perf_counter() - start)
+        outcomes = [(issue, missing, status if status != "pending" else
+                     "alerted" if next(alerted) else "failed")
+                    for issue, missing, status in outcomes]
+    success_count = sum(1 for *_, status in outcomes if status == "alerted")
+    
+    if not dry_run and default_action != 'execute':
+        save_state(state, outcomes, stats, run_started)
+    state.close()
     
-    success_count = 0
-    for issue, missing_fields in issues_to_alert:
-        if alert_reporter(issue, missing_fields, dry_run):
-            success_count += 1
+    if not issues_to_alert:
+        log("No actions required")
+        return
     
     # Final summary
     print("\n" + "="*60)
@@ -249,6 +535,8 @@ Examples:
   %(prog)s --execute        # Execute mode (posts comments without prompting)
   %(prog)s -d               # Short form of --dry-run
   %(prog)s -e               # Short form of --execute
+  %(prog)s -e --workers 16  # Post comments 16 at a time
+  %(prog)s -e --full        # Ignore the last-run watermark and re-check everything
 
 Required environment variables (in .env file):
   JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN
@@ -267,6 +555,21 @@ Required environment variables (in .env file):
         action='store_true',
         help='Execute immediately without prompting for confirmation'
     )
+    parser.add_argument(
+        '-w', '--workers',
+        type=int, default=WORKERS,
+        help=f'Tickets checked and commented on concurrently (default: {WORKERS})'
+    )
+    parser.add_argument(
+        '--full',
+        action='store_true',
+        help='Re-check every matching issue, not just those updated since the last run'
+    )
+    parser.add_argument(
+        '--page-size',
+        type=int, default=PAGE_SIZE,
+        help=f'Issues fetched per search request (default: {PAGE_SIZE})'
+    )
     
     return parser.parse_args()
 
@@ -1,9 +1,9 @@
 #!/bin/bash
 
 # Batch CJ-Release Generator
-# Generates release notes for multiple JIRA tickets using cj-release tool
-# Usage: ./batch-cj-release.sh [ticket1] [ticket2] [ticket3] ...
-# If no tickets provided, uses the default MBSaas 7.11.0 tickets list
+# Generates release notes for multiple JIRA tickets in headless release-notes mode
+# Usage: ./batch-cj-release.sh --fix-version 7.11.0 [--workers N]   # whole release, one document
+#        ./batch-cj-release.sh [ticket1] [ticket2] [ticket3] ...      # per-ticket cj-release
 
 # Set environment variables (reads from .env if available)
 if [ -f "$(dirname "$0")/.env" ]; then
@@ -22,48 +22,50 @@ else
     fi
 fi
 
-# Use command line arguments or default to MBSaas 7.11.0 tickets
-if [ $# -gt 0 ]; then
-    TICKETS=("$@")
-else
-    # Default MBSaas 7.11.0 tickets
-    TICKETS=(
-        "SAAS-2227"
-        "SAAS-1901"
-        "SAAS-1892"
-        "SAAS-1891" 
-        "SAAS-1890"
-        "SAAS-1889"
-        "SAAS-1888"
-        "SAAS-1842"
-        "SAAS-1840"
-        "SAAS-1839"
-        "SAAS-536"
-        "SAAS-1193"
-        "SAAS-2026"
-        "SAAS-2030"
-        "SAAS-2052"
-        "SAAS-2054"
-    )
-fi
-
-# Get script directory and change to parent directory where cj-release is located
+# Get script directory and change to it (where main.py is located)
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 cd "$SCRIPT_DIR"
 
+# Whole release: page every issue in the fixVersion and write one release document
+if [ "$1" = "--fix-version" ]; then
+    if [ -z "$2" ]; then
+        echo "Usage: $0 --fix-version <version> [--workers N] [--output FILE]"
+        exit 1
+    fi
+    VERSION="$2"
+    shift 2
+    exec python3 review_release.py "$VERSION" --notes "$@"
+fi
+
+if [ $# -eq 0 ]; then
+    echo "Usage: $0 --fix-version <version> [--workers N]"
+    echo "       $0 <ticket> [<ticket> ...]"
+    exit 1
+fi
+TICKETS=("$@")
+
 echo "🚀 Starting batch release notes generation for ${#TICKETS[@]} tickets..."
 echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
 
 # Loop through tickets and generate release notes
 SUCCESS_COUNT=0
 FAILURE_COUNT=0
+SKIPPED_WRITES=0
 FAILED_TICKETS=()
+RUN_LOG=$(mktemp)
+trap 'rm -f "$RUN_LOG"' EXIT
 
 for ticket in "${TICKETS[@]}"; do
     echo "📝 Processing $ticket..."
-    if ./cj-release "$ticket"; then
+    # Headless: no prompts, and completed stages are skipped on a rerun (release_notes_journal.db)
+    python3 main.py "$ticket" --mode release-notes --headless 2>&1 | tee "$RUN_LOG"
+    if [ "${PIPESTATUS[0]}" -eq 0 ]; then
         echo "✅ Completed $ticket"
         ((SUCCESS_COUNT++))
+        # Journal or content hash showed the notes are already in customfield_10424
+        if grep -qE "skipped Jira update|already written" "$RUN_LOG"; then
+            ((SKIPPED_WRITES++))
+        fi
     else
         echo "❌ Failed to process $ticket"
         ((FAILURE_COUNT++))
@@ -77,6 +79,7 @@ echo "📊 BATCH SUMMARY"
 echo "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━"
 echo "✅ Successful: $SUCCESS_COUNT"
 echo "❌ Failed: $FAILURE_COUNT"
+echo "⏭️ Skipped writes (unchanged): $SKIPPED_WRITES"
 
 if [ ${#FAILED_TICKETS[@]} -gt 0 ]; then
     echo "Failed tickets: ${FAILED_TICKETS[*]}"
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Jira Date Parsing Benchmark and Parity Check
+
+Parses synthetic Jira timestamps with dateutil and with jira_dates (scalar
+fast path, cold and warm cache, and the vectorized column parser), fails if
+any parsed instant differs from dateutil's, and reports the timings.
+
+Usage:
+    python3 benchmark_jira_dates.py
+    python3 benchmark_jira_dates.py --dates 1000000 --skip-dateutil
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+import pandas as pd
+from dateutil import parser
+
+import jira_dates
+
+OFFSETS = ['-0400', '-0500', '+0000', '+0530', '-0700', '+1000']
+
+
+def synthetic_dates(count, seed=42):
+    """Jira-format timestamps spread over five years with mixed UTC offsets"""
+    rng = random.Random(seed)
+    start = datetime(2021, 1, 1)
+    dates = []
+    for _ in range(count):
+        moment = start + timedelta(seconds=rng.randint(0, 5 * 365 * 86400), milliseconds=rng.randint(0, 999))
+        dates.append(moment.strftime('%Y-%m-%dT%H:%M:%S.') + f"{moment.microsecond // 1000:03d}"
+                     + rng.choice(OFFSETS))
+    return dates
+
+
+def timed(label, func, count, baseline=None):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    speedup = f"{baseline / elapsed:6.1f}x" if baseline else "     -"
+    print(f"  {label:<32} {elapsed:8.3f}s  {count / elapsed:>12,.0f}/s  {speedup}")
+    return result, elapsed
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description='Benchmark Jira date parsing against dateutil')
+    arg_parser.add_argument('--dates', type=int, default=200000, help='Timestamps to parse')
+    arg_parser.add_argument('--skip-dateutil', action='store_true', help='Skip the dateutil baseline')
+    args = arg_parser.parse_args()
+
+    dates = synthetic_dates(args.dates)
+    print(f"📅 Parsing {len(dates):,} Jira timestamps ({len(set(dates)):,} unique)")
+    print(f"  {'parser':<32} {'time':>9}  {'rate':>14}  {'vs dateutil':>7}")
+
+    baseline = None
+    if not args.skip_dateutil:
+        expected, baseline = timed('dateutil.parser.parse', lambda: [parser.parse(d) for d in dates],
+                                   len(dates))
+
+    jira_dates.parse_jira_date.cache_clear()
+    fast, _ = timed('parse_jira_date (cold cache)', lambda: [jira_dates.parse_jira_date(d) for d in dates],
+                    len(dates), baseline)
+    # Repeated values (re-read exports, shared resolution dates) are cache hits
+    cached = dates[-jira_dates.CACHE_SIZE:]
+    timed('parse_jira_date (warm cache)', lambda: [jira_dates.parse_jira_date(d) for d in cached],
+          len(cached), baseline and baseline * len(cached) / len(dates))
+    column, _ = timed('parse_jira_dates (column)', lambda: jira_dates.parse_jira_dates(pd.Series(dates)),
+                      len(dates), baseline)
+
+    if not args.skip_dateutil:
+        mismatches = sum(a != b or a.utcoffset() != b.utcoffset() for a, b in zip(expected, fast))
+        mismatches += sum(pd.Timestamp(a) != b for a, b in zip(expected, column))
+        if mismatches:
+            raise SystemExit(f"❌ {mismatches} parsed values differ from dateutil")
+        print("✅ Every parsed instant and UTC offset matches dateutil")
+
+
+if __name__ == '__main__':
+    main()
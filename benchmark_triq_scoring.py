@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+TriQ Scoring Benchmark and Parity Check
+
+Scores synthetic tickets with both the scalar exporter functions and the
+vectorized triq_scoring module, fails if any TriQ_Score, Quality_Issues or
+Action_Required value differs, and reports the timings.
+
+Usage:
+    python3 benchmark_triq_scoring.py
+    python3 benchmark_triq_scoring.py --tickets 500000 --skip-scalar
+"""
+
+import argparse
+import random
+import time
+
+import pandas as pd
+
+import create_final_csv
+import generate_tri_csv
+from triq_scoring import estimate_has_description, score_comprehensive, score_final
+
+STATUSES = ['Resolved', 'Closed', 'In Progress', 'Pending', 'Waiting for customer',
+            'Waiting for support', 'Canceled', 'Unknown']
+URGENCIES = ['Critical', 'High', 'Medium', 'Low', 'Unknown']
+ASSIGNEES = ['', ' ', 'UNASSIGNED', 'nathaniel@munibilling.com', 'support@munibilling.com']
+SUMMARY_WORDS = ['CID', 'CID:', '384', 'Autopay', 'failed', 'detailed', 'billing', 'export',
+                 'Enhancement', 'meter', 'reading', 'portal', 'login', 'x', 'Borough', '-']
+
+
+def synthetic_tickets(count, seed=42):
+    """Build a ticket frame that hits every scoring branch, including length edges"""
+    rng = random.Random(seed)
+    summaries = []
+    for _ in range(count):
+        summary = ' '.join(rng.choice(SUMMARY_WORDS) for _ in range(rng.randint(0, 14)))
+        # Nudge lengths onto the 10/20/30/40/50 thresholds used by the rules
+        target = rng.choice([None, 9, 10, 11, 19, 20, 21, 29, 30, 39, 40, 50, 51])
+        if target is not None:
+            summary = (summary + ' ' * target)[:target]
+        summaries.append(summary)
+
+    return pd.DataFrame({
+        'Summary': summaries,
+        'Status': [rng.choice(STATUSES) for _ in range(count)],
+        'Assignee': [rng.choice(ASSIGNEES) for _ in range(count)],
+        'Urgency': [rng.choice(URGENCIES) for _ in range(count)],
+    })
+
+
+def scalar_comprehensive(df, has_description):
+    rows = []
+    for summary, status, assignee, urgency, described in zip(
+            df['Summary'], df['Status'], df['Assignee'], df['Urgency'], has_description):
+        score = generate_tri_csv.calculate_triq_score(summary, described, status, assignee)
+        issues = generate_tri_csv.assess_quality_issues(summary, described, status, assignee, urgency)
+        action = generate_tri_csv.determine_action_required(score, status, assignee, urgency, issues)
+        rows.append((score, issues, action))
+    return pd.DataFrame(rows, columns=['TriQ_Score', 'Quality_Issues', 'Action_Required'], index=df.index)
+
+
+def scalar_final(df):
+    rows = []
+    for summary, status, assignee, urgency in zip(df['Summary'], df['Status'], df['Assignee'], df['Urgency']):
+        score = create_final_csv.calculate_triq_score(summary, assignee, status, urgency)
+        issues = create_final_csv.assess_quality_issues(summary, assignee, status, urgency)
+        action = create_final_csv.determine_action_required(score, status, assignee, urgency, issues)
+        rows.append((score, issues, action))
+    return pd.DataFrame(rows, columns=['TriQ_Score', 'Quality_Issues', 'Action_Required'], index=df.index)
+
+
+def check_parity(name, expected, actual):
+    for column in expected.columns:
+        mismatched = expected[column].tolist() != actual[column].tolist()
+        if mismatched:
+            diff = expected[column] != actual[column]
+            print(f"❌ {name}.{column}: {int(diff.sum())} rows differ")
+            print(pd.concat([expected[column][diff], actual[column][diff]], axis=1).head())
+            return False
+    print(f"✅ {name}: vectorized output identical to scalar")
+    return True
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark vectorized TriQ scoring')
+    parser.add_argument('--tickets', type=int, default=100_000, help='Number of synthetic tickets')
+    parser.add_argument('--skip-scalar', action='store_true', help='Only time the vectorized scorers')
+    args = parser.parse_args()
+
+    df = synthetic_tickets(args.tickets)
+    has_description = estimate_has_description(df['Summary'])
+    print(f"📊 TriQ scoring benchmark ({len(df):,} synthetic tickets)")
+    print("=" * 60)
+
+    vec_comp, vec_comp_time = timed(lambda: score_comprehensive(df, has_description))
+    vec_final, vec_final_time = timed(lambda: score_final(df))
+    print(f"Vectorized comprehensive: {vec_comp_time:.3f}s")
+    print(f"Vectorized final:         {vec_final_time:.3f}s")
+
+    if args.skip_scalar:
+        return
+
+    scalar_comp, scalar_comp_time = timed(lambda: scalar_comprehensive(df, has_description.tolist()))
+    scalar_fin, scalar_final_time = timed(lambda: scalar_final(df))
+    print(f"Scalar comprehensive:     {scalar_comp_time:.3f}s "
+          f"({scalar_comp_time / vec_comp_time:.1f}x slower)")
+    print(f"Scalar final:             {scalar_final_time:.3f}s "
+          f"({scalar_final_time / vec_final_time:.1f}x slower)")
+    print("=" * 60)
+
+    ok = check_parity('comprehensive', scalar_comp, vec_comp)
+    ok = check_parity('final', scalar_fin, vec_final) and ok
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,132 @@
+import json
 import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 from dotenv import load_dotenv
 
+from prompt_budget import estimate_tokens
+
 # Load .env from parent directory
 load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '.env'))
 
 CLAUDE_API_KEY = os.getenv("ANTHROPIC_API_KEY")
+CLAUDE_WORKERS = 4  # concurrent requests across all batch callers
+REQUEST_TIMEOUT = 120
+
+FAST_MODEL = "claude-3-5-haiku-20241022"
+DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
+
+# model, max_tokens and temperature per mode; tag output is one short line
+ROUTES = {
+    "tag": {"model": FAST_MODEL, "max_tokens": 200, "temperature": 0.0},
+    "summarize": {"model": DEFAULT_MODEL, "max_tokens": 1200, "temperature": 0.3},
+    "subtasks": {"model": DEFAULT_MODEL, "max_tokens": 2000, "temperature": 0.3},
+    "test-notes": {"model": DEFAULT_MODEL, "max_tokens": 2500, "temperature": 0.3},
+    "release-notes": {"model": DEFAULT_MODEL, "max_tokens": 1000, "temperature": 0.3},
+    "release-summary": {"model": DEFAULT_MODEL, "max_tokens": 1200, "temperature": 0.3},
+    "rca": {"model": DEFAULT_MODEL, "max_tokens": 4000, "temperature": 0.2},
+}
+DEFAULT_ROUTE = {"model": DEFAULT_MODEL, "max_tokens": 2000, "temperature": 0.3}
+FAST_MODEL_MAX_INPUT_TOKENS = 6000  # longer inputs go to the default model even for fast modes
+SMALL_INPUT_TOKENS = 400  # inputs this small go to the fast model in FAST_WHEN_SMALL modes
+FAST_WHEN_SMALL = {"summarize"}
+ROUTE_LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "claude_routes.jsonl")
+
+USAGE_FIELDS = ("input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens", "output_tokens")
+
+_executor = None
+_executor_lock = threading.Lock()
+_usage_totals = Counter()
+_usage_lock = threading.Lock()
+_local = threading.local()
+_route_log_lock = threading.Lock()
+
+def choose_route(mode, input_tokens):
+    """Model, max_tokens and temperature for a call, from its mode and estimated input size"""
+    route = dict(ROUTES.get(mode, DEFAULT_ROUTE))
+    if route["model"] == FAST_MODEL and input_tokens > FAST_MODEL_MAX_INPUT_TOKENS:
+        route["model"] = DEFAULT_MODEL
+    elif mode in FAST_WHEN_SMALL and input_tokens <= SMALL_INPUT_TOKENS:
+        route["model"] = FAST_MODEL
+    return route
+
+def log_route(entry):
+    """Append one call's route, latency and usage to ROUTE_LOG_FILE (JSON lines)"""
+    _local.route = entry
+    with _route_log_lock:
+        try:
+            with open(ROUTE_LOG_FILE, "a") as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError:
+            pass
+
+def last_route():
+    """Route and latency of this thread's most recent Claude call"""
+    return getattr(_local, "route", {})
+
+def describe_route(entry):
+    """One-line report of a logged route"""
+    if not entry:
+        return ""
+    return (f"🧭 Route: {entry['model']} (max_tokens {entry['max_tokens']}, temperature {entry['temperature']}) "
+            f"for {entry['mode'] or 'default'}, ~{entry['input_tokens_est']:,} input tokens, {entry['latency_ms']:,} ms")
+
+def claude_executor(max_workers=None):
+    """Shared thread pool for concurrent Claude requests, created on first use"""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max_workers or CLAUDE_WORKERS,
+                                           thread_name_prefix="claude")
+        return _executor
+
+def submit_claude_prompt(prompt, prefix=None, mode=None):
+    """Queue a prompt on the shared executor; returns a Future for get_claude_response"""
+    return claude_executor().submit(get_claude_response, prompt, prefix, mode)
+
+def record_usage(usage):
+    """Keep a response's token usage as this thread's last call and add it to the totals"""
+    usage = {field: usage.get(field) or 0 for field in USAGE_FIELDS}
+    _local.usage = usage
+    with _usage_lock:
+        _usage_totals.update(usage)
+        _usage_totals["calls"] += 1
+
+def last_usage():
+    """Token usage of this thread's most recent Claude call"""
+    return getattr(_local, "usage", {})
+
+def usage_totals():
+    """Token usage summed over every Claude call in this process"""
+    with _usage_lock:
+        return dict(_usage_totals)
+
+def describe_cache_usage(usage):
+    """One-line prompt cache report for a usage dict"""
+    read = usage.get("cache_read_input_tokens", 0)
+    written = usage.get("cache_creation_input_tokens", 0)
+    uncached = usage.get("input_tokens", 0)
+    total = read + written + uncached
+    hit_rate = f", {read / total:.0%} of input from cache" if total else ""
+    return f"🗄️ Prompt cache: {read:,} read (hit), {written:,} written (miss), {uncached:,} uncached input tokens{hit_rate}"
 
-def get_claude_response(prompt):
+def get_claude_response(prompt, prefix=None, mode=None):
+    """
+    Send prompt to Claude with the model, max_tokens and temperature that
+    choose_route picks for the mode and input size; a prefix (instructions shared by many prompts)
+    goes first as a system block marked for prompt caching, so repeat
+    calls within the cache lifetime read it instead of reprocessing it.
+    Prefixes shorter than the model's minimum cacheable length (1024
+    tokens for Sonnet) are simply not cached. Every call is logged to
+    ROUTE_LOG_FILE with its route and latency.
+    """
+    input_tokens = estimate_tokens((prefix or "") + prompt)
+    route = choose_route(mode, input_tokens)
     url = "https://api.anthropic.com/v1/messages"
     headers = {
         "x-api-key": CLAUDE_API_KEY,
@@ -15,13 +134,33 @@ def get_claude_response(prompt):
         "Content-Type": "application/json"
     }
     data = {
-        "model": "claude-3-5-sonnet-20241022",
-        "max_tokens": 2000,
-        "temperature": 0.3,
+        "model": route["model"],
+        "max_tokens": route["max_tokens"],
+        "temperature": route["temperature"],
         "messages": [{"role": "user", "content": prompt}]
     }
-    response = requests.post(url, headers=headers, json=data)
-    result = response.json()
+    if prefix:
+        data["system"] = [{"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}]
+    started = time.perf_counter()
+    result, failure = {}, None
+    try:
+        response = requests.post(url, headers=headers, json=data, timeout=REQUEST_TIMEOUT)
+        result = response.json()
+    except (requests.exceptions.RequestException, ValueError) as e:
+        failure = e
+    record_usage(result.get("usage") or {})
+    log_route({
+        "at": datetime.now().isoformat(timespec="seconds"),
+        "mode": mode,
+        **route,
+        "input_tokens_est": input_tokens,
+        "latency_ms": round((time.perf_counter() - started) * 1000),
+        "stop_reason": result.get("stop_reason"),
+        "usage": last_usage(),
+        "error": str(failure) if failure else (result.get("error") or {}).get("message"),
+    })
+    if failure:
+        raise failure
     
     if 'error' in result:
         return f"Error: {result['error'].get('message', 'Unknown error')}"
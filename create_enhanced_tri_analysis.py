@@ -7,6 +7,8 @@ import re
 from datetime import datetime
 from collections import Counter
 
+from tri_categorizer import categorize
+
 def extract_actual_custom_field_values():
     """
     Extract actual values from the confirmed custom fields using targeted approaches.
@@ -253,36 +255,7 @@ def derive_impact_from_summary(summary):
 
 def categorize_by_business_area(summary):
     """Categorize by business functional area."""
-    if not summary:
-        return 'Unknown'
-    
-    summary_lower = summary.lower()
-    
-    # Payment/Billing
-    if any(word in summary_lower for word in ['payment', 'billing', 'invoice', 'bill', 'charge', 'autopay', 'heartland', 'paya']):
-        return 'Payment/Billing'
-    
-    # Meter Management
-    if any(word in summary_lower for word in ['meter', 'reading', 'consumption', 'usage', 'read']):
-        return 'Meter Management'
-    
-    # Customer Portal
-    if any(word in summary_lower for word in ['portal', 'login', 'password', 'account', 'customer']):
-        return 'Customer Portal'
-    
-    # Data/Import/Export
-    if any(word in summary_lower for word in ['import', 'export', 'data', 'file', 'extraction']):
-        return 'Data Management'
-    
-    # System/Technical
-    if any(word in summary_lower for word in ['system', 'database', 'server', 'technical', 'configuration']):
-        return 'System/Technical'
-    
-    # Reports
-    if any(word in summary_lower for word in ['report', 'reports', 'reporting']):
-        return 'Reporting'
-    
-    return 'Other'
+    return categorize('business_area', summary)
 
 def categorize_by_issue_type(summary):
     """Categorize by type of request."""
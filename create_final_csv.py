@@ -4,9 +4,15 @@ Final TriQ CSV Export - All 631 tickets with accurate parsing
 """
 
 import subprocess
-import csv
 import re
 
+import pandas as pd
+
+from tri_categorizer import categorize, categorize_many
+from triq_scoring import score_final
+
+CID_PATTERN = re.compile(r'CID[:\s-]*(\d+)', re.IGNORECASE)
+
 def get_urgency_mapping():
     """Get urgency mapping for all tickets"""
     urgency_map = {}
@@ -33,33 +39,12 @@ def get_urgency_mapping():
 
 def extract_cid(summary):
     """Extract CID from summary"""
-    cid_match = re.search(r'CID[:\s-]*(\d+)', summary, re.IGNORECASE)
+    cid_match = CID_PATTERN.search(summary)
     return cid_match.group(1) if cid_match else ''
 
 def categorize_issue(summary):
     """Categorize issue type"""
-    summary_lower = summary.lower()
-    
-    if any(word in summary_lower for word in ['autopay', 'auto pay', 'automatic payment']):
-        return 'Autopay System'
-    elif any(word in summary_lower for word in ['payment', 'e-check', 'echeck', 'pay']):
-        return 'Payment Processing'
-    elif any(word in summary_lower for word in ['bill', 'billing', 'invoice', 'charge', 'statement']):
-        return 'Billing System'
-    elif any(word in summary_lower for word in ['integration', 'sync', 'fortress', 'watersmart', 'import', 'export']):
-        return 'Integration'
-    elif any(word in summary_lower for word in ['portal', 'login', 'password', 'user access']):
-        return 'Customer Portal'
-    elif any(word in summary_lower for word in ['meter', 'reading', 'consumption']):
-        return 'Meter Management'
-    elif any(word in summary_lower for word in ['enhance', 'functionality', 'feature', 'improve']):
-        return 'Enhancement'
-    elif any(word in summary_lower for word in ['data', 'file format', 'export', 'import']):
-        return 'Data Management'
-    elif any(word in summary_lower for word in ['global', 'system', 'performance', 'slowness']):
-        return 'System Performance'
-    else:
-        return 'Other'
+    return categorize('triq_final', summary)
 
 def calculate_triq_score(summary, assignee, status, urgency):
     """Calculate estimated TriQ score"""
@@ -161,99 +146,88 @@ def main():
         
         lines = result.stdout.strip().split('\n')
         
-        # Create CSV
-        with open('/Users/munin8/_myprojects/tri-all-tickets-final.csv', 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'Ticket_Key', 'Summary', 'Status', 'Assignee', 'Urgency', 'Priority', 
-                'JIRA_URL', 'TriQ_Score', 'Quality_Issues', 'Client_CID', 
-                'Issue_Category', 'Action_Required'
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            processed = 0
-            for line in lines:
-                if '[System] Service request' in line and 'TRI-' in line:
-                    try:
-                        # Parse the line more carefully
-                        parts = line.strip().split()
-                        
-                        # Find TRI- ticket key
-                        ticket_key = None
-                        for part in parts:
-                            if 'TRI-' in part:
-                                ticket_key = part
-                                break
-                        
-                        if not ticket_key:
-                            continue
-                        
-                        # Extract assignee (next significant part after ticket key)
-                        ticket_idx = parts.index(ticket_key)
-                        assignee = ''
-                        if ticket_idx + 1 < len(parts) and '@' in parts[ticket_idx + 1]:
-                            assignee = parts[ticket_idx + 1].replace('…', '@munibilling.com')
-                        
-                        # Find status (look for known status values)
-                        status = 'Unknown'
-                        status_keywords = ['Resolved', 'Closed', 'Progress', 'Pending', 'Canceled', 'support', 'customer']
-                        for part in parts:
-                            if any(keyword in part for keyword in status_keywords):
-                                if 'Progress' in part:
-                                    status = 'In Progress'
-                                elif 'support' in part:
-                                    status = 'Waiting for support'
-                                elif 'customer' in part:
-                                    status = 'Waiting for customer'
-                                else:
-                                    status = part
-                                break
-                        
-                        # Extract summary (everything after the last status/assignee info)
-                        summary_parts = []
-                        collecting_summary = False
-                        for part in parts:
-                            if collecting_summary:
-                                summary_parts.append(part)
-                            elif part in ['Resolved', 'Closed', 'Pending', 'Canceled'] or 'Progress' in part or 'support' in part or 'customer' in part:
-                                collecting_summary = True
-                        
-                        summary = ' '.join(summary_parts).replace('…', '...').strip()
-                        if not summary:
-                            summary = f"Issue {ticket_key}"
-                        
-                        # Get data
-                        urgency = urgency_map.get(ticket_key, 'Unknown')
-                        cid = extract_cid(summary)
-                        issue_category = categorize_issue(summary)
-                        triq_score = calculate_triq_score(summary, assignee, status, urgency)
-                        quality_issues = assess_quality_issues(summary, assignee, status, urgency)
-                        action_required = determine_action_required(triq_score, status, assignee, urgency, quality_issues)
-                        
-                        writer.writerow({
-                            'Ticket_Key': ticket_key,
-                            'Summary': summary,
-                            'Status': status,
-                            'Assignee': assignee,
-                            'Urgency': urgency,
-                            'Priority': 'Normal',
-                            'JIRA_URL': f'https://jiramb.atlassian.net/browse/{ticket_key}',
-                            'TriQ_Score': triq_score,
-                            'Quality_Issues': quality_issues,
-                            'Client_CID': cid,
-                            'Issue_Category': issue_category,
-                            'Action_Required': action_required
-                        })
-                        
-                        processed += 1
-                        if processed % 50 == 0:
-                            print(f"Processed {processed} tickets...")
+        # Parse the acli table into one row per ticket
+        rows = []
+        for line in lines:
+            if '[System] Service request' in line and 'TRI-' in line:
+                try:
+                    # Parse the line more carefully
+                    parts = line.strip().split()
+                    
+                    # Find TRI- ticket key
+                    ticket_key = None
+                    for part in parts:
+                        if 'TRI-' in part:
+                            ticket_key = part
+                            break
                     
-                    except Exception as e:
-                        print(f"Error processing line: {str(e)}")
+                    if not ticket_key:
                         continue
-            
-            print(f"Successfully exported {processed} tickets to CSV")
+                    
+                    # Extract assignee (next significant part after ticket key)
+                    ticket_idx = parts.index(ticket_key)
+                    assignee = ''
+                    if ticket_idx + 1 < len(parts) and '@' in parts[ticket_idx + 1]:
+                        assignee = parts[ticket_idx + 1].replace('…', '@munibilling.com')
+                    
+                    # Find status (look for known status values)
+                    status = 'Unknown'
+                    status_keywords = ['Resolved', 'Closed', 'Progress', 'Pending', 'Canceled', 'support', 'customer']
+                    for part in parts:
+                        if any(keyword in part for keyword in status_keywords):
+                            if 'Progress' in part:
+                                status = 'In Progress'
+                            elif 'support' in part:
+                                status = 'Waiting for support'
+                            elif 'customer' in part:
+                                status = 'Waiting for customer'
+                            else:
+                                status = part
+                            break
+                    
+                    # Extract summary (everything after the last status/assignee info)
+                    summary_parts = []
+                    collecting_summary = False
+                    for part in parts:
+                        if collecting_summary:
+                            summary_parts.append(part)
+                        elif part in ['Resolved', 'Closed', 'Pending', 'Canceled'] or 'Progress' in part or 'support' in part or 'customer' in part:
+                            collecting_summary = True
+                    
+                    summary = ' '.join(summary_parts).replace('…', '...').strip()
+                    if not summary:
+                        summary = f"Issue {ticket_key}"
+                    
+                    rows.append((ticket_key, summary, status, assignee, urgency_map.get(ticket_key, 'Unknown')))
+                    
+                except Exception as e:
+                    print(f"Error processing line: {str(e)}")
+                    continue
+        
+        # Score every ticket in one pass
+        df = pd.DataFrame(rows, columns=['Ticket_Key', 'Summary', 'Status', 'Assignee', 'Urgency'])
+        scored = score_final(df)
+        
+        export = pd.DataFrame({
+            'Ticket_Key': df['Ticket_Key'],
+            'Summary': df['Summary'],
+            'Status': df['Status'],
+            'Assignee': df['Assignee'],
+            'Urgency': df['Urgency'],
+            'Priority': 'Normal',
+            'JIRA_URL': 'https://jiramb.atlassian.net/browse/' + df['Ticket_Key'],
+            'TriQ_Score': scored['TriQ_Score'],
+            'Quality_Issues': scored['Quality_Issues'],
+            'Client_CID': df['Summary'].str.extract(CID_PATTERN, expand=False).fillna(''),
+            'Issue_Category': categorize_many('triq_final', df['Summary']),
+            'Action_Required': scored['Action_Required']
+        })
+        
+        # Create CSV
+        export.to_csv('/Users/munin8/_myprojects/tri-all-tickets-final.csv', index=False, encoding='utf-8',
+                      lineterminator='\r\n')
+        processed = len(export)
+        print(f"Successfully exported {processed} tickets to CSV")
             
         # Create summary statistics
         print("Creating summary statistics...")
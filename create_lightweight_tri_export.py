@@ -6,6 +6,8 @@ import json
 import re
 from datetime import datetime
 
+from tri_categorizer import categorize
+
 def create_basic_tri_export():
     """
     Create a basic export of TRI tickets with known custom fields.
@@ -155,32 +157,7 @@ def extract_cid_from_summary(summary):
 
 def categorize_from_summary(summary):
     """Categorize tickets based on summary content."""
-    if not summary:
-        return 'Unknown'
-    
-    summary_lower = summary.lower()
-    
-    # Billing/Payment related
-    if any(word in summary_lower for word in ['billing', 'payment', 'invoice', 'bill', 'charge']):
-        return 'Billing/Payment'
-    
-    # Meter related
-    if any(word in summary_lower for word in ['meter', 'reading', 'read']):
-        return 'Meter Management'
-    
-    # Customer service
-    if any(word in summary_lower for word in ['customer', 'portal', 'account', 'login']):
-        return 'Customer Service'
-    
-    # System/Technical
-    if any(word in summary_lower for word in ['system', 'error', 'database', 'technical']):
-        return 'System/Technical'
-    
-    # Data management
-    if any(word in summary_lower for word in ['import', 'export', 'data', 'file']):
-        return 'Data Management'
-    
-    return 'Other'
+    return categorize('summary_category', summary)
 
 def categorize_issue_type(summary):
     """Categorize by type of issue."""
@@ -6,6 +6,8 @@ import json
 import re
 from collections import Counter
 
+from tri_categorizer import categorize_many
+
 def create_comprehensive_export_with_cf10449():
     """
     Create a comprehensive export of TRI tickets attempting to extract cf[10449] values.
@@ -50,71 +52,13 @@ def analyze_summaries_for_component_patterns(csv_data):
     
     print(f"\n=== ANALYZING SUMMARIES FOR COMPONENT PATTERNS ===")
     
-    # Enhanced component categorization based on our analysis
-    component_patterns = {
-        'Billing System': [
-            'billing', 'bill', 'invoice', 'charge', 'fee', 'rate', 'tier', 'surcharge',
-            'late charge', 'penalty', 'assessment', 'tax'
-        ],
-        'Payment Processing': [
-            'payment', 'e-check', 'credit card', 'autopay', 'auto pay', 'transaction',
-            'deposit', 'refund', 'void', 'reconcile'
-        ],
-        'Customer Portal': [
-            'portal', 'customer portal', 'login', 'password', 'online', 'website',
-            'mobile', 'app', 'self-service'
-        ],
-        'Account Management': [
-            'account', 'customer', 'contact', 'user', 'admin', 'permission', 'access',
-            'profile', 'authentication'
-        ],
-        'Meter Reading': [
-            'meter', 'reading', 'consumption', 'usage', 'register', 'endpoint',
-            'ami', 'manual read'
-        ],
-        'Data Management': [
-            'data', 'export', 'import', 'file', 'format', 'transfer', 'sync',
-            'backup', 'migration'
-        ],
-        'System Administration': [
-            'system', 'global', 'configuration', 'setup', 'admin', 'maintenance',
-            'performance', 'server'
-        ],
-        'Integration': [
-            'integration', 'api', 'interface', 'connector', 'sync', 'watersmart',
-            'fortress', 'third party'
-        ],
-        'Reports': [
-            'report', 'statement', 'notice', 'pdf', 'print', 'generate',
-            'document', 'correspondence'
-        ],
-        'Communication': [
-            'email', 'notification', 'reminder', 'alert', 'message', 'communication',
-            'notice', 'mail'
-        ]
-    }
+    # Component keyword patterns live in tri_category_rules.json (cf10449_component)
+    summaries = [ticket.get('Summary', '') for ticket in csv_data]
+    components = categorize_many('cf10449_component', summaries)
     
-    # Categorize each ticket
+    # Add component assignment to ticket data
     categorized_tickets = []
-    
-    for ticket in csv_data:
-        summary = ticket.get('Summary', '').lower()
-        key = ticket.get('Key', '')
-        
-        # Score each component category
-        category_scores = {}
-        for component, keywords in component_patterns.items():
-            score = sum(1 for keyword in keywords if keyword in summary)
-            if score > 0:
-                category_scores[component] = score
-        
-        # Assign to highest scoring category
-        if category_scores:
-            best_component = max(category_scores.items(), key=lambda x: x[1])[0]
-        else:
-            best_component = 'Uncategorized'
-        
-        # Add component assignment to ticket data
+    for ticket, best_component in zip(csv_data, components):
         ticket_with_component = ticket.copy()
         ticket_with_component['Inferred_Component'] = best_component
         categorized_tickets.append(ticket_with_component)
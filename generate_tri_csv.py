@@ -5,43 +5,25 @@ Processes all 631 TRI tickets and generates comprehensive CSV with TriQ scores
 """
 
 import subprocess
-import csv
 import re
 import json
 from datetime import datetime
 
+import pandas as pd
+
+from tri_categorizer import categorize, categorize_many
+from triq_scoring import score_comprehensive
+
+CID_PATTERN = re.compile(r'CID[:\s-]*(\d+)', re.IGNORECASE)
+
 def extract_cid(summary):
     """Extract CID from ticket summary"""
-    cid_match = re.search(r'CID[:\s-]*(\d+)', summary, re.IGNORECASE)
+    cid_match = CID_PATTERN.search(summary)
     return cid_match.group(1) if cid_match else 'N/A'
 
 def categorize_issue(summary, description=""):
     """Categorize the issue type based on summary and description"""
-    summary_lower = summary.lower()
-    desc_lower = description.lower()
-    text = f"{summary_lower} {desc_lower}"
-    
-    if any(word in text for word in ['payment', 'autopay', 'e-check', 'billing', 'bill', 'charge', 'invoice']):
-        if any(word in text for word in ['autopay', 'auto pay', 'automatic']):
-            return 'Autopay System'
-        elif any(word in text for word in ['payment', 'e-check', 'check']):
-            return 'Payment Processing'
-        else:
-            return 'Billing System'
-    elif any(word in text for word in ['integration', 'sync', 'fortress', 'watersmart', 'import', 'export']):
-        return 'Integration'
-    elif any(word in text for word in ['portal', 'login', 'password', 'user', 'customer portal']):
-        return 'Customer Portal'
-    elif any(word in text for word in ['meter', 'reading', 'consumption']):
-        return 'Meter Management'
-    elif any(word in text for word in ['enhancement', 'improve', 'functionality', 'feature']):
-        return 'Enhancement'
-    elif any(word in text for word in ['data', 'export', 'import', 'file', 'format']):
-        return 'Data Management'
-    elif any(word in text for word in ['global', 'system', 'performance', 'slowness']):
-        return 'System Performance'
-    else:
-        return 'Other'
+    return categorize('triq_comprehensive', f"{summary} {description}")
 
 def calculate_triq_score(summary, has_description, status, assignee):
     """Calculate TriQ score based on available information"""
@@ -154,70 +136,55 @@ def generate_csv():
         
         lines = result.stdout.strip().split('\n')
         
+        # Parse the acli table into one row per ticket
+        rows = []
+        for line in lines[2:]:  # Skip header lines
+            if line.strip() and 'TRI-' in line:
+                try:
+                    parts = line.split()
+                    if len(parts) >= 6:
+                        ticket_key = parts[3]
+                        assignee = parts[4] if parts[4] != '…' else 'UNASSIGNED'
+                        if assignee.endswith('…'):
+                            assignee = assignee[:-1] + '@munibilling.com'
+                        status = parts[6]
+                        
+                        # Get summary (everything after status)
+                        summary_start = line.find(status) + len(status)
+                        summary = line[summary_start:].strip()
+                        if summary.endswith('…'):
+                            summary = summary[:-1] + '...'
+                        
+                        rows.append((ticket_key, summary, status, assignee, urgency_map.get(ticket_key, 'Unknown')))
+                
+                except Exception as e:
+                    print(f"Error processing line: {line[:50]}... Error: {e}")
+                    continue
+        
+        # Score every ticket in one pass; has_description is estimated from the summary
+        df = pd.DataFrame(rows, columns=['Ticket_Key', 'Summary', 'Status', 'Assignee', 'Urgency'])
+        scored = score_comprehensive(df)
+        
+        export = pd.DataFrame({
+            'Ticket_Key': df['Ticket_Key'],
+            'Summary': df['Summary'],
+            'Status': df['Status'],
+            'Assignee': df['Assignee'].where(df['Assignee'] != 'UNASSIGNED', ''),
+            'Urgency': df['Urgency'],
+            'Priority': 'Normal',  # All tickets show Normal priority
+            'JIRA_URL': 'https://jiramb.atlassian.net/browse/' + df['Ticket_Key'],
+            'TriQ_Score': scored['TriQ_Score'],
+            'Quality_Issues': scored['Quality_Issues'],
+            'Client_CID': df['Summary'].str.extract(CID_PATTERN, expand=False).fillna('N/A'),
+            'Issue_Category': categorize_many('triq_comprehensive', df['Summary'] + ' '),
+            'Action_Required': scored['Action_Required'],
+            'Created_Date': '2024-2025'  # Approximate range
+        })
+        
         # Create CSV
-        with open('/Users/munin8/_myprojects/tri-all-tickets-comprehensive.csv', 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = [
-                'Ticket_Key', 'Summary', 'Status', 'Assignee', 'Urgency', 'Priority', 
-                'JIRA_URL', 'TriQ_Score', 'Quality_Issues', 'Client_CID', 
-                'Issue_Category', 'Action_Required', 'Created_Date'
-            ]
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            processed = 0
-            for line in lines[2:]:  # Skip header lines
-                if line.strip() and 'TRI-' in line:
-                    try:
-                        parts = line.split()
-                        if len(parts) >= 6:
-                            ticket_key = parts[3]
-                            assignee = parts[4] if parts[4] != '…' else 'UNASSIGNED'
-                            if assignee.endswith('…'):
-                                assignee = assignee[:-1] + '@munibilling.com'
-                            status = parts[6]
-                            
-                            # Get summary (everything after status)
-                            summary_start = line.find(status) + len(status)
-                            summary = line[summary_start:].strip()
-                            if summary.endswith('…'):
-                                summary = summary[:-1] + '...'
-                            
-                            urgency = urgency_map.get(ticket_key, 'Unknown')
-                            cid = extract_cid(summary)
-                            issue_category = categorize_issue(summary)
-                            
-                            # Estimate if ticket has description (based on summary quality)
-                            has_description = len(summary) > 50 or 'detailed' in summary.lower()
-                            
-                            triq_score = calculate_triq_score(summary, has_description, status, assignee)
-                            quality_issues = assess_quality_issues(summary, has_description, status, assignee, urgency)
-                            action_required = determine_action_required(triq_score, status, assignee, urgency, quality_issues)
-                            
-                            writer.writerow({
-                                'Ticket_Key': ticket_key,
-                                'Summary': summary,
-                                'Status': status,
-                                'Assignee': assignee if assignee != 'UNASSIGNED' else '',
-                                'Urgency': urgency,
-                                'Priority': 'Normal',  # All tickets show Normal priority
-                                'JIRA_URL': f'https://jiramb.atlassian.net/browse/{ticket_key}',
-                                'TriQ_Score': triq_score,
-                                'Quality_Issues': quality_issues,
-                                'Client_CID': cid,
-                                'Issue_Category': issue_category,
-                                'Action_Required': action_required,
-                                'Created_Date': '2024-2025'  # Approximate range
-                            })
-                            
-                            processed += 1
-                            if processed % 50 == 0:
-                                print(f"Processed {processed} tickets...")
-                    
-                    except Exception as e:
-                        print(f"Error processing line: {line[:50]}... Error: {e}")
-                        continue
-            
-            print(f"Successfully exported {processed} tickets to CSV")
+        export.to_csv('/Users/munin8/_myprojects/tri-all-tickets-comprehensive.csv', index=False, encoding='utf-8',
+                      lineterminator='\r\n')
+        print(f"Successfully exported {len(export)} tickets to CSV")
     
     except Exception as e:
         print(f"Error generating CSV: {e}")
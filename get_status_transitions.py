@@ -1,140 +1,364 @@
 #!/usr/bin/env python3
-import subprocess
+"""
+Status Transition Analysis
+
+Harvests the real status changelog of many Jira issues concurrently
+(paging through long changelogs), stores every status change in an
+indexed SQLite table, and computes time spent in each status for all
+issues in one vectorized pass.
+
+Usage:
+    python3 get_status_transitions.py                         # SAAS-1354 and linked tickets
+    python3 get_status_transitions.py SAAS-1354 TRI-1998
+    python3 get_status_transitions.py --jql "project = SAAS AND created >= -90d" --workers 16
+    python3 get_status_transitions.py --offline               # report from transitions.db only
+
+Required environment variables (in .env file):
+    JIRA_BASE_URL, JIRA_EMAIL, JIRA_API_TOKEN
+"""
+
+import argparse
 import json
+import os
+import sqlite3
 import sys
-from datetime import datetime
-
-def parse_jira_date(date_str):
-    if not date_str:
-        return None
-    # Parse JIRA date format: 2025-05-22T12:03:13.891-0400
-    try:
-        # Remove timezone info for parsing
-        clean_date = date_str.split('T')[0] + 'T' + date_str.split('T')[1].split('-')[0].split('+')[0]
-        return datetime.fromisoformat(clean_date.replace('Z', ''))
-    except:
-        return date_str
-
-def get_ticket_details(ticket_key):
-    """Get all available details for a ticket"""
-    try:
-        cmd = f'acli jira workitem view {ticket_key} --fields "*all" --json'
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        if result.returncode == 0:
-            data = json.loads(result.stdout)
-            fields = data.get("fields", {})
-            
-            # Extract status information
-            status_info = {
-                "key": ticket_key,
-                "created": fields.get("created"),
-                "updated": fields.get("updated"), 
-                "current_status": fields.get("status", {}).get("name"),
-                "status_category": fields.get("status", {}).get("statusCategory", {}).get("name"),
-                "status_category_change_date": fields.get("statuscategorychangedate"),
-                "assignee": fields.get("assignee", {}).get("emailAddress") if fields.get("assignee") else None,
-                "priority": fields.get("priority", {}).get("name"),
-                "issuetype": fields.get("issuetype", {}).get("name"),
-                "summary": fields.get("summary"),
-                "resolution": fields.get("resolution", {}).get("name") if fields.get("resolution") else None,
-                "resolutiondate": fields.get("resolutiondate")
-            }
-            
-            # Look for any workflow transition indicators in custom fields
-            for field_name, field_value in fields.items():
-                if 'transition' in field_name.lower() or 'workflow' in field_name.lower():
-                    status_info[field_name] = field_value
-            
-            return status_info
-        else:
-            print(f"Error fetching {ticket_key}: {result.stderr}", file=sys.stderr)
-            return None
-    except Exception as e:
-        print(f"Exception for {ticket_key}: {e}", file=sys.stderr)
-        return None
-
-def calculate_phase_duration(created_date, status_change_date, current_date=None):
-    """Calculate duration between dates"""
-    if not created_date or not status_change_date:
-        return None
-    
-    try:
-        start = parse_jira_date(created_date)
-        end = parse_jira_date(status_change_date)
-        if current_date:
-            end = parse_jira_date(current_date)
-        
-        if start and end:
-            duration = end - start
-            return duration.days
-    except:
-        pass
-    return None
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pandas as pd
+import requests
+from dotenv import load_dotenv
+
+from jira_dates import parse_jira_dates
+
+load_dotenv()
+
+JIRA_BASE_URL = os.environ.get("JIRA_BASE_URL")
+JIRA_EMAIL = os.environ.get("JIRA_EMAIL")
+JIRA_API_TOKEN = os.environ.get("JIRA_API_TOKEN")
+
+DB_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "transitions.db")
+WORKERS = 8             # changelogs fetched concurrently
+PAGE_SIZE = 100         # changelog entries / issues per request
+KEYS_PER_SEARCH = 100   # issue keys per `key IN (...)` search
+REQUEST_TIMEOUT = 30    # seconds per HTTP request
+MAX_RETRIES = 3         # retries for 429 and 5xx responses
+ISSUE_FIELDS = ["created", "updated", "status", "statuscategorychangedate", "assignee",
+                "priority", "issuetype", "summary", "resolution", "resolutiondate"]
 
 # All tickets from SAAS-1354 analysis
-tickets = [
+DEFAULT_TICKETS = [
     "SAAS-1354",  # Main ticket
     "TRI-1998", "TRI-1573", "SAAS-2165", "SAAS-2128", "SAAS-1952",
     "SAAS-1951", "SAAS-1858", "SAAS-1820", "SAAS-1784", "SAAS-1779",
     "SAAS-1768", "SAAS-1751", "SAAS-1725", "SAAS-1706", "SAAS-1705", "SAAS-559"
 ]
 
-print("# Status Transition Analysis for SAAS-1354 and Linked Tickets")
-print()
-
-all_results = []
-
-for ticket in tickets:
-    print(f"Analyzing {ticket}...", file=sys.stderr)
-    details = get_ticket_details(ticket)
-    if details:
-        all_results.append(details)
-
-# Sort by created date
-all_results.sort(key=lambda x: x.get("created", ""))
-
-# Group by status for analysis
-status_groups = {
-    "To Do": [],
-    "In Progress": [], 
-    "QA In Progress": [],
-    "Ready For QA": [],
-    "Ready for Acceptance": [],
-    "Done": [],
-    "Resolved": [],
-    "Canceled": []
-}
-
-print("## Current Status Distribution")
-print()
-
-for result in all_results:
-    status = result.get("current_status", "Unknown")
-    if status in status_groups:
-        status_groups[status].append(result)
-    else:
-        print(f"Unknown status: {status} for {result['key']}")
-
-for status, tickets in status_groups.items():
-    if tickets:
-        print(f"### {status} ({len(tickets)} tickets)")
-        for ticket in tickets:
-            created = ticket.get("created", "")[:10]  # Just date part
-            status_change = ticket.get("status_category_change_date", "")[:10] if ticket.get("status_category_change_date") else "N/A"
-            print(f"- **{ticket['key']}**: {ticket.get('summary', '')[:60]}...")
-            print(f"  - Created: {created}")
+STATUS_ORDER = ["To Do", "In Progress", "QA In Progress", "Ready For QA",
+                "Ready for Acceptance", "Done", "Resolved", "Canceled"]
+
+SCHEMA = [
+    """
+    CREATE TABLE IF NOT EXISTS issues (
+        issue_key TEXT PRIMARY KEY,
+        created TEXT NOT NULL,
+        updated TEXT,
+        current_status TEXT,
+        status_category TEXT,
+        status_category_change_date TEXT,
+        assignee TEXT,
+        priority TEXT,
+        issuetype TEXT,
+        summary TEXT,
+        resolution TEXT,
+        resolutiondate TEXT,
+        harvested_at TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS status_events (
+        issue_key TEXT NOT NULL,
+        changelog_id TEXT NOT NULL,
+        changed_at TEXT NOT NULL,
+        from_status TEXT,
+        to_status TEXT,
+        author TEXT,
+        PRIMARY KEY (issue_key, changelog_id)
+    ) WITHOUT ROWID
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_status_events_key_time ON status_events(issue_key, changed_at)",
+    "CREATE INDEX IF NOT EXISTS idx_status_events_to_status ON status_events(to_status, changed_at)",
+]
+
+# ============================================================================
+# JIRA ACCESS
+# ============================================================================
+
+_local = threading.local()
+
+
+def session():
+    """One requests session per thread, reusing its connections"""
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+        _local.session.auth = (JIRA_EMAIL, JIRA_API_TOKEN)
+        _local.session.headers.update({"Accept": "application/json"})
+    return _local.session
+
+
+def jira_get(path, params=None):
+    """GET a Jira REST resource, retrying rate limits and server errors"""
+    for attempt in range(MAX_RETRIES + 1):
+        response = session().get(f"{JIRA_BASE_URL}{path}", params=params, timeout=REQUEST_TIMEOUT)
+        if response.status_code != 429 and response.status_code < 500 or attempt == MAX_RETRIES:
+            response.raise_for_status()
+            return response.json()
+        retry_after = response.headers.get("Retry-After", "")
+        time.sleep(float(retry_after) if retry_after.isdigit() else 2 ** attempt)
+
+
+def search_keys(jql):
+    """All issue keys matching jql"""
+    keys, start_at = [], 0
+    while True:
+        data = jira_get("/rest/api/3/search", {"jql": jql, "fields": "key",
+                                               "startAt": start_at, "maxResults": PAGE_SIZE})
+        issues = data.get("issues", [])
+        keys += [issue["key"] for issue in issues]
+        start_at += len(issues)
+        if not issues or start_at >= data.get("total", 0):
+            return keys
+
+
+def fetch_issue_fields(keys):
+    """Fields for many issues, KEYS_PER_SEARCH at a time instead of one view per ticket"""
+    found = {}
+    for i in range(0, len(keys), KEYS_PER_SEARCH):
+        chunk = keys[i:i + KEYS_PER_SEARCH]
+        start_at = 0
+        while True:
+            data = jira_get("/rest/api/3/search", {
+                "jql": f"key IN ({', '.join(chunk)})", "fields": ",".join(ISSUE_FIELDS),
+                "startAt": start_at, "maxResults": PAGE_SIZE})
+            issues = data.get("issues", [])
+            for issue in issues:
+                found[issue["key"]] = issue_row(issue)
+            start_at += len(issues)
+            if not issues or start_at >= data.get("total", 0):
+                break
+    return found
+
+
+def issue_row(issue):
+    fields = issue.get("fields", {})
+    status = fields.get("status") or {}
+    return {
+        "key": issue["key"],
+        "created": fields.get("created"),
+        "updated": fields.get("updated"),
+        "current_status": status.get("name"),
+        "status_category": (status.get("statusCategory") or {}).get("name"),
+        "status_category_change_date": fields.get("statuscategorychangedate"),
+        "assignee": (fields.get("assignee") or {}).get("emailAddress"),
+        "priority": (fields.get("priority") or {}).get("name"),
+        "issuetype": (fields.get("issuetype") or {}).get("name"),
+        "summary": fields.get("summary"),
+        "resolution": (fields.get("resolution") or {}).get("name"),
+        "resolutiondate": fields.get("resolutiondate"),
+    }
+
+
+def fetch_status_changes(key):
+    """Every status change in an issue's changelog, oldest first, across all pages"""
+    events, start_at = [], 0
+    while True:
+        data = jira_get(f"/rest/api/3/issue/{key}/changelog",
+                        {"startAt": start_at, "maxResults": PAGE_SIZE})
+        histories = data.get("values", [])
+        for history in histories:
+            for item in history.get("items", []):
+                if item.get("field") == "status":
+                    events.append((key, history["id"], history["created"], item.get("fromString"),
+                                   item.get("toString"), (history.get("author") or {}).get("displayName")))
+        start_at += len(histories)
+        if not histories or data.get("isLast", True) and start_at >= data.get("total", start_at):
+            return sorted(events, key=lambda event: event[2])
+
+
+def harvest(keys, workers=WORKERS):
+    """
+    Issue fields plus status changes for every key, changelogs fetched
+    concurrently. Returns (issues by key, events, failed keys).
+    """
+    issues = fetch_issue_fields(keys)
+    missing = [key for key in keys if key not in issues]
+
+    events, failed = [], list(missing)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {key: pool.submit(fetch_status_changes, key) for key in issues}
+        for key, future in futures.items():
+            try:
+                events += future.result()
+            except (requests.exceptions.RequestException, ValueError) as e:
+                print(f"Error fetching changelog for {key}: {e}", file=sys.stderr)
+                failed.append(key)
+    for key in failed:
+        issues.pop(key, None)
+    return issues, events, failed
+
+# ============================================================================
+# STORAGE
+# ============================================================================
+
+
+def open_db(path=DB_FILE):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    for statement in SCHEMA:
+        conn.execute(statement)
+    return conn
+
+
+def store(conn, issues, events):
+    """Replace the stored issues and their status events in one transaction"""
+    harvested_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+    keys = json.dumps(list(issues))
+    with conn:
+        conn.execute("DELETE FROM status_events WHERE issue_key IN (SELECT value FROM json_each(?))", (keys,))
+        conn.executemany(
+            "INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(i["key"], i["created"], i["updated"], i["current_status"], i["status_category"],
+              i["status_category_change_date"], i["assignee"], i["priority"], i["issuetype"],
+              i["summary"], i["resolution"], i["resolutiondate"], harvested_at)
+             for i in issues.values()])
+        conn.executemany("INSERT OR REPLACE INTO status_events VALUES (?, ?, ?, ?, ?, ?)", events)
+
+
+def load(conn, keys=None):
+    """Issues and status events as DataFrames, optionally limited to keys"""
+    where, params = "", ()
+    if keys:
+        where, params = "WHERE issue_key IN (SELECT value FROM json_each(?))", (json.dumps(keys),)
+    issues = pd.read_sql_query(f"SELECT * FROM issues {where}", conn, params=params)
+    events = pd.read_sql_query(
+        f"SELECT issue_key, changed_at, from_status, to_status FROM status_events {where} "
+        f"ORDER BY issue_key, changed_at", conn, params=params)
+    return issues, events
+
+# ============================================================================
+# PHASE DURATIONS
+# ============================================================================
+
+
+def phase_durations(issues, events, now=None):
+    """
+    Days each issue spent in each status, for all issues at once
+
+    Each issue's timeline starts at creation in the first change's
+    from_status (or its current status if it never changed) and ends now.
+    Returns one row per (issue_key, status) with days and entries.
+    """
+    now = pd.Timestamp(now or datetime.now(timezone.utc))
+    first = events.drop_duplicates("issue_key")[["issue_key", "from_status"]]
+    starts = issues[["issue_key", "created", "current_status"]].merge(first, on="issue_key", how="left")
+    starts = pd.DataFrame({
+        "issue_key": starts["issue_key"],
+        "changed_at": starts["created"],
+        "to_status": starts["from_status"].fillna(starts["current_status"]),
+    })
+
+    timeline = pd.concat([starts, events[["issue_key", "changed_at", "to_status"]]], ignore_index=True)
+    timeline["at"] = parse_jira_dates(timeline["changed_at"])
+    timeline = timeline.sort_values(["issue_key", "at"], kind="stable")
+    end = timeline.groupby("issue_key")["at"].shift(-1).fillna(now)
+    timeline["days"] = (end - timeline["at"]).dt.total_seconds() / 86400
+
+    return (timeline.groupby(["issue_key", "to_status"], sort=False)["days"]
+            .agg(days="sum", entries="size")
+            .reset_index()
+            .rename(columns={"to_status": "status"}))
+
+# ============================================================================
+# REPORT
+# ============================================================================
+
+
+def print_report(issues, durations, title="SAAS-1354 and Linked Tickets"):
+    print(f"# Status Transition Analysis for {title}")
+    print()
+
+    results = issues.sort_values("created").to_dict("records")
+    print("## Current Status Distribution")
+    print()
+    for result in results:
+        if result["current_status"] not in STATUS_ORDER:
+            print(f"Unknown status: {result['current_status']} for {result['issue_key']}")
+
+    current = durations.merge(issues[["issue_key", "current_status"]], on="issue_key")
+    current = current[current["status"] == current["current_status"]].set_index("issue_key")["days"]
+    for status in STATUS_ORDER:
+        group = [r for r in results if r["current_status"] == status]
+        if not group:
+            continue
+        print(f"### {status} ({len(group)} tickets)")
+        for ticket in group:
+            status_change = (ticket["status_category_change_date"] or "")[:10] or "N/A"
+            print(f"- **{ticket['issue_key']}**: {(ticket['summary'] or '')[:60]}...")
+            print(f"  - Created: {ticket['created'][:10]}")
             print(f"  - Status Changed: {status_change}")
-            print(f"  - Priority: {ticket.get('priority', 'N/A')}")
-            
-            # Calculate time in current status
-            if ticket.get("status_category_change_date"):
-                days_in_status = calculate_phase_duration(
-                    ticket.get("status_category_change_date"),
-                    datetime.now().isoformat()
-                )
-                if days_in_status is not None:
-                    print(f"  - Days in current status: {days_in_status}")
+            print(f"  - Priority: {ticket['priority'] or 'N/A'}")
+            if ticket["issue_key"] in current.index:
+                print(f"  - Days in current status: {int(current[ticket['issue_key']])}")
             print()
 
-print("## Detailed Analysis")
-print(json.dumps(all_results, indent=2))
\ No newline at end of file
+    print("## Time in Each Status (days)")
+    print()
+    table = durations.pivot_table(index="issue_key", columns="status", values="days", aggfunc="sum")
+    columns = [s for s in STATUS_ORDER if s in table.columns] + \
+              sorted(s for s in table.columns if s not in STATUS_ORDER)
+    table = table.reindex(index=[r["issue_key"] for r in results], columns=columns)
+    print("| Ticket | " + " | ".join(columns) + " |")
+    print("|---" * (len(columns) + 1) + "|")
+    for key, row in table.iterrows():
+        cells = ["" if pd.isna(value) else f"{value:.1f}" for value in row]
+        print(f"| {key} | " + " | ".join(cells) + " |")
+    print()
+
+    print("## Detailed Analysis")
+    print(json.dumps(results, indent=2))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze Jira status transitions from issue changelogs")
+    parser.add_argument("tickets", nargs="*", help="Issue keys (default: SAAS-1354 and linked tickets)")
+    parser.add_argument("--jql", help="Analyze every issue matching this JQL")
+    parser.add_argument("--workers", type=int, default=WORKERS, help="Changelogs fetched concurrently")
+    parser.add_argument("--db", default=DB_FILE, help="SQLite file for issues and status events")
+    parser.add_argument("--offline", action="store_true", help="Report from the database without calling Jira")
+    args = parser.parse_args()
+
+    conn = open_db(args.db)
+    keys = args.tickets or (None if args.jql or args.offline else DEFAULT_TICKETS)
+    if not args.offline:
+        if args.jql:
+            keys = search_keys(args.jql)
+        start = time.perf_counter()
+        issues, events, failed = harvest(keys, args.workers)
+        store(conn, issues, events)
+        elapsed = time.perf_counter() - start
+        print(f"Harvested {len(issues)} issue(s), {len(events)} status change(s) in {elapsed:.1f}s"
+              + (f"; failed: {', '.join(failed)}" if failed else ""), file=sys.stderr)
+
+    issues, events = load(conn, keys)
+    conn.close()
+    if issues.empty:
+        print("No issues found", file=sys.stderr)
+        return
+    title = args.jql or (", ".join(args.tickets) if args.tickets else "SAAS-1354 and Linked Tickets")
+    print_report(issues, phase_durations(issues, events), title)
+
+
+if __name__ == "__main__":
+    main()
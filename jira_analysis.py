@@ -13,11 +13,12 @@ import sys
 import csv
 from getpass import getpass
 from datetime import datetime
-from dateutil import parser
 from collections import Counter, defaultdict
 import pandas as pd
 from dotenv import load_dotenv
 
+from jira_dates import parse_jira_date
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -197,15 +198,14 @@ def analyze_issues(issues):
         # Created date
         created = fields.get("created")
         if created:
-            created_date = parser.parse(created)
+            created_date = parse_jira_date(created)
             month_key = created_date.strftime("%Y-%m")
             analysis["created_by_month"][month_key] += 1
         
         # Resolution date and time
         resolution_date = fields.get("resolutiondate")
         if resolution_date and created:
-            resolved_date = parser.parse(resolution_date)
-            created_date = parser.parse(created)
+            resolved_date = parse_jira_date(resolution_date)
             resolution_time = (resolved_date - created_date).days
             analysis["avg_resolution_time"].append(resolution_time)
             
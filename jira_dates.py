@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Jira Date Parsing
+
+Jira REST timestamps always have the same shape,
+2025-05-22T12:03:13.891-0400, so they can be parsed by slicing instead of
+dateutil's format guessing. Both parsers keep the UTC offset: scalars come
+back as aware datetimes, columns as UTC pandas timestamps.
+
+Usage:
+    from jira_dates import parse_jira_date, parse_jira_dates
+
+    created = parse_jira_date(fields['created'])      # aware datetime
+    df['created'] = parse_jira_dates(df['created'])   # datetime64[ns, UTC]
+"""
+
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+import pandas as pd
+
+JIRA_DATE_FORMAT = '%Y-%m-%dT%H:%M:%S.%f%z'
+CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=None)
+def _offset(sign, hours, minutes):
+    """One tzinfo per distinct UTC offset"""
+    delta = timedelta(hours=int(hours), minutes=int(minutes))
+    return timezone(-delta if sign == '-' else delta)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_jira_date(value):
+    """
+    Parse a Jira timestamp into a timezone-aware datetime
+
+    Fast path for YYYY-MM-DDTHH:MM:SS.mmm±HHMM; anything else ISO 8601
+    (Z suffix, date only, no milliseconds) goes through fromisoformat.
+    Raises ValueError for values that are not ISO 8601.
+    """
+    if (len(value) == 28 and value[10] == 'T' and value[19] == '.'
+            and value[23] in '+-' and value[4] == value[7] == '-'):
+        return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                        int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                        int(value[20:23]) * 1000, _offset(value[23], value[24:26], value[26:28]))
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def parse_jira_dates(values):
+    """
+    Parse a column of Jira timestamps into UTC pandas timestamps
+
+    Missing values become NaT. Columns that are not all in Jira's format
+    fall back to pandas' ISO 8601 parser.
+    """
+    try:
+        return pd.to_datetime(values, format=JIRA_DATE_FORMAT, utc=True)
+    except ValueError:
+        return pd.to_datetime(values, format='ISO8601', utc=True)
@@ -1,4 +1,9 @@
+import hashlib
 import os
+import re
+import sqlite3
+from datetime import datetime
+
 import requests
 from dotenv import load_dotenv
 
@@ -8,6 +13,8 @@ load_dotenv(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file_
 JIRA_EMAIL = os.getenv("JIRA_EMAIL")
 JIRA_TOKEN = os.getenv("JIRA_API_TOKEN")
 JIRA_BASE_URL = os.getenv("JIRA_BASE_URL")
+WRITE_LOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'jira_writes.db')
+HASH_MARKER = re.compile(r"\[cj-hash:([0-9a-f]{12})\]")
 
 def get_issue(ticket_id):
     url = f"{JIRA_BASE_URL}/rest/api/3/issue/{ticket_id}"
@@ -97,4 +104,62 @@ def update_field(ticket_id, field_id, value):
     response = requests.put(url, auth=(JIRA_EMAIL, JIRA_TOKEN), json=payload, headers=headers)
     if response.status_code != 204:
         raise Exception(f"HTTP {response.status_code}: {response.text}")
-    return response
\ No newline at end of file
+    return response
+
+def get_comments(ticket_id):
+    """All comments on an issue, following pagination"""
+    url = f"{JIRA_BASE_URL}/rest/api/3/issue/{ticket_id}/comment"
+    comments = []
+    while True:
+        response = requests.get(url, auth=(JIRA_EMAIL, JIRA_TOKEN), headers={"Accept": "application/json"},
+                                params={"startAt": len(comments), "maxResults": 100})
+        if response.status_code != 200:
+            raise Exception(f"HTTP {response.status_code}: {response.text}")
+        data = response.json()
+        page = data.get("comments", [])
+        comments.extend(page)
+        if not page or len(comments) >= data.get("total", 0):
+            return comments
+
+def content_hash(text):
+    """Short hash identifying generated content, ignoring surrounding whitespace"""
+    return hashlib.sha256(text.strip().encode()).hexdigest()[:12]
+
+def with_hash_marker(text, digest):
+    """Content followed by the marker that lets later runs recognise it"""
+    return f"{text}\n[cj-hash:{digest}]"
+
+def hash_markers(text):
+    """Content hashes of everything generated into a field or comment text"""
+    return set(HASH_MARKER.findall(text or ""))
+
+class WriteLog:
+    """
+    Local record of content hashes already written to each issue target
+    (a field id or comment:<mode>), so unchanged re-runs skip Jira entirely
+    """
+
+    def __init__(self, path=WRITE_LOG_FILE):
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS writes (
+                ticket_id TEXT NOT NULL,
+                target TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                written_at TEXT NOT NULL,
+                PRIMARY KEY (ticket_id, target, content_hash)
+            ) WITHOUT ROWID;
+        """)
+
+    def written(self, ticket_id, target, digest):
+        return self.conn.execute(
+            "SELECT 1 FROM writes WHERE ticket_id = ? AND target = ? AND content_hash = ?",
+            (ticket_id, target, digest)).fetchone() is not None
+
+    def record(self, ticket_id, target, digest):
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO writes VALUES (?, ?, ?, ?)",
+                              (ticket_id, target, digest, datetime.now().isoformat(timespec="seconds")))
+
+    def close(self):
+        self.conn.close()
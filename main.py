@@ -1,7 +1,9 @@
 import click
-from jira_helper import get_issue, post_comment, add_label
-from claude_helper import get_claude_response
-from release_notes_helper import generate_release_notes_for_issue
+from jira_helper import WriteLog, add_label, content_hash, get_comments, get_issue, hash_markers, post_comment, with_hash_marker
+from claude_helper import describe_cache_usage, describe_route, get_claude_response, last_route, last_usage
+from prompt_budget import describe_savings, estimate_tokens, fit_description
+from release_notes_helper import (JOURNAL_FILE, WRITE_SKIPPED_MESSAGE, ReleaseNotesJournal,
+                                  generate_release_notes_for_issue, generate_release_notes_headless)
 # from rca_generator import generate_rca, format_rca_as_markdown, save_rca_to_file, format_rca_for_jira
 
 def extract_text_from_content(content):
@@ -36,7 +38,10 @@ def extract_text_from_content(content):
 @click.argument('ticket_id')
 @click.option('--mode', default='summarize', help='Options: summarize, tag, subtasks, test-notes, rca, release-notes')
 @click.option('--post-rca/--no-post-rca', default=None, help='Post RCA to Jira without prompting (RCA mode only)')
-def run(ticket_id, mode, post_rca):
+@click.option('--headless', is_flag=True, help='Release notes without prompts, resumable from the journal (release-notes mode only)')
+@click.option('--journal', default=JOURNAL_FILE, show_default=True, help='Checkpoint journal for --headless')
+@click.option('--fresh', is_flag=True, help='Ignore journaled progress for this ticket (with --headless)')
+def run(ticket_id, mode, post_rca, headless, journal, fresh):
     # Enhanced visual output
     mode_icons = {
         'summarize': '📋',
@@ -63,6 +68,13 @@ def run(ticket_id, mode, post_rca):
     click.echo(f"\n{icon} {mode_name}: {ticket_id.upper()}")
     click.echo("━" * 50)
     
+    # Headless release notes fetch the ticket themselves, and only if the journal has no copy
+    if mode == 'release-notes' and headless:
+        handle_headless_release_notes(ticket_id, journal, fresh)
+        click.echo("━" * 50)
+        click.echo(f"✅ {mode_name} complete!\n")
+        return
+    
     # Step 1: Fetch ticket
     click.echo("🔍 Fetching ticket data...", nl=False)
     try:
@@ -87,20 +99,24 @@ def run(ticket_id, mode, post_rca):
         click.echo(f" ✗\n❌ Error fetching ticket: {e}")
         return
     
-    # Extract description text
+    # Extract description text, trimmed to the mode's token budget
     description_obj = issue['fields'].get('description')
     if description_obj is None:
         description = "No description provided"
     else:
-        description = extract_text_from_content(description_obj)
+        description, budget = fit_description(description_obj, mode)
+        if budget['tokens_saved']:
+            click.echo(describe_savings(budget))
     
     # Step 2: AI Analysis (skip for RCA and release-notes modes - they handle AI internally)
     if mode not in ['rca', 'release-notes']:
         click.echo("🤖 Analyzing with Claude AI...", nl=False)
         try:
-            prompt = generate_prompt(mode, summary, description)
-            response = get_claude_response(prompt)
-            click.echo(" ✓")
+            prefix, prompt = generate_prompt(mode, summary, description)
+            response = get_claude_response(prompt, prefix=prefix, mode=mode)
+            click.echo(f" ✓ (~{estimate_tokens((prefix or '') + prompt):,} prompt tokens)")
+            click.echo(describe_route(last_route()))
+            click.echo(describe_cache_usage(last_usage()))
         except Exception as e:
             click.echo(f" ✗\n❌ Error with AI analysis: {e}")
             return
@@ -118,28 +134,33 @@ def run(ticket_id, mode, post_rca):
     click.echo("━" * 50)
     click.echo(f"✅ {mode_name} complete!\n")
 
-def generate_prompt(mode, summary, description):
-    prompts = {
-        "summarize": f"""Analyze this Jira ticket and provide:
+# Per-mode instructions, sent as the cached prompt prefix; the ticket follows as the suffix
+PROMPT_PREFIXES = {
+    "summarize": """Analyze this Jira ticket and provide:
 1. Brief summary (2-3 sentences)
 2. Key technical challenges
 3. Estimated complexity (Simple/Medium/Complex)
-4. Any risks or dependencies
+4. Any risks or dependencies""",
+    "tag": "Suggest appropriate Jira tags/labels for this issue. Return ONLY a comma-separated list of tags (no explanations, bullet points, or extra text).",
+    "subtasks": "Break down this issue into smaller development subtasks.",
+    "test-notes": "Generate QA test notes and edge cases.",
+}
 
-Title: {summary}
+def generate_prompt(mode, summary, description):
+    """(cached instruction prefix, per-ticket suffix) for a mode"""
+    suffixes = {
+        "summarize": f"""Title: {summary}
 
 Description: {description}""",
-        "tag": f"""Suggest appropriate Jira tags/labels for this issue. Return ONLY a comma-separated list of tags (no explanations, bullet points, or extra text).
-
-Issue: {summary}
+        "tag": f"""Issue: {summary}
 Description: {description}
 
 Tags:""",
-        "subtasks": f"Break down this issue into smaller development subtasks:\n\n{summary}\n\n{description}",
-        "test-notes": f"Generate QA test notes and edge cases:\n\n{summary}\n\n{description}",
+        "subtasks": f"{summary}\n\n{description}",
+        "test-notes": f"{summary}\n\n{description}",
         "rca": "RCA mode uses specialized prompt generation"
     }
-    return prompts.get(mode, "")
+    return PROMPT_PREFIXES.get(mode), suffixes.get(mode, "")
 
 def parse_tags_from_response(response):
     """Parse comma-separated tags from Claude response"""
@@ -226,6 +247,27 @@ def handle_rca_mode(ticket_id, issue, post_rca=None):
     except Exception as e:
         click.echo(f" ✗\n❌ Error generating RCA: {e}")
 
+def post_comment_once(ticket_id, target, text):
+    """
+    Post text as a comment carrying its content hash, unless the write log
+    or an existing comment shows the same content was already posted.
+    Returns whether a comment was posted.
+    """
+    digest = content_hash(text)
+    write_log = WriteLog()
+    try:
+        if write_log.written(ticket_id, target, digest):
+            return False
+        if any(digest in hash_markers(extract_text_from_content(comment.get('body')))
+               for comment in get_comments(ticket_id)):
+            write_log.record(ticket_id, target, digest)
+            return False
+        post_comment(ticket_id, with_hash_marker(text, digest))
+        write_log.record(ticket_id, target, digest)
+        return True
+    finally:
+        write_log.close()
+
 def handle_other_modes(ticket_id, mode, response):
     """Handle summarize, subtasks, and test-notes modes with enhanced output"""
     # Show a preview of the analysis
@@ -235,12 +277,16 @@ def handle_other_modes(ticket_id, mode, response):
     
     click.echo(f"\n💬 Posting to Jira...", nl=False)
     try:
-        post_comment(ticket_id, response)
+        posted = post_comment_once(ticket_id, f"comment:{mode}", response)
         click.echo(" ✓")
     except Exception as e:
         click.echo(f" ✗\n❌ Error posting comment: {e}")
         return
     
+    if not posted:
+        click.echo(WRITE_SKIPPED_MESSAGE)
+        return
+    
     # Add label for summarize mode
     if mode == 'summarize':
         click.echo("🔖 Adding 'ai-reviewed' label...", nl=False)
@@ -257,5 +303,17 @@ def handle_release_notes_mode(ticket_id):
     except Exception as e:
         click.echo(f"❌ Error generating release notes: {e}")
 
+def handle_headless_release_notes(ticket_id, journal_path, fresh=False):
+    """Handle release-notes mode without prompts; exits non-zero if a stage failed"""
+    journal = ReleaseNotesJournal(journal_path)
+    try:
+        if fresh:
+            journal.forget(ticket_id)
+        written = generate_release_notes_headless(ticket_id, journal)
+    finally:
+        journal.close()
+    if written is None:
+        raise SystemExit(1)
+
 if __name__ == '__main__':
     run()
\ No newline at end of file
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Prompt Budgeting
+
+Keeps the ticket description pasted into Claude prompts within a per-mode
+token budget. The description is split into sections (ADF blocks, or
+blank-line separated paragraphs for plain text), and when it is over
+budget the least informative sections go first: repeated sections,
+signature blocks, quoted logs, then stack traces (keeping the exception
+line). Only if that is not enough is the remaining text cut in the middle.
+
+Token counts are estimates (about 4 characters per token); no tokenizer
+is needed.
+
+Usage:
+    from prompt_budget import fit_description, describe_savings
+
+    description, report = fit_description(fields.get('description'), 'summarize')
+    print(describe_savings(report))   # "✂️ Description 41,210 → 2,987 tokens ..."
+"""
+
+import math
+import re
+from collections import Counter
+
+CHARS_PER_TOKEN = 4
+
+# Description tokens allowed per mode; the rest of each prompt is small and fixed
+MODE_BUDGETS = {
+    'summarize': 3000,
+    'tag': 1000,
+    'subtasks': 4000,
+    'test-notes': 4000,
+    'release-notes': 3000,
+}
+DEFAULT_BUDGET = 3000
+
+# Section kinds in the order they are dropped when over budget
+DROP_ORDER = ['duplicate', 'signature', 'log', 'stack_trace']
+STACK_TRACE_KEEP_LINES = 3
+TRUNCATION_MARKER_TOKENS = 12
+
+STACK_LINE = re.compile(r'^\s*(at [\w$.<>/]+\(.*\)|File ".+", line \d+|Traceback \(most recent call last\)'
+                        r'|Caused by: |\.\.\. \d+ more|[\w.]+(Exception|Error)\b)')
+LOG_LINE = re.compile(r'^\s*\[?(\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}|\d{2}:\d{2}:\d{2}[.,]\d+)'
+                      r'|^\s*\[?(TRACE|DEBUG|INFO|WARN|WARNING|ERROR|FATAL)\b')
+SIGNATURE_START = re.compile(r'^\s*(--\s*$|thanks\b|thank you\b|regards\b|best regards\b|kind regards\b|'
+                             r'cheers\b|sincerely\b|sent from my\b)', re.IGNORECASE)
+SIGNATURE_MAX_CHARS = 400
+BLOCK_TYPES = {'paragraph', 'heading', 'codeBlock', 'blockquote'}
+
+
+def estimate_tokens(text):
+    """Approximate token count of text"""
+    return math.ceil(len(text or '') / CHARS_PER_TOKEN)
+
+
+def _inline_text(node):
+    """Text of an ADF node's inline content, hard breaks kept as newlines"""
+    if isinstance(node, list):
+        return ''.join(_inline_text(child) for child in node)
+    if not isinstance(node, dict):
+        return ''
+    node_type = node.get('type')
+    if node_type == 'text':
+        return node.get('text', '')
+    if node_type == 'mention':
+        return node.get('attrs', {}).get('text', '')
+    if node_type == 'hardBreak':
+        return '\n'
+    if node_type in ('paragraph', 'heading'):
+        return _inline_text(node.get('content', [])) + '\n'
+    return _inline_text(node.get('content', []))
+
+
+def description_sections(description):
+    """
+    Split a description (ADF document or plain text) into [(kind, text)]
+    where kind is 'code', 'quote' or 'text' as written
+    """
+    if not description:
+        return []
+    if isinstance(description, str):
+        return [('text', block.strip()) for block in re.split(r'\n\s*\n', description) if block.strip()]
+
+    sections = []
+
+    def walk(node):
+        if isinstance(node, list):
+            for child in node:
+                walk(child)
+        elif isinstance(node, dict):
+            node_type = node.get('type')
+            if node_type in BLOCK_TYPES:
+                kind = {'codeBlock': 'code', 'blockquote': 'quote'}.get(node_type, 'text')
+                text = _inline_text(node.get('content', [])).strip()
+                if text:
+                    sections.append((kind, text))
+            elif node_type in ('text', 'mention'):
+                sections.append(('text', _inline_text(node)))
+            else:
+                walk(node.get('content', []))
+
+    walk(description)
+    return sections
+
+
+def classify(kind, text):
+    """Budgeting kind of a section: signature, stack_trace, log or text"""
+    lines = [line for line in text.splitlines() if line.strip()]
+    if not lines:
+        return 'text'
+    if SIGNATURE_START.match(lines[0]) and len(text) <= SIGNATURE_MAX_CHARS:
+        return 'signature'
+    stack_lines = sum(1 for line in lines if STACK_LINE.match(line))
+    if stack_lines >= 2 and stack_lines * 3 >= len(lines):
+        return 'stack_trace'
+    log_lines = sum(1 for line in lines if LOG_LINE.match(line))
+    if kind in ('code', 'quote') or (len(lines) >= 3 and log_lines * 2 >= len(lines)):
+        return 'log'
+    return 'text'
+
+
+def _placeholder(kind, text):
+    lines = text.splitlines()
+    if kind == 'stack_trace':
+        kept = '\n'.join(lines[:STACK_TRACE_KEEP_LINES])
+        omitted = len(lines) - STACK_TRACE_KEEP_LINES
+        return f"{kept}\n[... {omitted} more stack trace lines omitted]" if omitted > 0 else text
+    if kind == 'duplicate':
+        return '[repeated section omitted]'
+    if kind == 'signature':
+        return ''
+    return f"[{len(lines)}-line log omitted]"
+
+
+def _truncate_middle(text, tokens):
+    """Keep the start and end of text within tokens, marker included"""
+    keep = max(0, tokens - TRUNCATION_MARKER_TOKENS) * CHARS_PER_TOKEN
+    head, tail = text[:keep * 3 // 4], text[len(text) - keep // 4:]
+    omitted = estimate_tokens(text) - estimate_tokens(head + tail)
+    return f"{head}\n[... ~{omitted:,} tokens omitted ...]\n{tail}"
+
+
+def fit_description(description, mode, budget=None):
+    """
+    Description text for a prompt, trimmed to the mode's token budget
+
+    Returns (text, report) where report has mode, budget, tokens_before,
+    tokens_after, tokens_saved and dropped (count per section kind).
+    """
+    budget = budget or MODE_BUDGETS.get(mode, DEFAULT_BUDGET)
+    sections = []
+    seen = set()
+    for kind, text in description_sections(description):
+        label = classify(kind, text)
+        # Identical stack traces/logs pasted again add nothing
+        key = re.sub(r'\s+', ' ', text)
+        if label != 'text' and key in seen:
+            label = 'duplicate'
+        seen.add(key)
+        sections.append([label, text])
+
+    full = '\n\n'.join(text for _, text in sections)
+    tokens_before = estimate_tokens(full)
+    tokens = tokens_before
+    dropped = Counter()
+
+    for kind in DROP_ORDER:
+        if tokens <= budget:
+            break
+        # Largest first, so the fewest sections are touched
+        candidates = sorted((i for i, (label, _) in enumerate(sections) if label == kind),
+                            key=lambda i: -len(sections[i][1]))
+        for i in candidates:
+            if tokens <= budget:
+                break
+            replacement = _placeholder(kind, sections[i][1])
+            tokens -= estimate_tokens(sections[i][1]) - estimate_tokens(replacement)
+            sections[i] = ['omitted', replacement]
+            dropped[kind] += 1
+
+    text = '\n\n'.join(text for _, text in sections if text)
+    if estimate_tokens(text) > budget:
+        text = _truncate_middle(text, budget)
+        dropped['truncated'] += 1
+
+    tokens_after = estimate_tokens(text)
+    return text, {
+        'mode': mode,
+        'budget': budget,
+        'tokens_before': tokens_before,
+        'tokens_after': tokens_after,
+        'tokens_saved': max(0, tokens_before - tokens_after),
+        'dropped': dict(dropped),
+    }
+
+
+def describe_savings(report):
+    """One-line summary of a fit_description report, or '' when nothing was trimmed"""
+    if not report['tokens_saved']:
+        return ''
+    dropped = ', '.join(f"{count} {kind.replace('_', ' ')}" for kind, count in report['dropped'].items())
+    return (f"✂️ Description {report['tokens_before']:,} → {report['tokens_after']:,} tokens "
+            f"(saved ~{report['tokens_saved']:,}; budget {report['budget']:,}; dropped: {dropped})")
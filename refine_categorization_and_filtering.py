@@ -5,6 +5,8 @@ import re
 from collections import Counter
 import os
 
+from tri_categorizer import categorize_many
+
 def analyze_other_category_patterns():
     """
     Analyze the 'Other' category tickets to identify patterns for better categorization.
@@ -29,66 +31,8 @@ def analyze_other_category_patterns():
     # Extract keywords from summaries
     all_summaries = ' '.join(other_tickets['Summary'].fillna('').str.lower())
     
-    # Define refined categorization patterns
-    categorization_patterns = {
-        'Account Management': [
-            'account', 'customer', 'user', 'contact', 'admin', 'permission', 'access',
-            'login', 'password', 'authentication'
-        ],
-        'Report Issues': [
-            'report', 'statement', 'invoice', 'receipt', 'export', 'pdf', 'print'
-        ],
-        'Rate & Pricing': [
-            'rate', 'pricing', 'charge', 'fee', 'tier', 'surcharge', 'discount', 'tax'
-        ],
-        'Communication': [
-            'email', 'notice', 'notification', 'mail', 'communication', 'reminder',
-            'alert', 'message'
-        ],
-        'Configuration': [
-            'config', 'setup', 'setting', 'template', 'format', 'layout', 'display',
-            'customize', 'global'
-        ],
-        'Data Issues': [
-            'import', 'export', 'transfer', 'sync', 'data', 'file', 'update',
-            'duplicate', 'missing'
-        ],
-        'System Issues': [
-            'error', 'bug', 'issue', 'problem', 'fix', 'broken', 'not working',
-            'failure', 'crash', 'slow'
-        ],
-        'Calculation Issues': [
-            'calculation', 'calculating', 'calculate', 'reads', 'reading', 'meter',
-            'usage', 'consumption', 'billing'
-        ],
-        'Portal Issues': [
-            'portal', 'website', 'online', 'web', 'browser', 'mobile', 'app'
-        ],
-        'Request/Enhancement': [
-            'request', 'enhance', 'improve', 'add', 'create', 'new', 'feature',
-            'modification', 'change'
-        ]
-    }
-    
-    # Apply refined categorization
-    def refined_categorize(summary):
-        summary_lower = str(summary).lower()
-        
-        # Score each category based on keyword matches
-        category_scores = {}
-        for category, keywords in categorization_patterns.items():
-            score = sum(1 for keyword in keywords if keyword in summary_lower)
-            if score > 0:
-                category_scores[category] = score
-        
-        # Return the category with highest score, or 'Uncategorized' if no matches
-        if category_scores:
-            return max(category_scores.items(), key=lambda x: x[1])[0]
-        else:
-            return 'Uncategorized'
-    
-    # Apply refined categorization to all tickets
-    df['Refined_Category'] = df['Summary'].apply(refined_categorize)
+    # Apply refined categorization to all tickets (patterns in tri_category_rules.json)
+    df['Refined_Category'] = categorize_many('refined', df['Summary'])
     
     # For tickets that were already properly categorized, keep original
     mask = df['Issue_Category'] != 'Other'
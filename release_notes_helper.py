@@ -3,9 +3,21 @@ Release Notes Helper for CJ-Buddy
 Generates and manages release notes for Jira issues
 """
 
+import json
+import os
+import sqlite3
+from concurrent.futures import as_completed, wait
+from datetime import datetime
+
 import click
-from jira_helper import get_issue, update_field
-from claude_helper import get_claude_response
+from prompt_budget import describe_savings, fit_description
+from jira_helper import WriteLog, content_hash, get_issue, hash_markers, update_field, with_hash_marker
+from claude_helper import (describe_cache_usage, describe_route, get_claude_response, last_route, last_usage,
+                           submit_claude_prompt)
+
+RELEASE_NOTES_FIELD = 'customfield_10424'  # Instructions/Operational Notes
+JOURNAL_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'release_notes_journal.db')
+WRITE_SKIPPED_MESSAGE = "⏭️ Unchanged since the last write, skipped Jira update"
 
 def analyze_issue_for_release_notes(issue):
     """Analyze a Jira issue to extract relevant information for release notes"""
@@ -20,18 +32,18 @@ def analyze_issue_for_release_notes(issue):
     components = [comp.get('name') for comp in fields.get('components', [])]
     labels = fields.get('labels', [])
     
-    # Extract description text (handle ADF format)
-    from main import extract_text_from_content
+    # Extract description text (handle ADF format), trimmed to the release-notes budget
     description_obj = fields.get('description')
-    description = extract_text_from_content(description_obj) if description_obj else "No description"
+    description, budget = fit_description(description_obj, 'release-notes')
     
     # Get any existing release notes
-    existing_notes = fields.get('customfield_10424')  # Instructions/Operational Notes field
+    existing_notes = fields.get(RELEASE_NOTES_FIELD)
     
     return {
         'issue_type': issue_type,
         'summary': summary,
-        'description': description,
+        'description': description or "No description",
+        'prompt_budget': budget,
         'priority': priority,
         'status': status,
         'assignee': assignee,
@@ -40,24 +52,8 @@ def analyze_issue_for_release_notes(issue):
         'existing_notes': existing_notes
     }
 
-def generate_release_notes_prompt(issue_data):
-    """Generate a prompt for Claude to create release notes"""
-    
-    prompt = f"""You are a technical writer creating release notes for a software product. Analyze the following Jira issue and generate appropriate release note content.
-
-ISSUE DETAILS:
-- Type: {issue_data['issue_type']}
-- Summary: {issue_data['summary']}
-- Priority: {issue_data['priority']}
-- Status: {issue_data['status']}
-- Components: {', '.join(issue_data['components']) if issue_data['components'] else 'None'}
-- Labels: {', '.join(issue_data['labels']) if issue_data['labels'] else 'None'}
-
-DESCRIPTION:
-{issue_data['description']}
-
-EXISTING RELEASE NOTES:
-{issue_data['existing_notes'] or 'None'}
+# Shared by every release-notes prompt, so it is sent as the cached prompt prefix
+RELEASE_NOTES_INSTRUCTIONS = """You are a technical writer creating release notes for a software product. Analyze the Jira issue you are given and generate appropriate release note content.
 
 Please generate release notes that:
 1. Are written from the user's perspective (what they will experience)
@@ -80,6 +76,23 @@ For BREAKING CHANGES, use format:
 
 Respond with ONLY the release note text, no additional commentary."""
 
+def generate_release_notes_prompt(issue_data):
+    """Per-issue part of the release notes prompt; RELEASE_NOTES_INSTRUCTIONS is the prefix"""
+    
+    prompt = f"""ISSUE DETAILS:
+- Type: {issue_data['issue_type']}
+- Summary: {issue_data['summary']}
+- Priority: {issue_data['priority']}
+- Status: {issue_data['status']}
+- Components: {', '.join(issue_data['components']) if issue_data['components'] else 'None'}
+- Labels: {', '.join(issue_data['labels']) if issue_data['labels'] else 'None'}
+
+DESCRIPTION:
+{issue_data['description']}
+
+EXISTING RELEASE NOTES:
+{issue_data['existing_notes'] or 'None'}"""
+
     return prompt
 
 def ask_clarifying_questions(issue_data):
@@ -124,28 +137,27 @@ def ask_clarifying_questions(issue_data):
         # Non-interactive environment, use defaults
         click.echo("⚠️ Non-interactive environment detected, using defaults")
         
-        # Infer context from issue data
-        issue_type = issue_data.get('issue_type', '').lower()
-        labels = [label.lower() for label in issue_data.get('labels', [])]
-        
-        # Default context based on issue type and labels
-        if 'bug' in issue_type:
-            business_value = "Fixes functionality and improves user experience"
-            user_impact = "Users will no longer experience the reported issue"
-        elif any(word in issue_type for word in ['feature', 'story', 'epic']):
-            business_value = "Adds new functionality to enhance product capabilities"
-            user_impact = "Users gain access to new features and capabilities"
-        else:
-            business_value = "Improves system functionality and reliability"
-            user_impact = "Users experience better system performance and stability"
-        
-        additional_context = {
-            'business_value': business_value,
-            'user_impact': user_impact,
-            'caveats': ""
-        }
-        
-        return additional_context, None
+        return default_context(issue_data), None
+
+def default_context(issue_data):
+    """Business value and user impact inferred from the issue type, for unattended runs"""
+    issue_type = issue_data.get('issue_type', '').lower()
+    
+    if 'bug' in issue_type:
+        business_value = "Fixes functionality and improves user experience"
+        user_impact = "Users will no longer experience the reported issue"
+    elif any(word in issue_type for word in ['feature', 'story', 'epic']):
+        business_value = "Adds new functionality to enhance product capabilities"
+        user_impact = "Users gain access to new features and capabilities"
+    else:
+        business_value = "Improves system functionality and reliability"
+        user_impact = "Users experience better system performance and stability"
+    
+    return {
+        'business_value': business_value,
+        'user_impact': user_impact,
+        'caveats': ""
+    }
 
 def enhance_prompt_with_context(base_prompt, additional_context):
     """Enhance the base prompt with additional context from user questions"""
@@ -207,47 +219,45 @@ def review_and_edit_draft(draft_notes):
         return draft_notes, True
 
 def update_release_notes_field(ticket_id, new_content):
-    """Update the Instructions/Operational Notes field with release notes"""
-    # First get current content
-    issue = get_issue(ticket_id)
-    current_field = issue.get('fields', {}).get('customfield_10424')
-    
-    # Append new content with timestamp
-    from datetime import datetime
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-    
-    # Create the new content to append
-    new_section = f"--- Release Notes ({timestamp}) ---\n{new_content}"
-    
-    # Handle both null and existing content
-    if current_field is None:
-        # Field is null, create new ADF content
-        updated_content = {
-            "type": "doc",
-            "version": 1,
-            "content": [
-                {
-                    "type": "paragraph",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": new_section
-                        }
-                    ]
-                }
-            ]
-        }
-    else:
-        # Field has existing content, append to it
-        if isinstance(current_field, str):
-            # Convert plain text to ADF format
-            full_content = f"{current_field}\n\n{new_section}"
+    """
+    Append release notes to the Instructions/Operational Notes field
+
+    The section carries a hash of new_content; if the write log or the field
+    already has that hash, nothing is fetched or written. Returns the
+    appended section, or None when the write was skipped as unchanged.
+    """
+    digest = content_hash(new_content)
+    write_log = WriteLog()
+    try:
+        if write_log.written(ticket_id, RELEASE_NOTES_FIELD, digest):
+            return None
+        
+        # First get current content
+        issue = get_issue(ticket_id)
+        current_field = issue.get('fields', {}).get(RELEASE_NOTES_FIELD)
+        
+        if current_field is None:
+            existing_text = None
+        elif isinstance(current_field, str):
+            existing_text = current_field
         else:
-            # Extract existing text from ADF and append
+            # Extract existing text from ADF
             from main import extract_text_from_content
             existing_text = extract_text_from_content(current_field)
-            full_content = f"{existing_text}\n\n{new_section}"
         
+        # Same notes written by an earlier run whose log was lost
+        if digest in hash_markers(existing_text):
+            write_log.record(ticket_id, RELEASE_NOTES_FIELD, digest)
+            return None
+        
+        # Append new content with timestamp
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+        
+        # Create the new content to append
+        new_section = with_hash_marker(f"--- Release Notes ({timestamp}) ---\n{new_content}", digest)
+        
+        # Handle both null and existing content
+        full_content = new_section if existing_text is None else f"{existing_text}\n\n{new_section}"
         updated_content = {
             "type": "doc",
             "version": 1,
@@ -263,10 +273,130 @@ def update_release_notes_field(ticket_id, new_content):
                 }
             ]
         }
+        
+        # Update the field
+        update_field(ticket_id, RELEASE_NOTES_FIELD, updated_content)
+        write_log.record(ticket_id, RELEASE_NOTES_FIELD, digest)
+        return new_section
+    finally:
+        write_log.close()
+
+class ReleaseNotesJournal:
+    """
+    Local SQLite record of how far each ticket's headless release notes got:
+    fetched (issue data kept), drafted (draft kept) or written to Jira
+    """
+
+    def __init__(self, path=JOURNAL_FILE):
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS journal (
+                ticket_id TEXT PRIMARY KEY,
+                stage TEXT NOT NULL,
+                issue_data TEXT,
+                draft TEXT,
+                written_section TEXT,
+                error TEXT,
+                updated_at TEXT NOT NULL
+            );
+        """)
+
+    def entry(self, ticket_id):
+        row = self.conn.execute(
+            "SELECT stage, issue_data, draft, written_section, error, updated_at FROM journal WHERE ticket_id = ?",
+            (ticket_id,)).fetchone()
+        if not row:
+            return None
+        stage, issue_data, draft, written_section, error, updated_at = row
+        return {'stage': stage, 'issue_data': json.loads(issue_data) if issue_data else None,
+                'draft': draft, 'written_section': written_section, 'error': error, 'updated_at': updated_at}
+
+    def record(self, ticket_id, stage, issue_data=None, draft=None, written_section=None):
+        """Advance a ticket to stage, keeping what earlier stages stored"""
+        now = datetime.now().isoformat(timespec='seconds')
+        with self.conn:
+            self.conn.execute("""
+                INSERT INTO journal VALUES (?, ?, ?, ?, ?, NULL, ?)
+                ON CONFLICT(ticket_id) DO UPDATE SET
+                    stage = excluded.stage,
+                    issue_data = COALESCE(excluded.issue_data, issue_data),
+                    draft = COALESCE(excluded.draft, draft),
+                    written_section = COALESCE(excluded.written_section, written_section),
+                    error = NULL,
+                    updated_at = excluded.updated_at
+            """, (ticket_id, stage, json.dumps(issue_data) if issue_data is not None else None,
+                  draft, written_section, now))
+
+    def failed(self, ticket_id, error):
+        """Note an error without moving the ticket's stage"""
+        with self.conn:
+            self.conn.execute("UPDATE journal SET error = ?, updated_at = ? WHERE ticket_id = ?",
+                              (str(error), datetime.now().isoformat(timespec='seconds'), ticket_id))
+
+    def forget(self, ticket_id):
+        with self.conn:
+            self.conn.execute("DELETE FROM journal WHERE ticket_id = ?", (ticket_id,))
+
+    def close(self):
+        self.conn.close()
+
+def generate_release_notes_headless(ticket_id, journal):
+    """
+    Fetch, draft and write release notes without prompting, checkpointing
+    each stage in the journal. A rerun skips written tickets and resumes the
+    rest from their last completed stage. Returns the written section, or
+    None if a stage failed.
+    """
+    entry = journal.entry(ticket_id) or {}
+    stage = entry.get('stage')
+    if stage == 'written':
+        click.echo(f"⏭️ Release notes already written ({entry['updated_at']}), skipping")
+        return entry['written_section']
+    if stage:
+        click.echo(f"♻️ Resuming from journal (last stage: {stage})")
+    
+    try:
+        if stage is None:
+            click.echo("🔍 Analyzing issue for release notes...", nl=False)
+            issue_data = analyze_issue_for_release_notes(get_issue(ticket_id))
+            journal.record(ticket_id, 'fetched', issue_data=issue_data)
+            stage = 'fetched'
+            click.echo(" ✓")
+            if issue_data['prompt_budget']['tokens_saved']:
+                click.echo(describe_savings(issue_data['prompt_budget']))
+        else:
+            issue_data = entry['issue_data']
+        
+        if stage == 'fetched':
+            click.echo("🤖 Generating release notes...", nl=False)
+            prompt = enhance_prompt_with_context(generate_release_notes_prompt(issue_data),
+                                                 default_context(issue_data))
+            draft_notes = get_claude_response(prompt, prefix=RELEASE_NOTES_INSTRUCTIONS, mode='release-notes')
+            if draft_notes.startswith('Error:'):
+                raise RuntimeError(draft_notes[len('Error:'):].strip())
+            journal.record(ticket_id, 'drafted', draft=draft_notes)
+            stage = 'drafted'
+            click.echo(" ✓")
+            click.echo(describe_route(last_route()))
+            click.echo(describe_cache_usage(last_usage()))
+        else:
+            draft_notes = entry['draft']
+        
+        click.echo("💾 Saving release notes to Jira...", nl=False)
+        written_section = update_release_notes_field(ticket_id, draft_notes)
+        journal.record(ticket_id, 'written', written_section=written_section)
+        click.echo(" ✓")
+        if written_section is None:
+            click.echo(WRITE_SKIPPED_MESSAGE)
+            return draft_notes
+        click.echo(f"📝 Content appended to Instructions/Operational Notes field")
+        return written_section
     
-    # Update the field
-    update_field(ticket_id, 'customfield_10424', updated_content)
-    return new_section
+    except Exception as e:
+        click.echo(f" ✗\n❌ Error after stage '{stage or 'none'}': {e}")
+        if stage:
+            journal.failed(ticket_id, e)
+        return None
 
 def generate_release_notes_for_issue(ticket_id):
     """Main function to generate and save release notes for an issue"""
@@ -277,6 +407,8 @@ def generate_release_notes_for_issue(ticket_id):
         issue = get_issue(ticket_id)
         issue_data = analyze_issue_for_release_notes(issue)
         click.echo(" ✓")
+        if issue_data['prompt_budget']['tokens_saved']:
+            click.echo(describe_savings(issue_data['prompt_budget']))
     except Exception as e:
         click.echo(f" ✗\n❌ Error analyzing issue: {e}")
         return
@@ -299,8 +431,10 @@ def generate_release_notes_for_issue(ticket_id):
             base_prompt = generate_release_notes_prompt(issue_data)
             enhanced_prompt = enhance_prompt_with_context(base_prompt, additional_context)
             
-            draft_notes = get_claude_response(enhanced_prompt)
+            draft_notes = get_claude_response(enhanced_prompt, prefix=RELEASE_NOTES_INSTRUCTIONS, mode='release-notes')
             click.echo(" ✓")
+            click.echo(describe_route(last_route()))
+            click.echo(describe_cache_usage(last_usage()))
             break
         except Exception as e:
             attempts += 1
@@ -325,7 +459,7 @@ def generate_release_notes_for_issue(ticket_id):
             regeneration_prompt = f"{enhanced_prompt}\n\nADDITIONAL GUIDANCE: {result}"
             click.echo("🤖 Regenerating with your guidance...", nl=False)
             try:
-                draft_notes = get_claude_response(regeneration_prompt)
+                draft_notes = get_claude_response(regeneration_prompt, prefix=RELEASE_NOTES_INSTRUCTIONS, mode='release-notes')
                 click.echo(" ✓")
             except Exception as e:
                 click.echo(f" ✗\n❌ Error regenerating: {e}")
@@ -337,6 +471,9 @@ def generate_release_notes_for_issue(ticket_id):
         updated_content = update_release_notes_field(ticket_id, final_notes)
         click.echo(" ✓")
         
+        if updated_content is None:
+            click.echo(WRITE_SKIPPED_MESSAGE)
+            return
         click.echo(f"\n✅ Release notes saved successfully!")
         click.echo(f"📝 Content appended to Instructions/Operational Notes field")
         
@@ -345,4 +482,106 @@ def generate_release_notes_for_issue(ticket_id):
         click.echo(f"\n📋 Generated content (save manually if needed):")
         click.echo("━" * 50)
         click.echo(final_notes)
-        click.echo("━" * 50)
\ No newline at end of file
+        click.echo("━" * 50)
+
+# Release document sections, in the order they appear
+RELEASE_SECTIONS = [
+    ('✨ New Features', ('feature', 'story', 'epic')),
+    ('🐛 Bug Fixes', ('bug', 'defect')),
+    ('⚡ Improvements', ()),
+]
+
+def release_section(issue_type):
+    """Document section for an issue type; anything unmatched is an improvement"""
+    issue_type = issue_type.lower()
+    for section, words in RELEASE_SECTIONS:
+        if any(word in issue_type for word in words):
+            return section
+    return RELEASE_SECTIONS[-1][0]
+
+def generate_release_summary_prompt(release_name, notes):
+    """Prompt for the executive summary of a whole release"""
+    note_lines = '\n'.join(f"- {key}: {note}" for key, note in notes)
+    return f"""You are a technical writer creating the executive summary for the {release_name} release notes.
+
+RELEASE NOTES FOR EACH ISSUE:
+{note_lines}
+
+Write:
+1. One paragraph (2-4 sentences) on what this release delivers and why it matters to customers
+2. A line "**Key Highlights:**" followed by 3-5 bullets in the form "- ✅ **Theme**: One-sentence benefit"
+
+Respond with ONLY the summary text in Markdown, no heading and no additional commentary."""
+
+def generate_release_document(release_name, issues, progress=None):
+    """
+    Draft release notes for every issue in a release through the shared
+    Claude executor and assemble them into one Markdown document
+
+    Returns (markdown, failed, tokens_saved) where failed maps issue keys to
+    errors and tokens_saved totals the description trimming.
+    """
+    drafts = {}
+    tokens_saved = 0
+    for issue in issues:
+        issue_data = analyze_issue_for_release_notes(issue)
+        prompt = enhance_prompt_with_context(generate_release_notes_prompt(issue_data),
+                                             default_context(issue_data))
+        future = submit_claude_prompt(prompt, prefix=RELEASE_NOTES_INSTRUCTIONS, mode='release-notes')
+        drafts[future] = (issue['key'], issue_data)
+        tokens_saved += issue_data['prompt_budget']['tokens_saved']
+        # Let the first request write the prefix to the cache before the rest fan out
+        if len(drafts) == 1:
+            wait([future])
+    
+    notes, failed = {}, {}
+    for future in as_completed(drafts):
+        key, issue_data = drafts[future]
+        try:
+            note = future.result().strip()
+            if note.startswith('Error:'):
+                raise RuntimeError(note[len('Error:'):].strip())
+            notes[key] = (issue_data, note)
+        except Exception as e:
+            failed[key] = str(e)
+        if progress:
+            progress(key, key not in failed, issue_data['prompt_budget']['tokens_saved'])
+    
+    ordered = [issue['key'] for issue in issues if issue['key'] in notes]
+    summary = ''
+    if ordered:
+        summary = get_claude_response(generate_release_summary_prompt(
+            release_name, [(key, notes[key][1]) for key in ordered]), mode='release-summary').strip()
+        if summary.startswith('Error:'):
+            failed['executive summary'] = summary[len('Error:'):].strip()
+            summary = ''
+    
+    lines = [f"# {release_name} Release Notes",
+             "*Release Date: TBD*",
+             "",
+             "## Executive Summary",
+             "",
+             summary or "_Summary not generated._",
+             "",
+             "---"]
+    counts = []
+    for section, _ in RELEASE_SECTIONS:
+        keys = [key for key in ordered if release_section(notes[key][0]['issue_type']) == section]
+        if not keys:
+            continue
+        counts.append((section, len(keys)))
+        lines += ["", f"## {section}", ""]
+        for key in keys:
+            issue_data, note = notes[key]
+            lines += [f"### {key}: {issue_data['summary']}", note, ""]
+        lines.append("---")
+    
+    lines += ["", "## 📊 Resolved Issues Summary", "",
+              "| Category | Issues |",
+              "|----------|--------|"]
+    lines += [f"| **{section}** | {count} |" for section, count in counts]
+    lines += [f"| **Total** | {len(ordered)} |", "", "---", "",
+              f"*Generated {datetime.now().strftime('%Y-%m-%d %H:%M')} from {len(issues)} Jira issues*"]
+    if failed:
+        lines.append(f"*Not included (generation failed): {', '.join(sorted(failed))}*")
+    return '\n'.join(lines) + '\n', failed, tokens_saved
@@ -1,49 +1,74 @@
 #!/usr/bin/env python3
+"""
+Release Review
+
+Lists every issue in a Jira fixVersion, and with --notes drafts release
+notes for all of them concurrently and writes one combined release
+document (like MBSaas_7.10.0_Release_Notes.md).
+
+Usage:
+    python3 review_release.py 7.11.0
+    python3 review_release.py 7.11.0 --notes --workers 6
+    python3 review_release.py 7.11.0 --notes --output release.md
+"""
+import argparse
 import os
+import sys
+import time
 import requests
 from requests.auth import HTTPBasicAuth
 import json
 
+import claude_helper
+from release_notes_helper import generate_release_document
+
 # Get environment variables
 JIRA_URL = os.getenv('JIRA_BASE_URL', 'https://jiramb.atlassian.net')
 JIRA_EMAIL = os.getenv('JIRA_EMAIL')
 JIRA_API_TOKEN = os.getenv('JIRA_API_TOKEN') or os.getenv('JIRA_TOKEN')
+PRODUCT_NAME = 'MBSaas'
+
+PAGE_SIZE = 100  # Jira caps search pages at 100 issues
+RELEASE_FIELDS = ('key,summary,status,issuetype,priority,assignee,reporter,created,updated,'
+                  'description,components,labels,customfield_10424')
 
 def get_release_issues(fix_version):
-    """Fetch all issues for a specific release/fix version"""
+    """Fetch all issues for a specific release/fix version, page by page"""
     
-    jql = f'fixVersion = "{fix_version}"'
+    jql = f'fixVersion = "{fix_version}" ORDER BY key ASC'
     
     headers = {
         "Accept": "application/json",
         "Content-Type": "application/json"
     }
     
-    params = {
-        'jql': jql,
-        'maxResults': 100,
-        'fields': 'key,summary,status,issuetype,priority,assignee,reporter,created,updated,description'
-    }
-    
-    response = requests.get(
-        f"{JIRA_URL}/rest/api/3/search",
-        headers=headers,
-        params={
-            'jql': jql,
-            'maxResults': 100,
-            'fields': 'key,summary,status,issuetype,priority,assignee,reporter,created,updated,description'
-        },
-        auth=HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN)
-    )
-    
-    if response.status_code == 200:
-        return response.json()
-    else:
-        print(f"Error: {response.status_code}")
-        print(response.text)
-        return None
+    issues = []
+    while True:
+        response = requests.get(
+            f"{JIRA_URL}/rest/api/3/search",
+            headers=headers,
+            params={
+                'jql': jql,
+                'startAt': len(issues),
+                'maxResults': PAGE_SIZE,
+                'fields': RELEASE_FIELDS
+            },
+            auth=HTTPBasicAuth(JIRA_EMAIL, JIRA_API_TOKEN),
+            timeout=30
+        )
+        
+        if response.status_code != 200:
+            print(f"Error: {response.status_code}")
+            print(response.text)
+            return None
+        
+        data = response.json()
+        page = data.get('issues', [])
+        issues.extend(page)
+        if not page or len(issues) >= data.get('total', 0):
+            return {'issues': issues, 'total': data.get('total', len(issues))}
 
-def display_release_review(data):
+def display_release_review(data, fix_version):
     """Display release issues in a formatted way"""
     
     if not data or 'issues' not in data:
@@ -53,7 +78,7 @@ def display_release_review(data):
     issues = data['issues']
     total = data['total']
     
-    print(f"\n📋 RELEASE 7.8.0 REVIEW")
+    print(f"\n📋 RELEASE {fix_version} REVIEW")
     print("=" * 60)
     print(f"Total Issues: {total}")
     print("=" * 60)
@@ -98,7 +123,57 @@ def display_release_review(data):
     for issue_type, count in type_counts.items():
         print(f"{issue_type}: {count}")
 
+def write_release_notes(fix_version, issues, output=None, product=PRODUCT_NAME):
+    """Generate release notes for every issue concurrently and write one release document"""
+    release_name = f"{product} {fix_version}"
+    output = output or os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                    f"{release_name.replace(' ', '_')}_Release_Notes.md")
+    
+    print(f"\n🤖 Generating release notes for {len(issues)} issues "
+          f"({claude_helper.CLAUDE_WORKERS} concurrent requests)...")
+    done = []
+    def progress(key, ok, tokens_saved):
+        done.append(key)
+        trimmed = f" (description trimmed, ~{tokens_saved:,} tokens saved)" if tokens_saved else ""
+        print(f"  {'✅' if ok else '❌'} [{len(done)}/{len(issues)}] {key}{trimmed}")
+    
+    start = time.time()
+    usage_before = claude_helper.usage_totals()
+    document, failed, tokens_saved = generate_release_document(release_name, issues, progress)
+    with open(output, 'w') as f:
+        f.write(document)
+    
+    print(f"\n📄 Release document written to {output} in {time.time() - start:.1f}s")
+    if tokens_saved:
+        print(f"✂️ Description trimming saved ~{tokens_saved:,} prompt tokens")
+    usage = claude_helper.usage_totals()
+    print(claude_helper.describe_cache_usage({field: usage.get(field, 0) - usage_before.get(field, 0)
+                                              for field in claude_helper.USAGE_FIELDS}))
+    if failed:
+        print(f"❌ Failed ({len(failed)}):")
+        for key, error in sorted(failed.items()):
+            print(f"  • {key}: {error}")
+    return not failed
+
+def main():
+    parser = argparse.ArgumentParser(description='Review a release and generate its release notes')
+    parser.add_argument('fix_version', nargs='?', default='7.8.0', help='Jira fixVersion, e.g. 7.11.0')
+    parser.add_argument('--notes', action='store_true',
+                        help='Generate release notes for every issue and write the release document')
+    parser.add_argument('--workers', type=int, default=claude_helper.CLAUDE_WORKERS,
+                        help='Concurrent Claude requests')
+    parser.add_argument('--output', help='Release document path (default: <product>_<version>_Release_Notes.md)')
+    parser.add_argument('--product', default=PRODUCT_NAME, help='Product name used in the document title')
+    args = parser.parse_args()
+    
+    print(f"🔍 Fetching Release {args.fix_version} issues from Jira...")
+    data = get_release_issues(args.fix_version)
+    display_release_review(data, args.fix_version)
+    
+    if args.notes and data and data['issues']:
+        claude_helper.CLAUDE_WORKERS = args.workers
+        if not write_release_notes(args.fix_version, data['issues'], args.output, args.product):
+            sys.exit(1)
+
 if __name__ == "__main__":
-    print("🔍 Fetching Release 7.8.0 issues from Jira...")
-    data = get_release_issues("7.8.0")
-    display_release_review(data)
\ No newline at end of file
+    main()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+TRI Ticket Categorization Engine
+
+Single keyword categorizer shared by the TRI export and analysis scripts.
+Rules live in tri_category_rules.json as named rulesets. Each ruleset's
+keywords are compiled into one trie-shaped regex, so a text is scanned
+once no matter how many categories or keywords the ruleset has.
+
+Usage:
+    from tri_categorizer import categorize, categorize_many
+
+    categorize('business_area', 'Autopay failed for CID 384')
+    categorize_many('refined', df['Summary'])
+"""
+
+import json
+import os
+import re
+
+RULES_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tri_category_rules.json')
+
+
+def _trie_regex(keywords):
+    """Build a regex source matching the longest keyword at a position"""
+    trie = {}
+    for word in keywords:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = True
+
+    def emit(node):
+        terminal = '' in node
+        branches = [re.escape(char) + emit(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if terminal:
+            # Trie children start with distinct characters, so the greedy
+            # optional group always yields the longest keyword here
+            return '(?:' + body + ')?'
+        return body
+
+    return emit(trie)
+
+
+class CategoryEngine:
+    """Compiled matcher for one named ruleset"""
+
+    def __init__(self, name, ruleset):
+        self.name = name
+        self.mode = ruleset.get('mode', 'first_match')
+        self.default = ruleset.get('default', 'Other')
+        self.empty = ruleset.get('empty')
+        self.rules = ruleset['rules']
+
+        keywords = sorted({kw.lower() for kw in self._walk_keywords(self.rules)})
+        self.keywords = keywords
+
+        # Every keyword that is a substring of a longer one is implied by it,
+        # so the longest match at each position is enough to recover every hit
+        self._implied = {kw: frozenset(k for k in keywords if k in kw) for kw in keywords}
+        self._pattern = re.compile('(?=(' + _trie_regex(keywords) + '))') if keywords else None
+
+        if self.mode == 'score':
+            self._categories = [rule['category'] for rule in self.rules]
+            self._keyword_categories = {}
+            for index, rule in enumerate(self.rules):
+                for kw in {k.lower() for k in rule['keywords']}:
+                    self._keyword_categories.setdefault(kw, []).append(index)
+        else:
+            self._compiled_rules = self._compile_first_match(self.rules)
+
+    @staticmethod
+    def _walk_keywords(rules):
+        for rule in rules:
+            yield from rule.get('keywords', [])
+            yield from CategoryEngine._walk_keywords(rule.get('rules', []))
+
+    @staticmethod
+    def _compile_first_match(rules):
+        compiled = []
+        for rule in rules:
+            compiled.append((
+                frozenset(kw.lower() for kw in rule['keywords']),
+                rule.get('category'),
+                CategoryEngine._compile_first_match(rule.get('rules', [])),
+                rule.get('default'),
+            ))
+        return compiled
+
+    def matches(self, text):
+        """Return the set of keywords that occur anywhere in text"""
+        if not text or self._pattern is None:
+            return set()
+        found = set()
+        for longest in set(self._pattern.findall(str(text).lower())):
+            found |= self._implied[longest]
+        return found
+
+    def _category_counts(self, found):
+        counts = [0] * len(self._categories)
+        for kw in found:
+            for index in self._keyword_categories.get(kw, ()):
+                counts[index] += 1
+        return counts
+
+    def scores(self, text):
+        """Return {category: distinct keyword hits} for categories with hits"""
+        if self.mode != 'score':
+            raise ValueError(f"Ruleset {self.name} is not a scoring ruleset")
+        counts = self._category_counts(self.matches(text))
+        return {cat: n for cat, n in zip(self._categories, counts) if n}
+
+    def categorize(self, text):
+        """Return the category for a single text"""
+        if not text and self.empty is not None:
+            return self.empty
+        found = self.matches(text)
+
+        if self.mode == 'score':
+            # Strict > keeps the earliest category on ties, like max() over dict items
+            best_index, best_count = None, 0
+            for index, count in enumerate(self._category_counts(found)):
+                if count > best_count:
+                    best_index, best_count = index, count
+            return self._categories[best_index] if best_index is not None else self.default
+
+        return self._first_match(self._compiled_rules, found, self.default)
+
+    def _first_match(self, rules, found, default):
+        for keywords, category, children, child_default in rules:
+            if found & keywords:
+                if children:
+                    return self._first_match(children, found, child_default)
+                return category if category is not None else child_default
+        return default
+
+    def categorize_many(self, texts):
+        """Categorize an iterable (or pandas Series) of texts
+
+        Duplicate texts are only scanned once. A pandas Series comes back
+        as a Series on the same index.
+        """
+        cache = {}
+        results = []
+        for text in texts:
+            if text not in cache:
+                cache[text] = self.categorize(text)
+            results.append(cache[text])
+        if hasattr(texts, 'index') and hasattr(texts, 'map'):
+            return type(texts)(results, index=texts.index, name=getattr(texts, 'name', None))
+        return results
+
+
+_engines = {}
+
+
+def load_rules(path=RULES_FILE):
+    """Load all rulesets from the JSON rules file"""
+    with open(path, 'r') as f:
+        return json.load(f)['rulesets']
+
+
+def get_engine(name, path=RULES_FILE):
+    """Return the compiled engine for a ruleset, compiling it on first use"""
+    key = (path, name)
+    if key not in _engines:
+        rulesets = load_rules(path)
+        if name not in rulesets:
+            raise KeyError(f"Unknown categorization ruleset: {name}")
+        _engines[key] = CategoryEngine(name, rulesets[name])
+    return _engines[key]
+
+
+def categorize(ruleset, text):
+    """Categorize a single text with the named ruleset"""
+    return get_engine(ruleset).categorize(text)
+
+
+def categorize_many(ruleset, texts):
+    """Categorize a whole column of texts with the named ruleset"""
+    return get_engine(ruleset).categorize_many(texts)
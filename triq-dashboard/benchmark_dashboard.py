@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+TriQ Dashboard Query Benchmark
+
+Builds a scratch database from a synthetic log (about 1M log lines by
+default) plus a copy in the original one-table validations layout, then
+compares their sizes and times each dashboard API endpoint against the
+original SQL on the copy. The metrics the two share are checked for
+equality, and the first and last /api/tickets pages are timed to show
+that cursor paging does not slow down with depth, unfiltered or with
+several result values and a score range.
+
+Usage:
+    python3 benchmark_dashboard.py
+    python3 benchmark_dashboard.py --lines 3000000 --repeat 20
+"""
+
+import argparse
+import os
+import shutil
+import sqlite3
+import tempfile
+import time
+
+import benchmark_triq_db
+import dashboard
+import triq_db
+
+LATEST_RESULT = '''
+    timestamp = (
+        SELECT MAX(timestamp)
+        FROM validations v2
+        WHERE v2.ticket_key = v1.ticket_key
+          AND v2.validation_result IS NOT NULL
+    )
+'''
+
+# The queries dashboard.py ran against the original validations table
+LEGACY_QUERIES = {
+    '/api/metrics': [
+        'SELECT COUNT(DISTINCT ticket_key) FROM validations WHERE ticket_key != "SYSTEM"',
+        'SELECT AVG(total_score) FROM validations WHERE total_score IS NOT NULL',
+        f"SELECT COUNT(DISTINCT ticket_key) FROM validations v1 "
+        f"WHERE validation_result = 'PARKING_LOT' AND {LATEST_RESULT}",
+        f"SELECT COUNT(DISTINCT ticket_key) FROM validations v1 "
+        f"WHERE validation_result IN ('APPROVED', 'APPROVED_WITH_NOTES') AND {LATEST_RESULT}",
+        f"SELECT COUNT(DISTINCT ticket_key) FROM validations v1 "
+        f"WHERE validation_result = 'NEEDS_CLARIFICATION' AND {LATEST_RESULT}",
+    ],
+    '/api/tickets': ['''
+        SELECT v1.ticket_key, v1.timestamp, v1.total_score, v1.validation_result,
+               v1.routing_decision, v1.priority, v1.urgency, v1.impact, v1.evaluation_number
+        FROM validations v1
+        INNER JOIN (
+            SELECT ticket_key, MAX(timestamp) as max_timestamp
+            FROM validations
+            WHERE validation_result IS NOT NULL AND ticket_key != 'SYSTEM'
+            GROUP BY ticket_key
+        ) v2 ON v1.ticket_key = v2.ticket_key AND v1.timestamp = v2.max_timestamp
+        ORDER BY v1.timestamp DESC
+        LIMIT 50
+    '''],
+    '/api/ticket/EP-1': [
+        "SELECT * FROM validations WHERE ticket_key = 'EP-1' ORDER BY timestamp ASC",
+        '''
+        SELECT COUNT(*), MAX(total_score),
+               (SELECT validation_result FROM validations
+                WHERE ticket_key = 'EP-1' AND validation_result IS NOT NULL
+                ORDER BY timestamp DESC LIMIT 1)
+        FROM validations WHERE ticket_key = 'EP-1'
+        ''',
+    ],
+    '/api/health': ['SELECT COUNT(*) FROM validations'],
+    '/api/escalations': ['''
+        SELECT ticket_key, MAX(evaluation_number) as evaluation_count,
+               (SELECT total_score FROM validations v2
+                WHERE v2.ticket_key = v1.ticket_key AND total_score IS NOT NULL
+                ORDER BY timestamp DESC LIMIT 1) as latest_score,
+               (SELECT validation_result FROM validations v2
+                WHERE v2.ticket_key = v1.ticket_key AND validation_result IS NOT NULL
+                ORDER BY timestamp DESC LIMIT 1) as latest_result,
+               MIN(timestamp) as first_seen, MAX(timestamp) as last_seen
+        FROM validations v1
+        WHERE ticket_key != 'SYSTEM'
+        GROUP BY ticket_key
+        HAVING MAX(evaluation_number) >= 5
+        ORDER BY evaluation_count DESC, last_seen DESC
+    '''],
+}
+
+
+# The original single-table layout and its indexes
+LEGACY_INDEXES = [
+    'CREATE INDEX idx_ticket_key ON validations(ticket_key)',
+    'CREATE INDEX idx_timestamp ON validations(timestamp)',
+    'CREATE INDEX idx_total_score ON validations(total_score)',
+    'CREATE INDEX idx_validation_result ON validations(validation_result)',
+]
+
+
+def build_legacy_copy(db_file, legacy_file):
+    """Copy every log line into a database with the original layout"""
+    conn = sqlite3.connect(legacy_file)
+    conn.execute("ATTACH DATABASE ? AS current", (db_file,))
+    conn.execute('''
+        CREATE TABLE validations AS
+        SELECT *, CURRENT_TIMESTAMP AS created_at FROM current.validations
+    ''')
+    for statement in LEGACY_INDEXES:
+        conn.execute(statement)
+    conn.commit()
+    conn.execute('DETACH DATABASE current')
+    conn.execute('VACUUM')
+    conn.close()
+
+
+def time_legacy(db_file, queries, repeat):
+    conn = sqlite3.connect(db_file)
+    start = time.perf_counter()
+    for _ in range(repeat):
+        results = [conn.execute(sql).fetchall() for sql in queries]
+    elapsed = (time.perf_counter() - start) / repeat
+    conn.close()
+    return results, elapsed
+
+
+def time_endpoint(client, path, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        response = client.get(path)
+    elapsed = (time.perf_counter() - start) / repeat
+    return response.get_json(), elapsed
+
+
+def time_pages(limit, repeat, **query):
+    """Walk every /api/tickets page, then time the first and the last"""
+    db = dashboard.open_db()
+    cursors = [None]
+    while True:
+        _, cursor = dashboard.query_tickets(db, limit, cursor=cursors[-1], **query)
+        if cursor is None:
+            break
+        cursors.append(cursor)
+
+    timings = []
+    for cursor in (cursors[0], cursors[-1]):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            dashboard.query_tickets(db, limit, cursor=cursor, **query)
+        timings.append((time.perf_counter() - start) / repeat)
+    db.close()
+    return len(cursors), timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark TriQ dashboard queries')
+    parser.add_argument('--lines', type=int, default=1_050_000, help='Synthetic log size in lines')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed runs per query')
+    parser.add_argument('--keep', action='store_true', help='Keep the scratch log and database')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='triq-dash-bench-')
+    log_file = os.path.join(workdir, 'triq-monitor.log')
+    db_file = os.path.join(workdir, 'triq.db')
+    legacy_file = os.path.join(workdir, 'legacy.db')
+
+    try:
+        print("📝 Building scratch database...")
+        benchmark_triq_db.write_synthetic_log(log_file, args.lines)
+        conn = triq_db.create_database(db_file)
+        triq_db.parse_log_file(conn, log_file)
+        rows = triq_db.count_log_lines(conn)
+        tickets = conn.execute('SELECT COUNT(*) FROM ticket_state').fetchone()[0]
+        conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        conn.close()
+        build_legacy_copy(db_file, legacy_file)
+        print(f"✓ {rows:,} log lines, {tickets:,} tickets")
+        print(f"  Database size: {os.path.getsize(db_file) / 1024 / 1024:.0f} MB "
+              f"(original layout: {os.path.getsize(legacy_file) / 1024 / 1024:.0f} MB)")
+        print()
+
+        dashboard.DB_FILE = db_file
+        client = dashboard.app.test_client()
+
+        print("📊 Results (mean per request):")
+        print("-" * 60)
+        print(f"  {'Endpoint':<20} {'Legacy SQL':>12} {'Current':>14} {'Speedup':>9}")
+        ok = True
+        for path, queries in LEGACY_QUERIES.items():
+            legacy, legacy_time = time_legacy(legacy_file, queries, args.repeat)
+            current, current_time = time_endpoint(client, path, args.repeat)
+            print(f"  {path:<20} {legacy_time * 1000:>10.1f}ms {current_time * 1000:>12.1f}ms "
+                  f"{legacy_time / current_time:>8.1f}x")
+
+            if path == '/api/metrics':
+                expected = [legacy[0][0][0], round(legacy[1][0][0], 2),
+                            legacy[2][0][0], legacy[3][0][0], legacy[4][0][0]]
+                actual = [current[key] for key in ('total_tickets', 'avg_score', 'parking_lot',
+                                                   'approved', 'needs_clarification')]
+                ok = ok and expected == actual
+
+        print("  Legacy SQL is query time only; Current is the full request through Flask.")
+
+        pages, (first, last) = time_pages(50, args.repeat * 20)
+        print(f"  /api/tickets paging: page 1 {first * 1000:.2f}ms, "
+              f"page {pages} {last * 1000:.2f}ms")
+        # Several values per filter plus a score range: a sort bounded to the page
+        pages, (first, last) = time_pages(50, args.repeat * 20, min_score=7,
+                                          filters={'validation_result': ['APPROVED', 'NEEDS_CLARIFICATION']})
+        print(f"  /api/tickets?result=APPROVED&result=NEEDS_CLARIFICATION&min_score=7: "
+              f"page 1 {first * 1000:.2f}ms, page {pages} {last * 1000:.2f}ms")
+        print()
+        print("✅ Metrics match the legacy queries" if ok else "❌ Metrics differ from the legacy queries")
+        if not ok:
+            raise SystemExit(1)
+    finally:
+        if args.keep:
+            print(f"\nKept scratch files in {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
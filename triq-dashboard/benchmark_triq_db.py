@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+TriQ Log Parser Benchmark
+
+Writes a synthetic triq-monitor.log in the monitor's format, then times
+parsing alone, a full rebuild into a scratch database, and a steady-state
+re-run, reporting lines/second. With --workers, the parallel chunked
+parser is timed too and its rows are checked against the serial rebuild.
+
+Parallel parsing only spreads the parse itself. Workers pickle their
+rows back to the parent, which unpickles them and is the only writer, so
+the benchmark also times those steps and prints the speedup they allow
+on this machine and on one with a core per worker.
+
+Usage:
+    python3 benchmark_triq_db.py
+    python3 benchmark_triq_db.py --lines 5000000 --keep
+    python3 benchmark_triq_db.py --workers 2 4 8
+"""
+
+import argparse
+import os
+import pickle
+import random
+import shutil
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import triq_db
+
+CATEGORIES = [
+    ('SUMMARY', 'Length and specificity assessment', 25),
+    ('DESCRIPTION', 'Structure and content quality', 35),
+    ('TECHNICAL', 'Environment and reproduction details', 20),
+    ('BUSINESS', 'Business impact assessment', 15),
+    ('METADATA', 'Priority validation using business operations matrix', 5),
+]
+RESULTS = [('PARKING_LOT', 'Parking Lot'), ('NEEDS_CLARIFICATION', 'Needs Clarification'),
+           ('APPROVED', 'Ready for Engineering')]
+
+
+def evaluation_block(rng, ts, ticket, evaluation):
+    """One ticket validation as triq-monitor.sh logs it"""
+    stamp = ts.strftime('%Y-%m-%d %H:%M:%S')
+    urgency, impact = rng.choice(['Low', 'Medium', 'High']), rng.choice(['Low', 'Medium', 'High'])
+    lines = [
+        f"[{stamp}] Processing ticket: {ticket}",
+        f"[{stamp}] Validating ticket: {ticket}",
+        f"[{stamp}] Evaluation count for {ticket}: {evaluation}",
+        f"[{stamp}] [{ticket}] [VALIDATION] [INFO] === Starting Validation (Evaluation #{evaluation}) ===",
+        f"[{stamp}] [{ticket}] [METADATA] [INFO] Priority: , Type: Ask a question",
+        f"[{stamp}] [{ticket}] [PRIORITY] [INFO] Urgency: {urgency}, Impact: {impact}",
+        f"[{stamp}] [{ticket}] [PRIORITY] [INFO] Calculated Priority: 3, Assigned Priority: 3",
+    ]
+    total = 0.0
+    for category, reasoning, weight in CATEGORIES:
+        score = rng.randint(0, 10)
+        total += score * weight / 100
+        lines.append(f"[{stamp}] [{ticket}] [{category}] [DEBUG] Length Check: PASS "
+                     f"(Score: {score}/10) - Good length ({rng.randint(5, 200)} chars)")
+        lines.append(f"[{stamp}] [{ticket}] [{category}] [INFO] Category Score: {score}/10 "
+                     f"(Weighted: {score * weight / 100:.2f}/{weight / 10:.2f}) - {reasoning}")
+    result, decision = RESULTS[0] if total < 5 else rng.choice(RESULTS[1:])
+    lines += [
+        f"[{stamp}] [{ticket}] [VALIDATION] [INFO] === Final Score: {total:.2f}/10.0 ({result}) ===",
+        f"[{stamp}] [{ticket}] [ROUTING] [INFO] Decision: {decision} (Score threshold: 5.0)",
+        f"[{stamp}] [{ticket}] [FEEDBACK] [INFO] Template: {result}",
+        f"[{stamp}] [{ticket}] [FEEDBACK] [DEBUG] > Quality Score: {total:.2f}/10",
+        f"[{stamp}] Routing applied successfully for {ticket}",
+        "Type   Key   Assignee   Priority   Status   Summary",
+    ]
+    return lines
+
+
+def write_synthetic_log(path, line_count, tickets=2000, seed=7):
+    """Write roughly line_count lines of monitor output to path"""
+    rng = random.Random(seed)
+    ts = datetime(2025, 10, 1)
+    evaluations = {}
+    written = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        while written < line_count:
+            ticket = f"EP-{rng.randint(1, tickets)}"
+            evaluations[ticket] = evaluations.get(ticket, 0) + 1
+            ts += timedelta(seconds=rng.randint(1, 30))
+            block = evaluation_block(rng, ts, ticket, evaluations[ticket])
+            f.write('\n'.join(block) + '\n')
+            written += len(block)
+    return written
+
+
+def parsed_rows(conn):
+    """All log lines in the original validations row shape"""
+    return conn.execute("SELECT * FROM validations ORDER BY id").fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the TriQ log parser')
+    parser.add_argument('--lines', type=int, default=2_000_000, help='Synthetic log size in lines')
+    parser.add_argument('--keep', action='store_true', help='Keep the scratch log and database')
+    parser.add_argument('--workers', type=int, nargs='*', default=[],
+                        help='Also time parallel parsing with these worker counts')
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='triq-bench-')
+    log_file = os.path.join(workdir, 'triq-monitor.log')
+    db_file = os.path.join(workdir, 'triq.db')
+
+    try:
+        print("📝 Writing synthetic log...")
+        lines = write_synthetic_log(log_file, args.lines)
+        size_mb = os.path.getsize(log_file) / 1024 / 1024
+        print(f"✓ {lines:,} lines ({size_mb:.0f} MB) in {log_file}")
+        print()
+
+        log_parser = triq_db.LogParser()
+        start = time.perf_counter()
+        with open(log_file, 'r', encoding='utf-8', errors='ignore') as f:
+            parsed = [row for row in map(log_parser.parse_line, f) if row]
+        parse_time = time.perf_counter() - start
+        rows = len(parsed)
+
+        # What a pool adds: workers pickle their rows, the parent unpickles them
+        start = time.perf_counter()
+        blob = pickle.dumps(parsed, pickle.HIGHEST_PROTOCOL)
+        dumps_time = time.perf_counter() - start
+        start = time.perf_counter()
+        pickle.loads(blob)
+        loads_time = time.perf_counter() - start
+        del parsed, blob
+
+        conn = triq_db.create_database(db_file)
+        start = time.perf_counter()
+        inserted = triq_db.parse_log_file(conn, log_file)
+        rebuild_time = time.perf_counter() - start
+
+        # Steady state: nothing appended since the rebuild
+        start = time.perf_counter()
+        triq_db.ingest(conn, log_file, verbose=False)
+        rerun_time = time.perf_counter() - start
+        serial_rows = parsed_rows(conn)
+        conn.close()
+
+        parallel = []
+        for workers in args.workers:
+            stats = {'lines': 0, 'parsed': 0, 'errors': 0}
+            start = time.perf_counter()
+            triq_db.parse_log_range_parallel(None, log_file, 0, triq_db.LogParser(), stats, workers)
+            parse_parallel = time.perf_counter() - start
+
+            parallel_db = os.path.join(workdir, f'triq-{workers}.db')
+            conn = triq_db.create_database(parallel_db)
+            start = time.perf_counter()
+            triq_db.parse_log_file(conn, log_file, workers=workers)
+            rebuild_parallel = time.perf_counter() - start
+            identical = parsed_rows(conn) == serial_rows
+            conn.close()
+            parallel.append((workers, parse_parallel, rebuild_parallel, identical))
+
+        print()
+        print("📊 Results:")
+        print("-" * 60)
+        print(f"  Parse only:    {parse_time:7.2f}s  {lines / parse_time:>12,.0f} lines/s  ({rows:,} rows)")
+        print(f"  Rebuild:       {rebuild_time:7.2f}s  {lines / rebuild_time:>12,.0f} lines/s  ({inserted:,} rows)")
+        print(f"  Re-run:        {rerun_time:7.3f}s  (no new lines)")
+        print(f"  Database size: {os.path.getsize(db_file) / 1024 / 1024:.0f} MB")
+        for workers, parse_parallel, rebuild_parallel, identical in parallel:
+            print(f"  {workers:>2} workers:    parse {parse_parallel:6.2f}s ({parse_time / parse_parallel:4.1f}x)  "
+                  f"rebuild {rebuild_parallel:6.2f}s ({rebuild_time / rebuild_parallel:4.1f}x)  "
+                  f"{'✅ identical' if identical else '❌ rows differ'}")
+        if parallel:
+            # Parent-only work (unpickling, inserts) does not shrink with more workers
+            write_time = max(rebuild_time - parse_time, 0)
+            cpus = os.cpu_count() or 1
+            print(f"  Serial share:  pickle {dumps_time:.2f}s in workers, unpickle {loads_time:.2f}s "
+                  f"+ inserts {write_time:.2f}s in the one writer")
+            for workers, *_ in parallel:
+                for cores in sorted({min(workers, cpus), workers}):
+                    spread = (parse_time + dumps_time) / cores
+                    print(f"  {workers:>2} workers on {cores} CPU{'s' if cores > 1 else ''}: at most "
+                          f"parse {parse_time / (spread + loads_time):4.1f}x, "
+                          f"rebuild {rebuild_time / (spread + loads_time + write_time):4.1f}x")
+        if not all(identical for *_, identical in parallel):
+            raise SystemExit("❌ Parallel parse differs from serial rebuild")
+    finally:
+        if args.keep:
+            print(f"\nKept scratch files in {workdir}")
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
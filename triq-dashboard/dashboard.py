@@ -5,36 +5,386 @@ TriQ Dashboard - Flask web application for monitoring TriQ validation logs
 Provides a clean web interface to view validation metrics, ticket scores,
 and system activity from the TriQ triage automation system.
 
+Cards and ticket lists read the ticket_state table that triq_db.py keeps
+up to date, so they are indexed lookups however large the log grows. API
+responses are cached until the next ingest and support ETag/304, and
+/api/stream pushes updates to open dashboards as soon as data is ingested.
+
 Usage:
     python3 dashboard.py
 
 Then open: http://localhost:5000
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import (Flask, Response, g, render_template, jsonify, request, make_response,
+                   stream_with_context)
+import base64
+import json
+import queue
 import sqlite3
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import wraps
+
+from triq_db import count_log_lines, last_validation_id, read_generation, read_rebuilds, ticket_history
 
 app = Flask(__name__)
 
 # Configuration
 DB_FILE = 'triq.db'
 PORT = 5001
+RESPONSE_CACHE_SIZE = 256  # cached API responses (one per URL)
+MAX_TICKET_LIMIT = 500  # largest /api/tickets page
+ESCALATION_THRESHOLD = 5  # evaluations before a ticket needs manual review
+DB_POOL_SIZE = 16  # idle read-only connections kept open
+DB_CACHE_KB = 16384  # SQLite page cache per connection
+DB_MMAP_BYTES = 256 * 1024 * 1024  # memory-map this much of the database file
+STATEMENT_CACHE_SIZE = 64  # prepared statements kept per connection
+STREAM_POLL_INTERVAL = 0.5  # seconds between checks for newly ingested data
+STREAM_KEEPALIVE = 15  # seconds between keepalive comments on idle streams
+STREAM_RETRY_MS = 3000  # browser reconnect delay after a dropped stream
+STREAM_QUEUE_SIZE = 100  # pending messages per client before it is reset
+
+def open_db():
+    """
+    Open a read-only connection tuned for dashboard queries
 
-def get_db():
-    """Get database connection with row factory for dict-like access"""
-    if not os.path.exists(DB_FILE):
-        return None
-
-    conn = sqlite3.connect(DB_FILE)
+    The ingester owns writes and keeps the database in WAL mode, so
+    readers never block it. query_only guards against accidental writes;
+    repeated SQL reuses the connection's prepared statement cache.
+    """
+    conn = sqlite3.connect(DB_FILE, check_same_thread=False,
+                           cached_statements=STATEMENT_CACHE_SIZE)
     conn.row_factory = sqlite3.Row
+    conn.execute('PRAGMA query_only = ON')
+    conn.execute(f'PRAGMA cache_size = -{DB_CACHE_KB}')
+    conn.execute(f'PRAGMA mmap_size = {DB_MMAP_BYTES}')
     return conn
 
+# Idle read-only connections, reused across requests and threads
+_db_pool = queue.LifoQueue(maxsize=DB_POOL_SIZE)
+
+def acquire_db():
+    """Take a pooled connection, opening one if the pool is empty"""
+    try:
+        return _db_pool.get_nowait()
+    except queue.Empty:
+        if not os.path.exists(DB_FILE):
+            return None
+        return open_db()
+
+def release_db(conn):
+    """Return a connection to the pool, closing it if the pool is full"""
+    try:
+        _db_pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+def get_db():
+    """
+    Get this request's database connection, or None if there is no database
+
+    The connection comes from the pool and goes back when the request ends.
+    """
+    if 'db' not in g:
+        g.db = acquire_db()
+    return g.db
+
+@app.teardown_appcontext
+def return_db(error):
+    """Hand the request's connection back to the pool"""
+    db = g.pop('db', None)
+    if db is not None:
+        if error is None:
+            release_db(db)
+        else:
+            db.close()
+
 def dict_from_row(row):
     """Convert sqlite3.Row to dictionary"""
     return dict(zip(row.keys(), row)) if row else None
 
+def compute_metrics(db):
+    """Dashboard card figures, all read from ticket_state"""
+    total, score_sum, score_count = db.execute('''
+        SELECT COUNT(*), TOTAL(score_sum), TOTAL(score_count)
+        FROM ticket_state
+    ''').fetchone()
+    avg_score = round(score_sum / score_count, 2) if score_count else 0
+
+    # Count by latest validation result
+    results = dict(db.execute('''
+        SELECT validation_result, COUNT(*)
+        FROM ticket_state
+        WHERE validation_result IS NOT NULL
+        GROUP BY validation_result
+    ''').fetchall())
+
+    return {
+        'total_tickets': total,
+        'avg_score': avg_score,
+        'parking_lot': results.get('PARKING_LOT', 0),
+        'approved': results.get('APPROVED', 0) + results.get('APPROVED_WITH_NOTES', 0),
+        'needs_clarification': results.get('NEEDS_CLARIFICATION', 0)
+    }
+
+# ticket_state columns in the shape /api/tickets returns
+TICKET_COLUMNS = '''
+    ticket_key,
+    last_validated,
+    total_score,
+    validation_result,
+    routing_decision,
+    priority,
+    urgency,
+    impact,
+    evaluation_number as evaluation_count
+'''
+
+# /api/tickets filter params and the ticket_state columns they match
+TICKET_FILTERS = {
+    'result': 'validation_result',
+    'priority': 'priority',
+    'urgency': 'urgency',
+}
+
+def encode_cursor(row):
+    """Opaque /api/tickets cursor for the page after row"""
+    raw = json.dumps([row['last_validated'], row['ticket_key']])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """(last_validated, ticket_key) from a cursor; ValueError if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        last_validated, ticket_key = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError('Invalid cursor')
+    if not isinstance(last_validated, str) or not isinstance(ticket_key, str):
+        raise ValueError('Invalid cursor')
+    return last_validated, ticket_key
+
+def query_tickets(db, limit, cursor=None, filters=None, min_score=None, max_score=None):
+    """
+    One page of ticket_state rows, newest validation first
+
+    Pages are keyed on (last_validated, ticket_key) rather than OFFSET, so
+    a deep page is the same index range scan as the first. filters maps a
+    ticket_state column to the values it may take; with several values
+    SQLite sorts, but only a page's worth of rows (see TICKET_STATE_INDEXES
+    in triq_db.py).
+
+    Returns (rows, next_cursor); next_cursor is None on the last page.
+    """
+    where = ['last_validated IS NOT NULL']
+    params = []
+    for column, values in (filters or {}).items():
+        if values:
+            where.append(f"{column} IN ({', '.join('?' * len(values))})")
+            params += values
+    if min_score is not None:
+        where.append('total_score >= ?')
+        params.append(min_score)
+    if max_score is not None:
+        where.append('total_score <= ?')
+        params.append(max_score)
+    if cursor:
+        where.append('(last_validated, ticket_key) < (?, ?)')
+        params += decode_cursor(cursor)
+
+    # One extra row tells us whether there is a next page
+    rows = db.execute(f'''
+        SELECT {TICKET_COLUMNS}
+        FROM ticket_state
+        WHERE {' AND '.join(where)}
+        ORDER BY last_validated DESC, ticket_key DESC
+        LIMIT ?
+    ''', params + [limit + 1]).fetchall()
+
+    if len(rows) > limit:
+        return rows[:limit], encode_cursor(rows[limit - 1])
+    return rows, None
+
+# ============================================================================
+# RESPONSE CACHE
+# ============================================================================
+
+# URL -> (etag, last_modified, body, headers) of the last 200 response
+_response_cache = {}
+_response_cache_lock = threading.Lock()
+
+def data_version():
+    """Return (etag, last_modified) for the current log data, or None"""
+    db = get_db()
+    if not db:
+        return None
+    try:
+        generation, updated_at = read_generation(db)
+    except sqlite3.Error:
+        return None
+
+    if updated_at is None:
+        return str(generation), None
+    modified = datetime.strptime(updated_at, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+    # The timestamp keeps ETags from a rebuilt database from matching old ones
+    return f"{generation}-{int(modified.timestamp())}", modified
+
+def cached_json(view):
+    """
+    Serve a JSON endpoint from cache until triq_db.py ingests new data
+
+    Responses carry ETag and Last-Modified, and clients that send them back
+    get a 304 without the endpoint running. Only 200 responses are cached.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        version = data_version()
+        if version is None:
+            return view(*args, **kwargs)
+        etag, modified = version
+
+        key = request.full_path
+        with _response_cache_lock:
+            cached = _response_cache.get(key)
+
+        if cached and cached[0] == etag:
+            response = app.response_class(cached[2], headers=cached[3])
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200:
+                return response
+            with _response_cache_lock:
+                _response_cache.pop(key, None)
+                if len(_response_cache) >= RESPONSE_CACHE_SIZE:
+                    _response_cache.pop(next(iter(_response_cache)))
+                _response_cache[key] = (etag, modified, response.get_data(),
+                                        response.headers.copy())
+
+        response.set_etag(etag)
+        if modified:
+            response.last_modified = modified
+        # Browsers may keep the body but must revalidate before using it
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    return wrapper
+
+# ============================================================================
+# LIVE UPDATES (SERVER-SENT EVENTS)
+# ============================================================================
+
+def sse_message(event, data, event_id=None):
+    """Format one server-sent event"""
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    lines += [f"event: {event}", f"data: {json.dumps(data)}"]
+    return '\n'.join(lines) + '\n\n'
+
+class StreamBroker:
+    """
+    Fan ingest updates out to every /api/stream subscriber
+
+    A single watcher thread polls data_generation while anyone is
+    subscribed. When triq_db.py commits, it computes the new metrics and
+    the tickets whose results changed once, and queues the same messages
+    for every client.
+    """
+
+    def __init__(self):
+        self.subscribers = set()
+        self.lock = threading.Lock()
+        self.watcher = None
+        self.generation = None
+        self.metrics = None
+        self.rebuilds = None
+        self.last_id = None
+
+    def subscribe(self):
+        subscriber = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+        with self.lock:
+            self.subscribers.add(subscriber)
+            if self.watcher is None:
+                self.watcher = threading.Thread(target=self._watch, daemon=True)
+                self.watcher.start()
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.discard(subscriber)
+
+    def publish(self, message):
+        with self.lock:
+            subscribers = list(self.subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(message)
+            except queue.Full:
+                # Client fell behind: drop its backlog and have it reload
+                while not subscriber.empty():
+                    subscriber.get_nowait()
+                subscriber.put_nowait(sse_message('reset', {}))
+
+    def _watch(self):
+        db = None
+        while True:
+            with self.lock:
+                if not self.subscribers:
+                    self.watcher = None
+                    break
+            try:
+                if db is None and os.path.exists(DB_FILE):
+                    db = open_db()
+                if db is not None:
+                    self._check(db)
+            except sqlite3.Error as e:
+                print(f"⚠️  Stream watcher: {e}")
+                if db is not None:
+                    db.close()
+                db = None
+            time.sleep(STREAM_POLL_INTERVAL)
+        if db is not None:
+            db.close()
+
+    def _check(self, db):
+        generation, _ = read_generation(db)
+        if generation == self.generation:
+            return
+
+        metrics = compute_metrics(db)
+        rebuilds = read_rebuilds(db)
+        last_id = last_validation_id(db)
+        if self.generation is not None:
+            delta = {k: v for k, v in metrics.items() if self.metrics.get(k) != v}
+            if delta:
+                self.publish(sse_message('metrics', delta, generation))
+            if rebuilds != self.rebuilds or generation < self.generation:
+                # Rebuilt (or replaced) since the last check; ids no longer line up
+                self.publish(sse_message('reset', {}, generation))
+            else:
+                tickets = changed_tickets(db, self.last_id)
+                if tickets:
+                    self.publish(sse_message('tickets', tickets, generation))
+
+        self.generation, self.metrics, self.rebuilds, self.last_id = generation, metrics, rebuilds, last_id
+
+def changed_tickets(db, since_id):
+    """Ticket rows whose score, result or routing changed after since_id"""
+    rows = db.execute(f'''
+        SELECT {TICKET_COLUMNS}
+        FROM ticket_state
+        WHERE ticket_key IN (
+            SELECT t.ticket_key
+            FROM events e
+            JOIN tickets t ON t.id = e.ticket_id
+            WHERE e.id > ? AND (e.result_id IS NOT NULL OR e.routing_id IS NOT NULL)
+        )
+        ORDER BY last_validated DESC
+    ''', (since_id,)).fetchall()
+    return [dict_from_row(row) for row in rows]
+
+broker = StreamBroker()
+
 # ============================================================================
 # WEB ROUTES
 # ============================================================================
@@ -49,6 +399,7 @@ def index():
 # ============================================================================
 
 @app.route('/api/metrics')
+@cached_json
 def get_metrics():
     """
     Get high-level metrics for dashboard cards
@@ -74,78 +425,25 @@ def get_metrics():
         }), 404
 
     try:
-        # Total unique tickets
-        total = db.execute(
-            'SELECT COUNT(DISTINCT ticket_key) FROM validations WHERE ticket_key != "SYSTEM"'
-        ).fetchone()[0]
-
-        # Average score from final validations
-        avg_score_result = db.execute('''
-            SELECT AVG(total_score)
-            FROM validations
-            WHERE total_score IS NOT NULL
-        ''').fetchone()[0]
-        avg_score = round(avg_score_result, 2) if avg_score_result else 0
-
-        # Count by validation result (get latest per ticket)
-        parking_lot = db.execute('''
-            SELECT COUNT(DISTINCT ticket_key)
-            FROM validations v1
-            WHERE validation_result = 'PARKING_LOT'
-              AND timestamp = (
-                  SELECT MAX(timestamp)
-                  FROM validations v2
-                  WHERE v2.ticket_key = v1.ticket_key
-                    AND v2.validation_result IS NOT NULL
-              )
-        ''').fetchone()[0]
-
-        approved = db.execute('''
-            SELECT COUNT(DISTINCT ticket_key)
-            FROM validations v1
-            WHERE validation_result IN ('APPROVED', 'APPROVED_WITH_NOTES')
-              AND timestamp = (
-                  SELECT MAX(timestamp)
-                  FROM validations v2
-                  WHERE v2.ticket_key = v1.ticket_key
-                    AND v2.validation_result IS NOT NULL
-              )
-        ''').fetchone()[0]
-
-        needs_clarification = db.execute('''
-            SELECT COUNT(DISTINCT ticket_key)
-            FROM validations v1
-            WHERE validation_result = 'NEEDS_CLARIFICATION'
-              AND timestamp = (
-                  SELECT MAX(timestamp)
-                  FROM validations v2
-                  WHERE v2.ticket_key = v1.ticket_key
-                    AND v2.validation_result IS NOT NULL
-              )
-        ''').fetchone()[0]
-
-        db.close()
-
-        return jsonify({
-            'total_tickets': total,
-            'avg_score': avg_score,
-            'parking_lot': parking_lot,
-            'approved': approved,
-            'needs_clarification': needs_clarification
-        })
+        metrics = compute_metrics(db)
+        return jsonify(metrics)
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/tickets')
+@cached_json
 def get_tickets():
     """
     Get list of tickets with their latest validation results
 
     Query params:
-        limit: Maximum number of tickets to return (default: 50)
+        limit: Maximum number of tickets to return (default: 50, max: 500)
+        cursor: X-Next-Cursor from the previous page
+        result, priority, urgency: Only these values (repeatable)
+        min_score, max_score: Latest score range (inclusive)
 
-    Returns:
+    Returns (newest first; X-Next-Cursor header when more pages follow):
         [{
             "ticket_key": str,
             "last_validated": str,
@@ -162,43 +460,30 @@ def get_tickets():
     if not db:
         return jsonify({'error': 'Database not found'}), 404
 
-    limit = request.args.get('limit', 50, type=int)
+    limit = max(1, min(request.args.get('limit', 50, type=int), MAX_TICKET_LIMIT))
+    filters = {column: request.args.getlist(param) for param, column in TICKET_FILTERS.items()}
 
     try:
-        # Get latest validation for each ticket
-        tickets = db.execute('''
-            SELECT
-                v1.ticket_key,
-                v1.timestamp as last_validated,
-                v1.total_score,
-                v1.validation_result,
-                v1.routing_decision,
-                v1.priority,
-                v1.urgency,
-                v1.impact,
-                v1.evaluation_number as evaluation_count
-            FROM validations v1
-            INNER JOIN (
-                SELECT ticket_key, MAX(timestamp) as max_timestamp
-                FROM validations
-                WHERE validation_result IS NOT NULL
-                  AND ticket_key != 'SYSTEM'
-                GROUP BY ticket_key
-            ) v2 ON v1.ticket_key = v2.ticket_key
-                AND v1.timestamp = v2.max_timestamp
-            ORDER BY v1.timestamp DESC
-            LIMIT ?
-        ''', (limit,)).fetchall()
-
-        result = [dict_from_row(t) for t in tickets]
-        db.close()
-
-        return jsonify(result)
-
+        tickets, next_cursor = query_tickets(
+            db, limit,
+            cursor=request.args.get('cursor'),
+            filters=filters,
+            min_score=request.args.get('min_score', type=float),
+            max_score=request.args.get('max_score', type=float),
+        )
+
+        response = jsonify([dict_from_row(t) for t in tickets])
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+        return response
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/ticket/<ticket_key>')
+@cached_json
 def get_ticket_detail(ticket_key):
     """
     Get detailed validation history for a specific ticket
@@ -218,33 +503,17 @@ def get_ticket_detail(ticket_key):
 
     try:
         # Get all validation events for this ticket
-        events = db.execute('''
-            SELECT *
-            FROM validations
-            WHERE ticket_key = ?
-            ORDER BY timestamp ASC
-        ''', (ticket_key,)).fetchall()
+        events = ticket_history(db, ticket_key)
 
         if not events:
-            db.close()
             return jsonify({'error': 'Ticket not found'}), 404
 
         # Get summary
         summary = db.execute('''
-            SELECT
-                COUNT(*) as total_validations,
-                MAX(total_score) as latest_score,
-                (SELECT validation_result
-                 FROM validations
-                 WHERE ticket_key = ?
-                   AND validation_result IS NOT NULL
-                 ORDER BY timestamp DESC
-                 LIMIT 1) as latest_result
-            FROM validations
+            SELECT event_count, total_score, validation_result
+            FROM ticket_state
             WHERE ticket_key = ?
-        ''', (ticket_key, ticket_key)).fetchone()
-
-        db.close()
+        ''', (ticket_key,)).fetchone() or (len(events), None, None)
 
         return jsonify({
             'ticket_key': ticket_key,
@@ -257,11 +526,54 @@ def get_ticket_detail(ticket_key):
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+def has_evaluation_store(db):
+    return db.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'evaluation_counts'"
+    ).fetchone() is not None
+
+
+def query_store_escalations(db):
+    """Escalated tickets from the evaluation store, history included"""
+    escalations = [dict_from_row(e) for e in db.execute('''
+        SELECT
+            c.ticket_key,
+            c.evaluation_count,
+            s.total_score as latest_score,
+            s.validation_result as latest_result,
+            s.first_seen,
+            s.last_seen,
+            c.first_evaluated,
+            c.last_evaluated
+        FROM evaluation_counts c
+        LEFT JOIN ticket_state s ON s.ticket_key = c.ticket_key
+        WHERE c.evaluation_count >= ?
+        ORDER BY c.evaluation_count DESC, c.last_evaluated DESC
+    ''', (ESCALATION_THRESHOLD,))]
+
+    history = {e['ticket_key']: [] for e in escalations}
+    rows = db.execute('''
+        SELECT ticket_key, evaluation_number, evaluated_at
+        FROM evaluation_history
+        WHERE ticket_key IN (SELECT value FROM json_each(?))
+        ORDER BY ticket_key, evaluation_number
+    ''', (json.dumps(list(history)),))
+    for key, number, evaluated_at in rows:
+        history[key].append({'evaluation_number': number, 'evaluated_at': evaluated_at})
+
+    for e in escalations:
+        e['history'] = history[e['ticket_key']]
+    return escalations
+
 @app.route('/api/escalations')
+@cached_json
 def get_escalations():
     """
     Get tickets requiring manual intervention (5+ evaluations)
 
+    Counts come from the evaluation store triq_monitor.py keeps in
+    triq.db, with each ticket's evaluation history. Databases without the
+    store fall back to the evaluation numbers parsed from the log.
+
     Returns:
         [{
             "ticket_key": str,
@@ -269,7 +581,10 @@ def get_escalations():
             "latest_score": float,
             "latest_result": str,
             "first_seen": str,
-            "last_seen": str
+            "last_seen": str,
+            "first_evaluated": str,      # evaluation store only
+            "last_evaluated": str,       # evaluation store only
+            "history": [{"evaluation_number": int, "evaluated_at": str}]
         }]
     """
     db = get_db()
@@ -277,39 +592,68 @@ def get_escalations():
         return jsonify({'error': 'Database not found'}), 404
 
     try:
+        if has_evaluation_store(db):
+            return jsonify(query_store_escalations(db))
+
         escalations = db.execute('''
             SELECT
                 ticket_key,
-                MAX(evaluation_number) as evaluation_count,
-                (SELECT total_score
-                 FROM validations v2
-                 WHERE v2.ticket_key = v1.ticket_key
-                   AND total_score IS NOT NULL
-                 ORDER BY timestamp DESC
-                 LIMIT 1) as latest_score,
-                (SELECT validation_result
-                 FROM validations v2
-                 WHERE v2.ticket_key = v1.ticket_key
-                   AND validation_result IS NOT NULL
-                 ORDER BY timestamp DESC
-                 LIMIT 1) as latest_result,
-                MIN(timestamp) as first_seen,
-                MAX(timestamp) as last_seen
-            FROM validations v1
-            WHERE ticket_key != 'SYSTEM'
-            GROUP BY ticket_key
-            HAVING MAX(evaluation_number) >= 5
+                max_evaluation as evaluation_count,
+                total_score as latest_score,
+                validation_result as latest_result,
+                first_seen,
+                last_seen
+            FROM ticket_state
+            WHERE max_evaluation >= ?
             ORDER BY evaluation_count DESC, last_seen DESC
-        ''').fetchall()
+        ''', (ESCALATION_THRESHOLD,)).fetchall()
 
         result = [dict_from_row(e) for e in escalations]
-        db.close()
 
         return jsonify(result)
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/stream')
+def stream():
+    """
+    Server-sent events with live updates as triq_db.py ingests
+
+    Events:
+        metrics  - Changed metric fields (the first one has all of them)
+        tickets  - Rows in /api/tickets shape for tickets with new results
+        reset    - Reload everything from the REST endpoints
+    """
+    subscriber = broker.subscribe()
+
+    # Borrow a connection for the snapshot only, not the stream's lifetime
+    db = acquire_db()
+    try:
+        initial = compute_metrics(db) if db else None
+    except sqlite3.Error:
+        initial = None
+    finally:
+        if db:
+            release_db(db)
+
+    def events():
+        try:
+            yield f"retry: {STREAM_RETRY_MS}\n\n"
+            if initial is not None:
+                yield sse_message('metrics', initial)
+            while True:
+                try:
+                    yield subscriber.get(timeout=STREAM_KEEPALIVE)
+                except queue.Empty:
+                    # Comment line keeps proxies open and detects gone clients
+                    yield ": keepalive\n\n"
+        finally:
+            broker.unsubscribe(subscriber)
+
+    return Response(stream_with_context(events()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
 @app.route('/api/health')
 def health_check():
     """Health check endpoint"""
@@ -324,8 +668,7 @@ def health_check():
 
     db = get_db()
     try:
-        count = db.execute('SELECT COUNT(*) FROM validations').fetchone()[0]
-        db.close()
+        count = count_log_lines(db)
 
         return jsonify({
             'status': 'ok',
@@ -371,23 +714,20 @@ if __name__ == '__main__':
         print()
     else:
         # Show quick stats
-        db = get_db()
-        if db:
-            count = db.execute('SELECT COUNT(*) FROM validations').fetchone()[0]
-            tickets = db.execute(
-                'SELECT COUNT(DISTINCT ticket_key) FROM validations WHERE ticket_key != "SYSTEM"'
-            ).fetchone()[0]
-            db.close()
+        db = open_db()
+        count = count_log_lines(db)
+        tickets = db.execute('SELECT COUNT(*) FROM ticket_state').fetchone()[0]
+        db.close()
 
-            print(f"✓ Database loaded: {count:,} log entries")
-            print(f"✓ Tracking {tickets} unique tickets")
-            print()
+        print(f"✓ Database loaded: {count:,} log entries")
+        print(f"✓ Tracking {tickets} unique tickets")
+        print()
 
     print(f"🌐 Dashboard URL: http://localhost:{PORT}")
-    print(f"🔄 Auto-refresh: Every 180 seconds (3 minutes)")
+    print(f"⚡ Live updates: pushed within {STREAM_POLL_INTERVAL}s of each ingest")
     print()
     print("Press Ctrl+C to stop")
     print("=" * 60)
     print()
 
-    app.run(debug=True, port=PORT, host='0.0.0.0')
+    app.run(debug=True, port=PORT, host='0.0.0.0', threaded=True)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+TriQ Dashboard Load Test
+
+Hammers a running dashboard with concurrent clients and reports request
+throughput and latency per endpoint mix. Start the dashboard first:
+
+    python3 dashboard.py
+
+Usage:
+    python3 loadtest_dashboard.py
+    python3 loadtest_dashboard.py --clients 32 --duration 20
+    python3 loadtest_dashboard.py --paths /api/metrics /api/ticket/EP-10
+"""
+
+import argparse
+import statistics
+import threading
+import time
+
+import requests
+
+DEFAULT_URL = 'http://localhost:5001'
+DEFAULT_PATHS = ['/api/metrics', '/api/tickets?limit=50', '/api/escalations', '/api/health']
+
+
+def run_client(base_url, paths, deadline, latencies, errors):
+    """Request the paths round-robin until the deadline"""
+    session = requests.Session()
+    i = 0
+    while time.perf_counter() < deadline:
+        path = paths[i % len(paths)]
+        i += 1
+        start = time.perf_counter()
+        try:
+            response = session.get(base_url + path, timeout=30)
+            if response.status_code >= 400:
+                errors.append(response.status_code)
+                continue
+        except requests.RequestException as e:
+            errors.append(type(e).__name__)
+            continue
+        latencies.append(time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the TriQ dashboard API')
+    parser.add_argument('--url', default=DEFAULT_URL, help='Dashboard base URL')
+    parser.add_argument('--clients', type=int, default=16, help='Concurrent clients')
+    parser.add_argument('--duration', type=float, default=10, help='Seconds to run')
+    parser.add_argument('--paths', nargs='+', default=DEFAULT_PATHS, help='Endpoints to request')
+    args = parser.parse_args()
+
+    print(f"🔥 {args.clients} clients for {args.duration:.0f}s against {args.url}")
+    print(f"   Paths: {' '.join(args.paths)}")
+
+    latencies, errors = [], []
+    deadline = time.perf_counter() + args.duration
+    threads = [
+        threading.Thread(target=run_client, args=(args.url, args.paths, deadline, latencies, errors))
+        for _ in range(args.clients)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    print()
+    print("📊 Results:")
+    print("-" * 60)
+    if not latencies:
+        print("  No successful requests")
+    else:
+        latencies.sort()
+        print(f"  Requests:    {len(latencies):,} ok, {len(errors):,} failed")
+        print(f"  Throughput:  {len(latencies) / elapsed:,.0f} req/s")
+        print(f"  Latency:     p50 {statistics.median(latencies) * 1000:.1f}ms  "
+              f"p95 {latencies[int(len(latencies) * 0.95)] * 1000:.1f}ms  "
+              f"max {latencies[-1] * 1000:.1f}ms")
+    if errors:
+        print(f"  Errors:      {sorted(set(map(str, errors)))}")
+
+
+if __name__ == '__main__':
+    main()
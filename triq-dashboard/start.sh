@@ -5,6 +5,7 @@
 # Usage:
 #   ./start.sh          # Parse logs and start dashboard
 #   ./start.sh parse    # Just parse logs
+#   ./start.sh follow   # Keep ingesting logs as they grow
 #   ./start.sh serve    # Just start dashboard (no parsing)
 #
 
@@ -18,6 +19,10 @@ case "${1:-}" in
         echo "📊 Parsing TriQ logs..."
         python3 triq_db.py
         ;;
+    follow)
+        echo "👀 Following TriQ logs..."
+        python3 triq_db.py --follow
+        ;;
     serve)
         echo "🚀 Starting dashboard..."
         python3 dashboard.py
@@ -5,251 +5,1015 @@ TriQ Log Parser - Convert triq-monitor.log to SQLite database
 Parses the structured log format from triq-monitor.sh and stores
 validation events, scores, and metadata in a SQLite database.
 
+Ingestion is incremental: the byte offset and inode reached in the log
+are saved in the ingest_state table, so each run only parses lines
+appended since the last one. Log rotation and truncation are detected
+and the new file is read from the start. Each ingest also folds its new
+rows into ticket_state, the latest result per ticket that the dashboard
+reads.
+
 Usage:
-    python3 triq_db.py
+    python3 triq_db.py              # Ingest new log lines
+    python3 triq_db.py --follow     # Keep ingesting as the log grows
+    python3 triq_db.py --rebuild    # Re-parse the whole log
+    python3 triq_db.py --rebuild --workers 8   # ... parsing chunks in parallel
 """
 
+import argparse
+import json
+import multiprocessing
 import sqlite3
 import re
 import os
+import time
 from datetime import datetime
 
 # Configuration
 LOG_FILE = '/tmp/triq-monitor.log'
 DB_FILE = 'triq.db'
+FOLLOW_INTERVAL = 0.5  # seconds between polls in --follow mode
+INSERT_BATCH_SIZE = 5000  # rows per executemany call
+PARALLEL_CHUNK_BYTES = 8 * 1024 * 1024  # target log bytes per parallel parse task
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024  # smaller ranges are parsed serially
+
+# Ticket log lines and plain monitor lines in the original validations
+# row shape; filter with WHERE t.ticket_key = ? to use the ticket indexes
+EVENT_ROWS = '''
+    SELECT e.id AS id, e.timestamp AS timestamp, t.ticket_key AS ticket_key,
+           category.value AS category, level.value AS log_level, e.message,
+           s.score AS score, e.total_score AS total_score, s.max_score AS max_score,
+           result.value AS validation_result, routing.value AS routing_decision,
+           priority.value AS priority, issue_type.value AS issue_type,
+           urgency.value AS urgency, impact.value AS impact,
+           ev.calculated_priority AS calculated_priority,
+           ev.assigned_priority AS assigned_priority,
+           ev.evaluation_number AS evaluation_number
+    FROM events e
+    JOIN tickets t ON t.id = e.ticket_id
+    LEFT JOIN scores s ON s.event_id = e.id
+    LEFT JOIN evaluations ev ON ev.id = e.evaluation_id
+    LEFT JOIN labels category ON category.id = e.category_id
+    LEFT JOIN labels level ON level.id = e.level_id
+    LEFT JOIN labels result ON result.id = e.result_id
+    LEFT JOIN labels routing ON routing.id = e.routing_id
+    LEFT JOIN labels priority ON priority.id = ev.priority_id
+    LEFT JOIN labels issue_type ON issue_type.id = ev.issue_type_id
+    LEFT JOIN labels urgency ON urgency.id = ev.urgency_id
+    LEFT JOIN labels impact ON impact.id = ev.impact_id
+'''
+SYSTEM_MESSAGE_ROWS = '''
+    SELECT m.id, m.timestamp, COALESCE(t.ticket_key, 'SYSTEM'), 'SYSTEM', 'INFO', m.message,
+           NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL, NULL
+    FROM system_messages m
+    LEFT JOIN tickets t ON t.id = m.ticket_id
+'''
+
+# Normalized layout: one events row per ticket log line, a scores row for
+# lines that carry a score, one evaluations row per ticket evaluation with
+# its metadata, and plain monitor lines in system_messages. Repeated text
+# (categories, levels, results, priorities, ...) is stored once in labels
+# and referenced by integer code. Events and system messages share one id
+# sequence, which preserves log order across both tables.
+SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS labels (
+        id INTEGER PRIMARY KEY,
+        value TEXT NOT NULL UNIQUE
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS tickets (
+        id INTEGER PRIMARY KEY,
+        ticket_key TEXT NOT NULL UNIQUE
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS evaluations (
+        id INTEGER PRIMARY KEY,
+        ticket_id INTEGER NOT NULL REFERENCES tickets(id),
+        evaluation_number INTEGER NOT NULL,
+        priority_id INTEGER REFERENCES labels(id),
+        issue_type_id INTEGER REFERENCES labels(id),
+        urgency_id INTEGER REFERENCES labels(id),
+        impact_id INTEGER REFERENCES labels(id),
+        calculated_priority INTEGER,
+        assigned_priority INTEGER,
+        UNIQUE (ticket_id, evaluation_number)
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS events (
+        id INTEGER PRIMARY KEY,
+        timestamp TEXT NOT NULL,
+        ticket_id INTEGER NOT NULL REFERENCES tickets(id),
+        evaluation_id INTEGER REFERENCES evaluations(id),
+        category_id INTEGER REFERENCES labels(id),
+        level_id INTEGER REFERENCES labels(id),
+        message TEXT,
+        total_score REAL,
+        result_id INTEGER REFERENCES labels(id),
+        routing_id INTEGER REFERENCES labels(id)
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS scores (
+        event_id INTEGER PRIMARY KEY REFERENCES events(id),
+        evaluation_id INTEGER REFERENCES evaluations(id),
+        category_id INTEGER REFERENCES labels(id),
+        score REAL,
+        max_score REAL
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS system_messages (
+        id INTEGER PRIMARY KEY,
+        timestamp TEXT NOT NULL,
+        ticket_id INTEGER REFERENCES tickets(id),
+        message TEXT
+    )
+    ''',
+    # Every log line in the original one-row-per-line shape, for reports
+    # and ad hoc queries
+    f'CREATE VIEW IF NOT EXISTS validations AS {EVENT_ROWS} UNION ALL {SYSTEM_MESSAGE_ROWS}',
+]
+
+# Tables holding parsed log lines, cleared by a rebuild (labels are kept)
+LOG_TABLES = ['scores', 'events', 'system_messages', 'evaluations', 'tickets']
+
+LOG_INDEXES = [
+    ('idx_events_ticket', 'events(ticket_id)'),
+    ('idx_system_messages_ticket', 'system_messages(ticket_id)'),
+    # Only final score lines have a result, so this index stays small
+    ('idx_events_result', 'events(result_id, total_score) WHERE result_id IS NOT NULL'),
+]
+
+INSERT_EVENT = '''
+    INSERT INTO events
+    (id, timestamp, ticket_id, evaluation_id, category_id, level_id, message,
+     total_score, result_id, routing_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+INSERT_SCORE = '''
+    INSERT INTO scores (event_id, evaluation_id, category_id, score, max_score)
+    VALUES (?, ?, ?, ?, ?)
+'''
+INSERT_SYSTEM_MESSAGE = '''
+    INSERT INTO system_messages (id, timestamp, ticket_id, message)
+    VALUES (?, ?, ?, ?)
+'''
+
+# Parsed row layout, as produced by LogParser.parse_line
+ROW_COLUMNS = '''
+    timestamp, ticket_key, category, log_level, message,
+    score, total_score, max_score,
+    validation_result, routing_decision,
+    priority, issue_type, urgency, impact,
+    calculated_priority, assigned_priority, evaluation_number
+'''
+
+# Latest state per ticket, folded in from the rows each ingest appends.
+# The dashboard reads this instead of searching validations for the
+# newest row of every ticket.
+TICKET_STATE_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS ticket_state (
+        ticket_key TEXT PRIMARY KEY,
+        first_seen TEXT,
+        last_seen TEXT,
+        event_count INTEGER NOT NULL DEFAULT 0,
+        max_evaluation INTEGER,
+        score_sum REAL NOT NULL DEFAULT 0,
+        score_count INTEGER NOT NULL DEFAULT 0,
+
+        -- From the latest final score line
+        last_validated TEXT,
+        total_score REAL,
+        validation_result TEXT,
+        priority TEXT,
+        urgency TEXT,
+        impact TEXT,
+        evaluation_number INTEGER,
+
+        -- From the latest routing line
+        routing_decision TEXT
+    )
+'''
+
+# /api/tickets pages newest first by (last_validated, ticket_key); each
+# filter column leads an index in that order so a filtered page is an
+# index range scan however deep the cursor is. Several values for one
+# filter (IN) still need a sort, but SQLite bounds it to the page: each
+# value's scan stops once it cannot beat the rows already kept. The
+# trailing total_score lets min_score/max_score be checked in the index
+# without reading the table row; an index led by total_score would not
+# return rows in page order.
+TICKET_STATE_INDEXES = [
+    ('idx_state_recent_score', 'ticket_state(last_validated, ticket_key, total_score)'),
+    ('idx_state_result_recent_score', 'ticket_state(validation_result, last_validated, ticket_key, total_score)'),
+    ('idx_state_priority_recent_score', 'ticket_state(priority, last_validated, ticket_key, total_score)'),
+    ('idx_state_urgency_recent_score', 'ticket_state(urgency, last_validated, ticket_key, total_score)'),
+    ('idx_state_max_evaluation', 'ticket_state(max_evaluation)'),
+]
+
+# Superseded by the indexes above
+RETIRED_TICKET_STATE_INDEXES = ['idx_state_last_validated', 'idx_state_result', 'idx_state_recent',
+                                'idx_state_result_recent', 'idx_state_priority_recent',
+                                'idx_state_urgency_recent']
+
+# Each statement reads only validations rows with id > ?. "Latest" means
+# last in log order; SQLite takes bare columns from the MAX(id) row.
+UPDATE_TICKET_STATE = [
+    '''
+    INSERT INTO ticket_state
+        (ticket_key, first_seen, last_seen, event_count, max_evaluation, score_sum, score_count)
+    SELECT ticket_key, MIN(timestamp), MAX(timestamp), COUNT(*),
+           MAX(evaluation_number), TOTAL(total_score), COUNT(total_score)
+    FROM validations
+    WHERE id > ? AND ticket_key != 'SYSTEM'
+    GROUP BY ticket_key
+    ON CONFLICT(ticket_key) DO UPDATE SET
+        first_seen = MIN(first_seen, excluded.first_seen),
+        last_seen = MAX(last_seen, excluded.last_seen),
+        event_count = event_count + excluded.event_count,
+        max_evaluation = COALESCE(MAX(max_evaluation, excluded.max_evaluation),
+                                  max_evaluation, excluded.max_evaluation),
+        score_sum = score_sum + excluded.score_sum,
+        score_count = score_count + excluded.score_count
+    ''',
+    '''
+    INSERT INTO ticket_state
+        (ticket_key, last_validated, total_score, validation_result,
+         priority, urgency, impact, evaluation_number)
+    SELECT ticket_key, timestamp, total_score, validation_result,
+           priority, urgency, impact, evaluation_number
+    FROM (
+        SELECT ticket_key, timestamp, total_score, validation_result,
+               priority, urgency, impact, evaluation_number, MAX(id)
+        FROM validations
+        WHERE id > ? AND validation_result IS NOT NULL AND ticket_key != 'SYSTEM'
+        GROUP BY ticket_key
+    ) WHERE 1
+    ON CONFLICT(ticket_key) DO UPDATE SET
+        last_validated = excluded.last_validated,
+        total_score = excluded.total_score,
+        validation_result = excluded.validation_result,
+        priority = excluded.priority,
+        urgency = excluded.urgency,
+        impact = excluded.impact,
+        evaluation_number = excluded.evaluation_number
+    ''',
+    '''
+    INSERT INTO ticket_state (ticket_key, routing_decision)
+    SELECT ticket_key, routing_decision
+    FROM (
+        SELECT ticket_key, routing_decision, MAX(id)
+        FROM validations
+        WHERE id > ? AND routing_decision IS NOT NULL AND ticket_key != 'SYSTEM'
+        GROUP BY ticket_key
+    ) WHERE 1
+    ON CONFLICT(ticket_key) DO UPDATE SET
+        routing_decision = excluded.routing_decision
+    ''',
+]
+
+# Bumped when a schema change needs existing databases migrated
+SCHEMA_VERSION = 2
+
+def create_indexes(conn):
+    """Create the log table indexes if they are missing"""
+    for name, columns in LOG_INDEXES:
+        conn.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {columns}')
+
+def clear_log_tables(conn):
+    """Delete every parsed log line and the ticket state derived from them"""
+    for table in LOG_TABLES + ['ticket_state']:
+        conn.execute(f'DELETE FROM {table}')
+    bump_generation(conn, rebuilt=True)
+
+def bump_generation(conn, rebuilt=False):
+    """
+    Mark the log data as changed (call inside the writing transaction)
+
+    rebuilt also counts a rebuild: line ids start over afterwards, so
+    readers that track them must start over too.
+    """
+    conn.execute('''
+        INSERT INTO data_generation (id, generation, updated_at, rebuilds)
+        VALUES (1, 1, CURRENT_TIMESTAMP, ?)
+        ON CONFLICT(id) DO UPDATE SET
+            generation = generation + 1,
+            updated_at = CURRENT_TIMESTAMP,
+            rebuilds = rebuilds + excluded.rebuilds
+    ''', (int(rebuilt),))
+
+def read_generation(conn):
+    """Return (generation, updated_at) of the log data, (0, None) if never written"""
+    row = conn.execute('SELECT generation, updated_at FROM data_generation').fetchone()
+    return row if row else (0, None)
+
+def read_rebuilds(conn):
+    """Number of times the log data has been rebuilt (0 if never written)"""
+    try:
+        row = conn.execute('SELECT rebuilds FROM data_generation').fetchone()
+    except sqlite3.OperationalError:
+        return 0  # Not yet migrated by create_database
+    return row[0] if row else 0
+
+def update_ticket_state(conn, since_id=0):
+    """Fold validations rows with id > since_id into ticket_state"""
+    for statement in UPDATE_TICKET_STATE:
+        conn.execute(statement, (since_id,))
+
+def last_validation_id(conn):
+    return conn.execute('''
+        SELECT MAX(COALESCE((SELECT MAX(id) FROM events), 0),
+                   COALESCE((SELECT MAX(id) FROM system_messages), 0))
+    ''').fetchone()[0]
+
+def count_log_lines(conn):
+    """Number of parsed log lines, without going through the validations view"""
+    return conn.execute(
+        'SELECT (SELECT COUNT(*) FROM events) + (SELECT COUNT(*) FROM system_messages)'
+    ).fetchone()[0]
+
+def ticket_history(conn, ticket_key):
+    """Every log line for a ticket in validations row shape, oldest first"""
+    return conn.execute(f'''
+        {EVENT_ROWS} WHERE t.ticket_key = ?
+        UNION ALL
+        {SYSTEM_MESSAGE_ROWS} WHERE t.ticket_key = ?
+        ORDER BY timestamp, id
+    ''', (ticket_key, ticket_key)).fetchall()
+
+class LogWriter:
+    """
+    Write parsed rows into the normalized tables
+
+    Label, ticket and evaluation ids are cached for the life of the writer,
+    so each distinct value costs one lookup or insert.
+    """
+
+    def __init__(self, conn):
+        self.conn = conn
+        self.labels = dict(conn.execute('SELECT value, id FROM labels'))
+        self.tickets = dict(conn.execute('SELECT ticket_key, id FROM tickets'))
+        self.evaluations = {}  # (ticket_id, number) -> [id, metadata]
+        self.next_id = last_validation_id(conn) + 1
+
+    def label(self, value):
+        if value is None:
+            return None
+        code = self.labels.get(value)
+        if code is None:
+            code = self.conn.execute('INSERT INTO labels (value) VALUES (?)', (value,)).lastrowid
+            self.labels[value] = code
+        return code
+
+    def ticket(self, ticket_key):
+        ticket_id = self.tickets.get(ticket_key)
+        if ticket_id is None:
+            ticket_id = self.conn.execute(
+                'INSERT INTO tickets (ticket_key) VALUES (?)', (ticket_key,)
+            ).lastrowid
+            self.tickets[ticket_key] = ticket_id
+        return ticket_id
+
+    def evaluation(self, ticket_id, row):
+        """Return the evaluation id for a row, keeping its metadata current
+
+        An evaluation's metadata is the latest seen in any of its rows.
+        """
+        number = row[16]
+        if number is None:
+            return None
+        metadata = (self.label(row[10]), self.label(row[11]), self.label(row[12]),
+                    self.label(row[13]), row[14], row[15])
+
+        key = (ticket_id, number)
+        cached = self.evaluations.get(key)
+        if cached is None:
+            found = self.conn.execute('''
+                SELECT id, priority_id, issue_type_id, urgency_id, impact_id,
+                       calculated_priority, assigned_priority
+                FROM evaluations
+                WHERE ticket_id = ? AND evaluation_number = ?
+            ''', key).fetchone()
+            if found is None:
+                evaluation_id = self.conn.execute('''
+                    INSERT INTO evaluations
+                    (ticket_id, evaluation_number, priority_id, issue_type_id,
+                     urgency_id, impact_id, calculated_priority, assigned_priority)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ''', key + metadata).lastrowid
+                found = (evaluation_id,) + metadata
+            cached = self.evaluations[key] = [found[0], tuple(found[1:])]
+
+        if cached[1] != metadata:
+            self.conn.execute('''
+                UPDATE evaluations
+                SET priority_id = ?, issue_type_id = ?, urgency_id = ?, impact_id = ?,
+                    calculated_priority = ?, assigned_priority = ?
+                WHERE id = ?
+            ''', metadata + (cached[0],))
+            cached[1] = metadata
+        return cached[0]
+
+    def write(self, rows):
+        """Insert parsed rows, in log order"""
+        events, scores, messages = [], [], []
+        for row in rows:
+            line_id = self.next_id
+            self.next_id += 1
+            ticket_id = None if row[1] == 'SYSTEM' else self.ticket(row[1])
+
+            # Plain monitor lines carry nothing beyond their text
+            if row[2] == 'SYSTEM' and row[3] == 'INFO' and not any(row[5:]):
+                messages.append((line_id, row[0], ticket_id, row[4]))
+                continue
+
+            evaluation_id = self.evaluation(ticket_id, row)
+            category_id = self.label(row[2])
+            events.append((line_id, row[0], ticket_id, evaluation_id, category_id,
+                           self.label(row[3]), row[4], row[6],
+                           self.label(row[8]), self.label(row[9])))
+            if row[5] is not None or row[7] is not None:
+                scores.append((line_id, evaluation_id, category_id, row[5], row[7]))
+
+        self.conn.executemany(INSERT_EVENT, events)
+        self.conn.executemany(INSERT_SCORE, scores)
+        self.conn.executemany(INSERT_SYSTEM_MESSAGE, messages)
+
+def migrate_legacy_validations(conn, log_file=LOG_FILE):
+    """Move rows from the original one-table layout into the normalized tables"""
+    writer = LogWriter(conn)
+    migrated = 0
+    cursor = conn.execute(f'SELECT {ROW_COLUMNS} FROM legacy_validations ORDER BY id')
+    while True:
+        rows = cursor.fetchmany(INSERT_BATCH_SIZE)
+        if not rows:
+            break
+        writer.write(rows)
+        migrated += len(rows)
+    conn.execute('DROP TABLE legacy_validations')
+
+    # Without a saved offset the first ingest would clear the migrated rows
+    if not conn.execute('SELECT 1 FROM ingest_state LIMIT 1').fetchone():
+        seed_ingest_state(conn, log_file, migrated)
+
+def seed_ingest_state(conn, log_file, rows):
+    """
+    Save an ingest offset just past the first `rows` parsed lines of a log
+
+    Those are the lines a full parse already stored. If the log now holds
+    fewer (rotated, truncated or missing), none of it is stored yet and
+    ingestion starts from its beginning.
+    """
+    parser = LogParser()
+    offset = parsed = 0
+    try:
+        with open(log_file, 'rb') as f:
+            inode = os.fstat(f.fileno()).st_ino
+            for raw in f:
+                if parsed >= rows or not raw.endswith(b'\n'):
+                    break
+                offset += len(raw)
+                try:
+                    parsed += bool(parser.parse_line(raw.decode('utf-8', errors='ignore')))
+                except Exception:
+                    continue
+    except FileNotFoundError:
+        inode = 0
+
+    if parsed < rows:
+        offset, parser = 0, LogParser()
+    save_ingest_state(conn, log_file, inode, offset, parser.context())
+
+def create_database(db_file=DB_FILE, log_file=LOG_FILE):
+    """Open the SQLite database, creating or migrating the TriQ schema"""
+    conn = sqlite3.connect(db_file)
+
+    # WAL lets the dashboard read while the ingester writes; NORMAL sync is
+    # durable across application crashes and much cheaper per commit
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
 
-def create_database():
-    """Create SQLite database with schema for TriQ logs"""
-    conn = sqlite3.connect(DB_FILE)
     c = conn.cursor()
+    version = c.execute('PRAGMA user_version').fetchone()[0]
 
-    # Drop existing table to start fresh
-    c.execute('DROP TABLE IF EXISTS validations')
+    # Databases from before the normalized layout have validations as a table
+    legacy = c.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'validations'"
+    ).fetchone()
+    if legacy:
+        c.execute('ALTER TABLE validations RENAME TO legacy_validations')
 
-    # Create validations table
+    for statement in SCHEMA:
+        c.execute(statement)
+    create_indexes(conn)
+
+    # Where ingestion stopped in each log file, plus the carried parser context
+    c.execute('''
+        CREATE TABLE IF NOT EXISTS ingest_state (
+            log_file TEXT PRIMARY KEY,
+            inode INTEGER NOT NULL,
+            offset INTEGER NOT NULL,
+            context TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+
+    # Bumped by every commit that changes log data; readers use it as a
+    # cheap cache key. rebuilds counts the commits that replaced it all.
     c.execute('''
-        CREATE TABLE validations (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            timestamp TEXT NOT NULL,
-            ticket_key TEXT NOT NULL,
-            category TEXT,
-            log_level TEXT,
-            message TEXT,
-
-            -- Scores
-            score REAL,
-            total_score REAL,
-            max_score REAL,
-
-            -- Results
-            validation_result TEXT,
-            routing_decision TEXT,
-
-            -- Metadata
-            priority TEXT,
-            issue_type TEXT,
-            urgency TEXT,
-            impact TEXT,
-            calculated_priority INTEGER,
-            assigned_priority INTEGER,
-            evaluation_number INTEGER,
-
-            -- Indexing
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        CREATE TABLE IF NOT EXISTS data_generation (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            generation INTEGER NOT NULL,
+            updated_at TIMESTAMP NOT NULL,
+            rebuilds INTEGER NOT NULL DEFAULT 0
         )
     ''')
+    if 'rebuilds' not in {row[1] for row in c.execute('PRAGMA table_info(data_generation)')}:
+        c.execute('ALTER TABLE data_generation ADD COLUMN rebuilds INTEGER NOT NULL DEFAULT 0')
+
+    c.execute(TICKET_STATE_SCHEMA)
+    for name in RETIRED_TICKET_STATE_INDEXES:
+        c.execute(f'DROP INDEX IF EXISTS {name}')
+    for name, columns in TICKET_STATE_INDEXES:
+        c.execute(f'CREATE INDEX IF NOT EXISTS {name} ON {columns}')
 
-    # Create indexes for performance
-    c.execute('CREATE INDEX idx_ticket_key ON validations(ticket_key)')
-    c.execute('CREATE INDEX idx_timestamp ON validations(timestamp)')
-    c.execute('CREATE INDEX idx_total_score ON validations(total_score)')
-    c.execute('CREATE INDEX idx_validation_result ON validations(validation_result)')
+    if legacy:
+        migrate_legacy_validations(conn, log_file)
+
+    # Recompute ticket_state for databases that predate it or were migrated
+    if version < SCHEMA_VERSION:
+        c.execute('DELETE FROM ticket_state')
+        update_ticket_state(conn)
+        c.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
 
     conn.commit()
+    if legacy:
+        # Hand the space freed by the old table back to the filesystem
+        conn.execute('VACUUM')
     return conn
 
-def parse_log_file(conn):
-    """Parse triq-monitor.log and insert into database"""
+# Log line patterns, compiled once
+STRUCTURED_LINE = re.compile(
+    r'\[([\d\-: ]+)\] \[([A-Z]+-\d+)\] \[(\w+)\] \[(INFO|DEBUG|WARN|ERROR)\] (.+)'
+)
+SIMPLE_LINE = re.compile(r'\[([\d\-: ]+)\] (.+)')
+
+# Metadata fields in a structured message, keyed by the label that starts them
+FIELD_PATTERNS = {
+    'Priority: ': re.compile(r'Priority: ([^,]+)'),
+    'Type: ': re.compile(r'Type: (.+)'),
+    'Urgency: ': re.compile(r'Urgency: (\w+)'),
+    'Impact: ': re.compile(r'Impact: (\w+)'),
+    'Calculated Priority: ': re.compile(r'Calculated Priority: (\d+)'),
+    'Assigned Priority: ': re.compile(r'Assigned Priority: (\d+)'),
+    'Evaluation #': re.compile(r'Evaluation #(\d+)'),
+    'Score: ': re.compile(r'Score: ([\d.]+)/([\d.]+)'),
+    'Weighted: ': re.compile(r'Weighted: ([\d.]+)/([\d.]+)'),
+    'Final Score: ': re.compile(r'Final Score: ([\d.]+)/([\d.]+) \((\w+)\)'),
+    'Decision: ': re.compile(r'Decision: ([^(]+)'),
+}
+
+# Longer labels first so the alternation prefers them at the same position
+FIELD_LABELS = re.compile('|'.join(
+    re.escape(label) for label in sorted(FIELD_PATTERNS, key=len, reverse=True)
+))
+
+# Labels that contain another label, and the offset where the inner one starts
+NESTED_LABELS = {
+    'Final Score: ': (('Score: ', 6),),
+    'Calculated Priority: ': (('Priority: ', 11),),
+    'Assigned Priority: ': (('Priority: ', 9),),
+}
+
+# Every (label, offset, pattern) to try when the label scan hits a label
+LABEL_CANDIDATES = {
+    label: ((label, 0, pattern),) + tuple(
+        (inner, offset, FIELD_PATTERNS[inner]) for inner, offset in NESTED_LABELS.get(label, ()))
+    for label, pattern in FIELD_PATTERNS.items()
+}
+
+def extract_fields(message):
+    """
+    Find every metadata field in a message with one scan for labels
+
+    Returns {label: match} holding the leftmost successful match for each
+    label, the same result as calling re.search once per field pattern.
+    """
+    fields = {}
+    for hit in FIELD_LABELS.finditer(message):
+        start = hit.start()
+        for label, offset, pattern in LABEL_CANDIDATES[hit.group()]:
+            if label not in fields:
+                field_match = pattern.match(message, start + offset)
+                if field_match:
+                    fields[label] = field_match
+    return fields
+
+class LogParser:
+    """
+    Parses triq-monitor.log lines into validations rows
+
+    Metadata lines (priority, urgency, evaluation number, ...) apply to the
+    lines that follow them, so the parser carries that context between
+    calls. The context can be saved and restored to resume mid-log.
+    """
 
-    if not os.path.exists(LOG_FILE):
-        print(f"❌ Error: Log file not found at {LOG_FILE}")
+    CONTEXT_FIELDS = (
+        'ticket', 'priority', 'issue_type', 'urgency', 'impact',
+        'calc_priority', 'assigned_priority', 'eval_number',
+    )
+
+    def __init__(self, context=None):
+        context = context or {}
+        for field in self.CONTEXT_FIELDS:
+            setattr(self, 'current_' + field, context.get(field))
+
+    def context(self):
+        """Return the carried context as a JSON-serializable dict"""
+        return {field: getattr(self, 'current_' + field) for field in self.CONTEXT_FIELDS}
+
+    def parse_line(self, line):
+        """Return the validations row for a log line, or None to skip it"""
+        line = line.strip()
+        if not line:
+            return None
+
+        # Pattern 1: Structured log with ticket, category, level
+        # [2025-10-23 15:34:09] [EP-10] [VALIDATION] [INFO] === Starting Validation (Evaluation #1) ===
+        match = STRUCTURED_LINE.match(line)
+
+        if match:
+            timestamp, ticket, category, level, message = match.groups()
+            self.current_ticket = ticket
+
+            # Extract metadata from message
+            score = None
+            total_score = None
+            max_score = None
+            validation_result = None
+            routing_decision = None
+
+            fields = extract_fields(message)
+            if fields:
+                if 'Priority: ' in fields:
+                    self.current_priority = fields['Priority: '].group(1).strip()
+                if 'Type: ' in fields:
+                    self.current_issue_type = fields['Type: '].group(1).strip()
+                if 'Urgency: ' in fields:
+                    self.current_urgency = fields['Urgency: '].group(1)
+                if 'Impact: ' in fields:
+                    self.current_impact = fields['Impact: '].group(1)
+                if 'Calculated Priority: ' in fields:
+                    self.current_calc_priority = int(fields['Calculated Priority: '].group(1))
+                if 'Assigned Priority: ' in fields:
+                    self.current_assigned_priority = int(fields['Assigned Priority: '].group(1))
+                if 'Evaluation #' in fields:
+                    self.current_eval_number = int(fields['Evaluation #'].group(1))
+
+                # Individual scores, with the weighted score as the main score
+                if 'Score: ' in fields:
+                    score = float(fields['Score: '].group(1))
+                    max_score = float(fields['Score: '].group(2))
+                if 'Weighted: ' in fields:
+                    score = float(fields['Weighted: '].group(1))
+
+                # Final validation score and routing decision
+                if 'Final Score: ' in fields:
+                    final_match = fields['Final Score: ']
+                    total_score = float(final_match.group(1))
+                    max_score = float(final_match.group(2))
+                    validation_result = final_match.group(3)
+                if 'Decision: ' in fields:
+                    routing_decision = fields['Decision: '].group(1).strip()
+
+            return (
+                timestamp, ticket, category, level, message,
+                score, total_score, max_score,
+                validation_result, routing_decision,
+                self.current_priority, self.current_issue_type,
+                self.current_urgency, self.current_impact,
+                self.current_calc_priority, self.current_assigned_priority,
+                self.current_eval_number
+            )
+
+        # Pattern 2: Simple log without structured format
+        # [2025-10-23 15:34:04] Testing JIRA connectivity...
+        simple_match = SIMPLE_LINE.match(line)
+        if simple_match:
+            timestamp, message = simple_match.groups()
+            return (
+                timestamp, self.current_ticket or 'SYSTEM', 'SYSTEM', 'INFO', message,
+                None, None, None, None, None, None, None, None, None, None, None, None
+            )
+
+        return None
+
+def load_ingest_state(conn, log_file):
+    """Return (inode, offset, context) saved for a log file, or None"""
+    row = conn.execute(
+        'SELECT inode, offset, context FROM ingest_state WHERE log_file = ?',
+        (log_file,)
+    ).fetchone()
+    if not row:
+        return None
+    return row[0], row[1], json.loads(row[2]) if row[2] else {}
+
+def save_ingest_state(conn, log_file, inode, offset, context):
+    """Record how far ingestion got (call inside the insert transaction)"""
+    conn.execute('''
+        INSERT OR REPLACE INTO ingest_state (log_file, inode, offset, context, updated_at)
+        VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+    ''', (log_file, inode, offset, json.dumps(context)))
+
+def find_rotated_log(log_file, inode):
+    """Find the rotated copy of a log file that still has the given inode"""
+    for candidate in (log_file + '.1', log_file + '.old'):
+        try:
+            if os.stat(candidate).st_ino == inode:
+                return candidate
+        except OSError:
+            continue
+    return None
+
+def parse_log_range(writer, path, offset, parser, stats):
+    """
+    Parse complete lines of a log file from a byte offset
+
+    Rows go to the LogWriter in batches of INSERT_BATCH_SIZE. A
+    trailing line without a newline is still being written, so it is left
+    for the next run. Returns the offset after the last parsed line.
+    """
+    batch = []
+
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        for raw in f:
+            if not raw.endswith(b'\n'):
+                break
+            offset += len(raw)
+            stats['lines'] += 1
+
+            try:
+                row = parser.parse_line(raw.decode('utf-8', errors='ignore'))
+            except Exception as e:
+                stats['errors'] += 1
+                if stats['errors'] <= 10:  # Only show first 10 errors
+                    print(f"⚠️  Offset {offset}: {str(e)[:100]}")
+                continue
+
+            if row:
+                batch.append(row)
+                if len(batch) >= INSERT_BATCH_SIZE:
+                    writer.write(batch)
+                    stats['parsed'] += len(batch)
+                    batch = []
+
+    if batch:
+        writer.write(batch)
+        stats['parsed'] += len(batch)
+
+    return offset
+
+# Placeholder for context a chunk inherits from the chunks before it
+UNSET = '\x00unset'
+
+# validations row columns filled from carried context, by context field
+ROW_CONTEXT_COLUMNS = (
+    (10, 'priority'), (11, 'issue_type'), (12, 'urgency'), (13, 'impact'),
+    (14, 'calc_priority'), (15, 'assigned_priority'), (16, 'eval_number'),
+)
+
+def split_log(path, start, end, chunk_count):
+    """Split a byte range of a log into (start, end) chunks on line boundaries"""
+    bounds = [start]
+    with open(path, 'rb') as f:
+        for i in range(1, chunk_count):
+            f.seek(start + (end - start) * i // chunk_count)
+            f.readline()  # finish the line the seek landed in
+            pos = min(f.tell(), end)
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    bounds.append(end)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+def parse_chunk(task):
+    """
+    Parse one chunk in a worker process
+
+    Chunks after the first start with every context field UNSET, since the
+    lines that set them belong to earlier chunks. Once a field is set it
+    stays set, so only rows parsed before the last field was resolved can
+    hold UNSET; their count is returned so the writer only patches those.
+    """
+    path, start, end, context = task
+    parser = LogParser(context or {field: UNSET for field in LogParser.CONTEXT_FIELDS})
+    stats = {'lines': 0, 'parsed': 0, 'errors': 0}
+    rows = []
+    unresolved = 0
+    resolving = context is None
+
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    # Only complete lines; a partial last line is left for the next ingest
+    complete = data.rfind(b'\n') + 1
+    for raw in data[:complete].split(b'\n')[:-1]:
+        stats['lines'] += 1
+        try:
+            row = parser.parse_line(raw.decode('utf-8', errors='ignore'))
+        except Exception:
+            stats['errors'] += 1
+            continue
+        if row:
+            rows.append(row)
+            if resolving:
+                unresolved = len(rows)
+                resolving = UNSET in parser.context().values()
+
+    stats['parsed'] = len(rows)
+    return rows, unresolved, parser.context(), start + complete, stats
+
+def reconcile_chunk(rows, unresolved, context):
+    """Fill UNSET values in a chunk's leading rows from the incoming context"""
+    for i in range(unresolved):
+        row = list(rows[i])
+        if row[1] == UNSET:
+            row[1] = context['ticket'] or 'SYSTEM'
+        for column, field in ROW_CONTEXT_COLUMNS:
+            if row[column] == UNSET:
+                row[column] = context[field]
+        rows[i] = tuple(row)
+
+def parse_log_range_parallel(writer, path, offset, parser, stats, workers):
+    """
+    Parse a log from a byte offset with a pool of worker processes
+
+    The range is split on line boundaries and parsed in parallel. Chunks
+    come back in order, get the context carried from the previous chunk
+    patched in, and are written by this process alone, so the rows are
+    identical to a serial parse. Pass writer=None to parse without writing.
+    Returns the offset after the last parsed line.
+    """
+    end = os.path.getsize(path)
+    chunk_count = max(workers * 4, (end - offset) // PARALLEL_CHUNK_BYTES)
+    chunks = split_log(path, offset, end, chunk_count)
+    tasks = [(path, a, b, parser.context() if i == 0 else None)
+             for i, (a, b) in enumerate(chunks)]
+
+    context = parser.context()
+    with multiprocessing.Pool(workers) as pool:
+        for rows, unresolved, chunk_context, chunk_end, chunk_stats in pool.imap(parse_chunk, tasks):
+            reconcile_chunk(rows, unresolved, context)
+            for field, value in chunk_context.items():
+                if value != UNSET:
+                    context[field] = value
+
+            if writer is not None:
+                for i in range(0, len(rows), INSERT_BATCH_SIZE):
+                    writer.write(rows[i:i + INSERT_BATCH_SIZE])
+            for key in stats:
+                stats[key] += chunk_stats[key]
+            offset = chunk_end
+
+    for field, value in context.items():
+        setattr(parser, 'current_' + field, value)
+    return offset
+
+def ingest(conn, log_file=LOG_FILE, verbose=True, commit=True, workers=1):
+    """
+    Parse lines appended to the log since the last ingest
+
+    Rows, the ticket_state they change and the new offset are committed in
+    one transaction, so an interrupted run never skips or duplicates lines
+    and readers never see them out of step. With workers > 1,
+    large backlogs are parsed in parallel. Returns the number of rows
+    inserted.
+    """
+    if not os.path.exists(log_file):
+        if verbose:
+            print(f"❌ Error: Log file not found at {log_file}")
+            print(f"   Please run triq-monitor.sh first to generate logs")
+        return 0
+
+    st = os.stat(log_file)
+    state = load_ingest_state(conn, log_file)
+    inode, offset, context = state if state else (st.st_ino, 0, {})
+    if state and inode == st.st_ino and offset == st.st_size:
+        return 0  # Nothing appended; skip the write transaction
+    parser = LogParser(context)
+    stats = {'lines': 0, 'parsed': 0, 'errors': 0}
+
+    try:
+        if state is None and not conn.execute('SELECT 1 FROM ingest_state LIMIT 1').fetchone():
+            # Rows from a pre-incremental full parse have no offset to resume
+            # from, so replace them in the same transaction as the re-read
+            clear_log_tables(conn)
+        writer = LogWriter(conn)
+        since_id = writer.next_id - 1
+
+        if inode != st.st_ino:
+            # Log was rotated: finish the old file if it is still around
+            rotated = find_rotated_log(log_file, inode)
+            if rotated:
+                if verbose:
+                    print(f"🔄 Log rotated, finishing {rotated}")
+                parse_log_range(writer, rotated, offset, parser, stats)
+            offset = 0
+        elif st.st_size < offset:
+            # Log was truncated in place (e.g. copytruncate)
+            if verbose:
+                print(f"✂️  Log truncated, re-reading from start")
+            offset = 0
+
+        if verbose and offset:
+            print(f"📖 Reading log file: {log_file} (from byte {offset:,})")
+        elif verbose:
+            print(f"📖 Reading log file: {log_file}")
+
+        if workers > 1 and st.st_size - offset >= PARALLEL_MIN_BYTES:
+            offset = parse_log_range_parallel(writer, log_file, offset, parser, stats, workers)
+        else:
+            offset = parse_log_range(writer, log_file, offset, parser, stats)
+        if stats['parsed']:
+            update_ticket_state(conn, since_id)
+            bump_generation(conn)
+        save_ingest_state(conn, log_file, st.st_ino, offset, parser.context())
+        if commit:
+            conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+
+    return stats['parsed']
+
+def parse_log_file(conn, log_file=LOG_FILE, workers=1):
+    """Re-parse the whole log, replacing all existing rows
+
+    Everything happens in one transaction, so readers keep seeing the
+    previous data until the rebuild commits. Indexes are dropped for the
+    bulk load and rebuilt once at the end, which is faster than updating
+    them row by row.
+    """
+    if not os.path.exists(log_file):
+        print(f"❌ Error: Log file not found at {log_file}")
         print(f"   Please run triq-monitor.sh first to generate logs")
         return 0
 
-    c = conn.cursor()
-    parsed_count = 0
-    error_count = 0
-
-    print(f"📖 Reading log file: {LOG_FILE}")
-
-    # Current ticket context (for multi-line parsing)
-    current_ticket = None
-    current_timestamp = None
-    current_priority = None
-    current_issue_type = None
-    current_urgency = None
-    current_impact = None
-    current_calc_priority = None
-    current_assigned_priority = None
-    current_eval_number = None
-
-    with open(LOG_FILE, 'r', encoding='utf-8', errors='ignore') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
+    try:
+        clear_log_tables(conn)
+        conn.execute('DELETE FROM ingest_state WHERE log_file = ?', (log_file,))
+        for name, _ in LOG_INDEXES:
+            conn.execute(f'DROP INDEX IF EXISTS {name}')
 
-            try:
-                # Pattern 1: Structured log with ticket, category, level
-                # [2025-10-23 15:34:09] [EP-10] [VALIDATION] [INFO] === Starting Validation (Evaluation #1) ===
-                match = re.match(
-                    r'\[([\d\-: ]+)\] \[([A-Z]+-\d+)\] \[(\w+)\] \[(INFO|DEBUG|WARN|ERROR)\] (.+)',
-                    line
-                )
-
-                if match:
-                    timestamp, ticket, category, level, message = match.groups()
-                    current_ticket = ticket
-                    current_timestamp = timestamp
-
-                    # Extract metadata from message
-                    score = None
-                    total_score = None
-                    max_score = None
-                    validation_result = None
-                    routing_decision = None
-
-                    # Parse priority metadata
-                    priority_match = re.search(r'Priority: ([^,]+)', message)
-                    if priority_match:
-                        current_priority = priority_match.group(1).strip()
-
-                    # Parse issue type
-                    type_match = re.search(r'Type: (.+)', message)
-                    if type_match:
-                        current_issue_type = type_match.group(1).strip()
-
-                    # Parse urgency and impact
-                    urgency_match = re.search(r'Urgency: (\w+)', message)
-                    if urgency_match:
-                        current_urgency = urgency_match.group(1)
-
-                    impact_match = re.search(r'Impact: (\w+)', message)
-                    if impact_match:
-                        current_impact = impact_match.group(1)
-
-                    # Parse calculated priority
-                    calc_priority_match = re.search(r'Calculated Priority: (\d+)', message)
-                    if calc_priority_match:
-                        current_calc_priority = int(calc_priority_match.group(1))
-
-                    # Parse assigned priority
-                    assigned_priority_match = re.search(r'Assigned Priority: (\d+)', message)
-                    if assigned_priority_match:
-                        current_assigned_priority = int(assigned_priority_match.group(1))
-
-                    # Parse evaluation number
-                    eval_match = re.search(r'Evaluation #(\d+)', message)
-                    if eval_match:
-                        current_eval_number = int(eval_match.group(1))
-
-                    # Extract individual scores
-                    score_match = re.search(r'Score: ([\d.]+)/([\d.]+)', message)
-                    if score_match:
-                        score = float(score_match.group(1))
-                        max_score = float(score_match.group(2))
-
-                    # Extract weighted scores
-                    weighted_match = re.search(r'Weighted: ([\d.]+)/([\d.]+)', message)
-                    if weighted_match:
-                        # Store weighted score as the main score
-                        score = float(weighted_match.group(1))
-
-                    # Extract final validation score
-                    final_match = re.search(
-                        r'Final Score: ([\d.]+)/([\d.]+) \((\w+)\)',
-                        message
-                    )
-                    if final_match:
-                        total_score = float(final_match.group(1))
-                        max_score = float(final_match.group(2))
-                        validation_result = final_match.group(3)
-
-                    # Extract routing decision
-                    routing_match = re.search(r'Decision: ([^(]+)', message)
-                    if routing_match:
-                        routing_decision = routing_match.group(1).strip()
-
-                    # Insert into database
-                    c.execute('''
-                        INSERT INTO validations
-                        (timestamp, ticket_key, category, log_level, message,
-                         score, total_score, max_score,
-                         validation_result, routing_decision,
-                         priority, issue_type, urgency, impact,
-                         calculated_priority, assigned_priority, evaluation_number)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
-                        timestamp, ticket, category, level, message,
-                        score, total_score, max_score,
-                        validation_result, routing_decision,
-                        current_priority, current_issue_type,
-                        current_urgency, current_impact,
-                        current_calc_priority, current_assigned_priority,
-                        current_eval_number
-                    ))
-
-                    parsed_count += 1
-
-                else:
-                    # Pattern 2: Simple log without structured format
-                    # [2025-10-23 15:34:04] Testing JIRA connectivity...
-                    simple_match = re.match(r'\[([\d\-: ]+)\] (.+)', line)
-                    if simple_match:
-                        timestamp, message = simple_match.groups()
-
-                        c.execute('''
-                            INSERT INTO validations
-                            (timestamp, ticket_key, category, log_level, message)
-                            VALUES (?, ?, ?, ?, ?)
-                        ''', (timestamp, current_ticket or 'SYSTEM', 'SYSTEM', 'INFO', message))
-
-                        parsed_count += 1
+        parsed_count = ingest(conn, log_file, commit=False, workers=workers)
 
-            except Exception as e:
-                error_count += 1
-                if error_count <= 10:  # Only show first 10 errors
-                    print(f"⚠️  Line {line_num}: {str(e)[:100]}")
+        create_indexes(conn)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
 
-    conn.commit()
     return parsed_count
 
+def follow(conn, log_file=LOG_FILE, interval=FOLLOW_INTERVAL):
+    """Keep ingesting new log lines until interrupted"""
+    print(f"👀 Following {log_file} (every {interval}s, Ctrl+C to stop)")
+    try:
+        while True:
+            count = ingest(conn, log_file, verbose=False)
+            if count:
+                print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] +{count:,} log entries")
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        print()
+        print("✓ Stopped following")
+
 def generate_statistics(conn):
     """Generate summary statistics from parsed data"""
     c = conn.cursor()
 
     # Total entries
-    total = c.execute('SELECT COUNT(*) FROM validations').fetchone()[0]
+    total = count_log_lines(conn)
 
     # Unique tickets
-    tickets = c.execute('SELECT COUNT(DISTINCT ticket_key) FROM validations').fetchone()[0]
-
-    # Validations with scores
-    scored = c.execute(
-        'SELECT COUNT(*) FROM validations WHERE total_score IS NOT NULL'
-    ).fetchone()[0]
+    tickets = c.execute('SELECT COUNT(*) FROM tickets').fetchone()[0]
 
-    # Average score
-    avg_score = c.execute(
-        'SELECT AVG(total_score) FROM validations WHERE total_score IS NOT NULL'
-    ).fetchone()[0]
+    # Validations with scores, and their average
+    scored, avg_score = c.execute(
+        'SELECT COUNT(total_score), AVG(total_score) FROM events WHERE result_id IS NOT NULL'
+    ).fetchone()
 
     # Validation results breakdown
     results = c.execute('''
-        SELECT validation_result, COUNT(*) as count
-        FROM validations
-        WHERE validation_result IS NOT NULL
-        GROUP BY validation_result
+        SELECT l.value, COUNT(*) as count
+        FROM events e
+        JOIN labels l ON l.id = e.result_id
+        WHERE e.result_id IS NOT NULL
+        GROUP BY e.result_id
         ORDER BY count DESC
     ''').fetchall()
 
@@ -263,21 +1027,36 @@ def generate_statistics(conn):
 
 def main():
     """Main execution function"""
+    parser = argparse.ArgumentParser(description='Convert triq-monitor.log to SQLite')
+    parser.add_argument('--log-file', default=LOG_FILE, help='TriQ monitor log to read')
+    parser.add_argument('--db', default=DB_FILE, help='SQLite database to write')
+    parser.add_argument('--rebuild', action='store_true', help='Re-parse the whole log from scratch')
+    parser.add_argument('--follow', action='store_true', help='Keep ingesting as the log grows')
+    parser.add_argument('--interval', type=float, default=FOLLOW_INTERVAL,
+                        help='Seconds between polls in --follow mode')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Parser processes for large backlogs (0 = one per CPU)')
+    args = parser.parse_args()
+    workers = args.workers or os.cpu_count() or 1
+
     print("=" * 60)
     print("TriQ Log Parser - Converting logs to database")
     print("=" * 60)
     print()
 
     # Create database
-    print("🔨 Creating database schema...")
-    conn = create_database()
-    print("✓ Database created: triq.db")
+    print("🔨 Opening database...")
+    conn = create_database(args.db, args.log_file)
+    print(f"✓ Database ready: {args.db}")
     print()
 
     # Parse logs
-    parsed_count = parse_log_file(conn)
+    if args.rebuild:
+        parsed_count = parse_log_file(conn, args.log_file, workers=workers)
+    else:
+        parsed_count = ingest(conn, args.log_file, workers=workers)
     print()
-    print(f"✓ Parsed {parsed_count:,} log entries")
+    print(f"✓ Parsed {parsed_count:,} new log entries")
     print()
 
     # Generate statistics
@@ -300,6 +1079,10 @@ def main():
     print("✅ Database ready! Run 'python3 dashboard.py' to view")
     print("=" * 60)
 
+    if args.follow:
+        print()
+        follow(conn, args.log_file, args.interval)
+
     conn.close()
 
 if __name__ == '__main__':
@@ -0,0 +1,981 @@
+#!/usr/bin/env python3
+"""
+TriQ Validation Engine
+
+Python port of the ticket validation in triq-monitor.sh. One acli search
+fetches every candidate ticket together with the fields scoring needs,
+including urgency (cf[10450]) and impact (cf[10451]). Scoring then runs
+in-process with the script's rules. Tickets are validated concurrently,
+and each ticket's log lines are appended as one block in the monitor's
+log format, so triq-dashboard/triq_db.py parses them unchanged.
+
+Usage:
+    python3 triq_monitor.py                          # validate all candidates
+    python3 triq_monitor.py --tickets EP-10 EP-12    # validate specific tickets
+    python3 triq_monitor.py --workers 16
+    python3 triq_monitor.py --from-json search.json  # recorded acli --json output
+    python3 triq_monitor.py --live                   # apply routing and post feedback
+    python3 triq_monitor.py --db /path/to/triq.db    # evaluation counts live here
+    python3 triq_monitor.py --cycle                  # validate, check emergencies, write report
+
+A --cycle run takes one snapshot of the project per cycle: a single search
+for tickets created in the last week or still in triage, plus one project
+count. Validation candidates, emergency tickets and the daily report's
+counts all come from that snapshot.
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+# Configuration (mirrors triq-monitor.sh)
+PROJECT = "EP"
+LOG_FILE = "/tmp/triq-monitor.log"
+REPORT_FILE = "/tmp/triq-daily-report.txt"
+VALIDATION_LABEL = "triq_validated"
+MANUAL_EVAL_LABEL = "triq_manual_eval"
+TRIQ_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'triq-dashboard', 'triq.db')
+EVALUATION_COUNTER_FILE = "/tmp/triq-evaluation-counts.txt"  # pre-triq.db counts, imported once
+STORE_TIMEOUT = 30  # seconds to wait for the database write lock
+ADMIN_REVIEW_THRESHOLD = 5
+FEEDBACK_DIR = "/tmp"
+WORKERS = 8
+ACLI_TIMEOUT = 120  # seconds per acli call
+RUN_INTERVAL_MINUTES = 3  # cron interval, for the report's next-run line
+
+# Verbose logging configuration
+VERBOSE_VALIDATION_LOGGING = True
+LOG_FEEDBACK_CONTENT = True
+VALIDATION_LOG_LEVEL = "DEBUG"
+
+# Demo mode logs what would change in Jira; live mode applies it
+LIVE_MODE = False
+
+TRIAGE_STATUSES = ('Initial Review', 'Parking Lot')
+CANDIDATE_JQL = (f"project = {PROJECT} AND status IN ('Initial Review', 'Parking Lot') "
+                 f"AND labels NOT IN ({MANUAL_EVAL_LABEL})")
+
+# Per-cycle snapshot: everything the week's metrics and emergency check
+# look at, plus every ticket still in triage (the validation candidates)
+SNAPSHOT_DAYS = 7
+SNAPSHOT_JQL = (f"project = {PROJECT} AND (created >= -{SNAPSHOT_DAYS}d "
+                f"OR status IN ('Initial Review', 'Parking Lot'))")
+
+URGENCY_FIELD = 'customfield_10450'
+IMPACT_FIELD = 'customfield_10451'
+SEARCH_FIELDS = ['summary', 'description', 'priority', 'issuetype', 'status', 'created',
+                 URGENCY_FIELD, IMPACT_FIELD, 'labels']
+
+# Business Operations Priority Matrix
+# Urgency\Impact  High  Medium  Low
+# High            1     2       3
+# Medium          2     3       4
+# Low             3     4       5
+PRIORITY_MATRIX = {
+    ('high', 'high'): 1, ('high', 'medium'): 2, ('high', 'low'): 3,
+    ('medium', 'high'): 2, ('medium', 'medium'): 3, ('medium', 'low'): 4,
+    ('low', 'high'): 3, ('low', 'medium'): 4, ('low', 'low'): 5,
+}
+
+PRIORITY_LEVELS = {'Critical': 1, 'High': 2, 'Medium': 3, 'Low': 4, 'Very Low': 5}
+
+# Response and resolution SLA per priority level
+SLA_EXPECTATIONS = {
+    1: ('15 minutes', '2 hours'),
+    2: ('30 minutes', '1 business day'),
+    3: ('1 hour', '2 business days'),
+    4: ('4 hours', '5 business days'),
+    5: ('1 business day', '10 business days'),
+}
+
+# (category, weight %, reasoning) in scoring order
+CATEGORIES = [
+    ('SUMMARY', 25, 'Length and specificity assessment'),
+    ('DESCRIPTION', 35, 'Structure and content quality'),
+    ('TECHNICAL', 20, 'Environment and reproduction details'),
+    ('BUSINESS', 15, 'Business impact assessment'),
+    ('METADATA', 5, 'Priority validation using business operations matrix'),
+]
+
+# Keyword checks, compiled once (same patterns as the grep -i -E calls)
+GENERIC_TERMS = re.compile(r'\b(help|issue|problem|error)\b', re.IGNORECASE)
+SPECIFIC_TERMS = re.compile(r'\b(login|payment|unauthorized|timeout)\b', re.IGNORECASE)
+ERROR_DETAILS = re.compile(r'\b(error|message|code|exception|failed)\b', re.IGNORECASE)
+ENVIRONMENT_TERMS = re.compile(
+    r'\b(browser|chrome|safari|firefox|windows|mac|linux|mobile|desktop|android|ios)\b',
+    re.IGNORECASE)
+REPRODUCTION_TERMS = re.compile(r'\b(steps|reproduce|step|click|navigate|open)\b', re.IGNORECASE)
+IMPACT_TERMS = re.compile(r'\b(all|users|customers|everyone|critical|urgent|production)\b',
+                          re.IGNORECASE)
+# Summaries of tickets created in the last day that may need the on-call team
+EMERGENCY_TERMS = re.compile(r'\b(production|critical|emergency|urgent)\b', re.IGNORECASE)
+
+# Evaluation counts, kept in triq.db next to the parsed log. History has one
+# row per evaluation; the dashboard's escalation view reads both tables.
+EVALUATION_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS evaluation_counts (
+        ticket_key TEXT PRIMARY KEY,
+        evaluation_count INTEGER NOT NULL,
+        first_evaluated TEXT,
+        last_evaluated TEXT
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS evaluation_history (
+        ticket_key TEXT NOT NULL,
+        evaluation_number INTEGER NOT NULL,
+        evaluated_at TEXT NOT NULL,
+        PRIMARY KEY (ticket_key, evaluation_number)
+    ) WITHOUT ROWID
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_evaluation_counts_count ON evaluation_counts(evaluation_count)',
+    # Shared with triq_db.py: the dashboard caches responses per generation
+    '''
+    CREATE TABLE IF NOT EXISTS data_generation (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        generation INTEGER NOT NULL,
+        updated_at TIMESTAMP NOT NULL,
+        rebuilds INTEGER NOT NULL DEFAULT 0
+    )
+    ''',
+]
+
+# Same statement as triq_db.bump_generation
+BUMP_GENERATION = '''
+    INSERT INTO data_generation (id, generation, updated_at)
+    VALUES (1, 1, CURRENT_TIMESTAMP)
+    ON CONFLICT(id) DO UPDATE SET
+        generation = generation + 1,
+        updated_at = CURRENT_TIMESTAMP
+'''
+
+FEEDBACK_TEMPLATES = {
+    'APPROVED': """\
+✅ VALIDATION PASSED - ROUTED TO ENGINEERING QUEUE
+
+Your ticket has been validated and meets quality standards.
+
+Quality Score: {score}/10
+Status: Moved to Engineering Queue with "engq" label
+Next Step: Engineering team will review and prioritize your ticket
+
+Thank you for the clear submission!
+""",
+    'APPROVED_WITH_NOTES': """\
+✅ VALIDATION PASSED - ROUTED TO ENGINEERING QUEUE
+
+Your ticket has been approved for engineering work.
+
+Quality Score: {score}/10
+Status: Moved to Engineering Queue with "engq" label
+
+Minor suggestions for improvement:
+{issues}
+
+Next Steps: Engineering team will review and prioritize your ticket.
+""",
+    'NEEDS_CLARIFICATION': """\
+⚠️ ROUTED TO ENGINEERING QUEUE WITH CLARIFICATIONS NEEDED
+
+Your ticket has been routed to engineering but needs additional information for effective troubleshooting.
+
+Quality Score: {score}/10
+Status: Moved to Engineering Queue with "engq" label
+
+Please provide:
+{issues}
+
+Engineering will work with you to gather the missing information.
+""",
+    'PARKING_LOT': """\
+⏸️ MOVED TO PARKING LOT
+
+Your ticket needs additional information before it can be reviewed by engineering.
+
+Quality Score: {score}/10 (Below threshold of 5.0)
+
+Required improvements:
+{issues}
+
+Status: Your ticket has been moved to the Parking Lot for re-evaluation during the next monitoring cycle.
+Action: Please update your ticket with the missing information above.
+""",
+}
+
+ADMIN_NOTIFICATION = """\
+🚨 MANUAL EVALUATION REQUIRED
+
+Ticket: {key}
+Evaluation Count: {count}
+Status: Stuck in triage for multiple evaluation cycles
+Label Applied: triq_manual_eval
+
+This ticket has been evaluated {count} times while remaining in
+"Initial Review" or "Parking Lot" status. Manual intervention is required.
+
+AUTOMATIC EVALUATIONS DISABLED: This ticket will be excluded from future
+automatic validation cycles until the "triq_manual_eval" label is removed.
+
+Possible Actions:
+- Review ticket quality requirements
+- Provide submitter training
+- Reassign or close if inappropriate
+- Override triage decision if needed
+- Remove "triq_manual_eval" label to re-enable automatic validation
+
+Generated: {generated}
+"""
+
+DAILY_REPORT = """\
+=== TriQ Daily Monitoring Report ===
+Date: {date}
+Time: {time}
+
+TICKET COUNTS:
+- New today: {today}
+- New this week: {week}
+- Total in project: {total}
+
+VALIDATION ACTIVITY:
+- Monitoring sessions: 1
+- Tickets processed: {processed}
+- Validations completed: {completed}
+
+SYSTEM STATUS:
+- JIRA connectivity: ✓ Working
+- ACLI status: ✓ Functional
+- Monitoring script: ✓ Completed successfully
+
+Next scheduled run: {next_run}
+"""
+
+# ============================================================================
+# LOGGING
+# ============================================================================
+
+_log_lock = threading.Lock()
+
+
+def timestamp():
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+
+def write_log(lines):
+    """Append lines to the monitor log and echo them, as one uninterrupted block"""
+    if not lines:
+        return
+    text = '\n'.join(lines) + '\n'
+    with _log_lock:
+        with open(LOG_FILE, 'a', encoding='utf-8') as f:
+            f.write(text)
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+
+def log(message):
+    write_log([f"[{timestamp()}] {message}"])
+
+
+class TicketLog:
+    """
+    Log lines for one ticket, held until its validation finishes
+
+    Concurrent validations would otherwise interleave lines from different
+    tickets, and triq_db.py reads ticket context from line order.
+    """
+
+    def __init__(self, key):
+        self.key = key
+        self.lines = []
+
+    def log(self, message):
+        self.lines.append(f"[{timestamp()}] {message}")
+
+    def raw(self, text):
+        self.lines.extend(text.splitlines())
+
+    def event(self, category, level, message):
+        self.log(f"[{self.key}] [{category}] [{level}] {message}")
+
+    def detail(self, category, check, result, score, reasoning):
+        if VERBOSE_VALIDATION_LOGGING and VALIDATION_LOG_LEVEL == "DEBUG":
+            self.event(category, 'DEBUG', f"{check}: {result} (Score: {score}/10) - {reasoning}")
+
+# ============================================================================
+# JIRA ACCESS
+# ============================================================================
+
+
+def acli(*args):
+    """Run an acli jira command and return its stdout"""
+    result = subprocess.run(['acli', 'jira', *args], capture_output=True, text=True,
+                            check=True, timeout=ACLI_TIMEOUT)
+    return result.stdout
+
+
+def search_issues(jql, fields=SEARCH_FIELDS):
+    """All issues matching jql with the given fields, in one paginated search"""
+    output = acli('workitem', 'search', '--jql', jql, '--fields', ','.join(fields),
+                  '--paginate', '--json')
+    return json.loads(output) if output.strip() else []
+
+
+def count_issues(jql):
+    """Number of issues matching jql, from acli's --count output"""
+    output = acli('workitem', 'search', '--jql', jql, '--count')
+    match = re.search(r'\d+', output)
+    return int(match.group()) if match else 0
+
+
+def adf_text(node):
+    """Plain text of an Atlassian Document Format node"""
+    if isinstance(node, str):
+        return node
+    if isinstance(node, list):
+        return ''.join(adf_text(child) for child in node)
+    if not isinstance(node, dict):
+        return ''
+
+    node_type = node.get('type')
+    if node_type == 'text':
+        return node.get('text', '')
+    if node_type == 'hardBreak':
+        return '\n'
+    if node_type in ('mention', 'emoji', 'status', 'date'):
+        attrs = node.get('attrs', {})
+        return attrs.get('text') or attrs.get('shortName') or ''
+    if node_type == 'inlineCard':
+        return node.get('attrs', {}).get('url', '')
+
+    text = adf_text(node.get('content', []))
+    if node_type == 'doc':
+        return text.strip('\n')
+    # Block nodes end a line
+    if node_type in ('paragraph', 'heading', 'codeBlock', 'blockquote', 'listItem', 'rule',
+                     'panel', 'tableRow'):
+        return text.rstrip('\n') + '\n'
+    return text
+
+
+def field_value(value):
+    """Display value of a Jira field (select options, named objects, first of lists)"""
+    if value is None:
+        return ''
+    if isinstance(value, list):
+        return field_value(value[0]) if value else ''
+    if isinstance(value, dict):
+        if value.get('type') == 'doc':
+            return adf_text(value)
+        return str(value.get('value') or value.get('name') or '')
+    return str(value)
+
+
+def ticket_from_issue(issue):
+    """Fields the validation uses, from one issue in acli --json search output"""
+    fields = issue.get('fields') or {}
+    return {
+        'key': issue['key'],
+        'summary': field_value(fields.get('summary')),
+        # triq-monitor.sh scored the "Description:" line of acli's view, which
+        # is the first line only; the scoring thresholds were tuned on that
+        'description': field_value(fields.get('description')).split('\n', 1)[0],
+        'priority': field_value(fields.get('priority')),
+        'issue_type': field_value(fields.get('issuetype')),
+        'status': field_value(fields.get('status')),
+        'created': field_value(fields.get('created')),
+        'urgency': field_value(fields.get(URGENCY_FIELD)).strip() or 'Medium',
+        'impact': field_value(fields.get(IMPACT_FIELD)).strip() or 'Medium',
+        'labels': list(fields.get('labels') or []),
+    }
+
+# ============================================================================
+# SCORING
+# ============================================================================
+
+
+def calculate_priority(urgency, impact):
+    """Priority level from the business operations matrix, or None if unknown"""
+    return PRIORITY_MATRIX.get((urgency.lower(), impact.lower()))
+
+
+def bc_decimal(hundredths):
+    """Format hundredths as `bc` prints a scale=2 result: 2.50, .35, 0"""
+    if hundredths == 0:
+        return '0'
+    whole, fraction = divmod(hundredths, 100)
+    return f"{whole or ''}.{fraction:02d}"
+
+
+def score_ticket(ticket):
+    """
+    Score a ticket with the triq-monitor.sh rules
+
+    Returns the category results in scoring order, each with the checks
+    behind it, plus the issues found, the weighted total in hundredths, the
+    validation result and the routing it implies.
+    """
+    summary, description = ticket['summary'], ticket['description']
+    calculated = calculate_priority(ticket['urgency'], ticket['impact'])
+    assigned = PRIORITY_LEVELS.get(ticket['priority'], 3)
+    issues = []
+    checks = {name: [] for name, _, _ in CATEGORIES}
+
+    def check(category, name, result, score, reasoning):
+        checks[category].append((name, result, score, reasoning))
+        return score
+
+    # 1. SUMMARY VALIDATION (25% weight)
+    summary_score = 0
+    check('SUMMARY', 'Text Analysis', f'"{summary}"', 0, f"Length: {len(summary)} characters")
+    if len(summary) < 10:
+        issues.append(f"Summary too short ({len(summary)} chars)")
+        summary_score += check('SUMMARY', 'Length Check', 'FAIL', 1, f"Too short ({len(summary)} chars)")
+    elif len(summary) > 100:
+        issues.append(f"Summary too long ({len(summary)} chars)")
+        summary_score += check('SUMMARY', 'Length Check', 'PARTIAL', 6, f"Too long ({len(summary)} chars)")
+    else:
+        summary_score += check('SUMMARY', 'Length Check', 'PASS', 8, f"Good length ({len(summary)} chars)")
+
+    if GENERIC_TERMS.search(summary) and not SPECIFIC_TERMS.search(summary):
+        issues.append("Summary too generic")
+        check('SUMMARY', 'Specificity Check', 'FAIL', 0, "Contains generic terms")
+    else:
+        summary_score += check('SUMMARY', 'Specificity Check', 'PASS', 2, "Specific problem indication")
+
+    # 2. DESCRIPTION VALIDATION (35% weight)
+    description_score = 0
+    # Log it on one line so the log stays line-oriented
+    check('DESCRIPTION', 'Text Analysis', '"' + ' '.join(description.splitlines()) + '"', 0,
+          f"Length: {len(description)} characters")
+    if len(description) < 50:
+        issues.append(f"Description too short ({len(description)} chars)")
+        description_score += check('DESCRIPTION', 'Length Check', 'FAIL', 1,
+                                   f"Too short ({len(description)} chars)")
+    elif len(description) > 200:
+        description_score += check('DESCRIPTION', 'Length Check', 'PASS', 8,
+                                   f"Good length ({len(description)} chars)")
+    else:
+        description_score += check('DESCRIPTION', 'Length Check', 'PARTIAL', 6,
+                                   f"Adequate length ({len(description)} chars)")
+
+    if ERROR_DETAILS.search(description):
+        description_score += check('DESCRIPTION', 'Error Details', 'PASS', 2, "Contains error information")
+    else:
+        issues.append("No error details mentioned")
+        check('DESCRIPTION', 'Error Details', 'FAIL', 0, "No error details provided")
+
+    # 3. TECHNICAL CONTEXT VALIDATION (20% weight)
+    technical_score = 0
+    if ENVIRONMENT_TERMS.search(description):
+        technical_score += check('TECHNICAL', 'Environment Check', 'PASS', 3, "Environment details provided")
+    else:
+        issues.append("No environment details")
+        check('TECHNICAL', 'Environment Check', 'FAIL', 0, "No environment details")
+
+    if REPRODUCTION_TERMS.search(description):
+        technical_score += check('TECHNICAL', 'Reproduction Steps', 'PASS', 2,
+                                 "Reproduction information provided")
+    else:
+        check('TECHNICAL', 'Reproduction Steps', 'FAIL', 0, "No reproduction steps")
+
+    # 4. BUSINESS CONTEXT VALIDATION (15% weight)
+    if IMPACT_TERMS.search(f"{summary} {description}"):
+        business_score = check('BUSINESS', 'Impact Assessment', 'PASS', 3, "Business impact indicated")
+    else:
+        business_score = check('BUSINESS', 'Impact Assessment', 'PARTIAL', 1, "Limited impact information")
+
+    # 5. METADATA VALIDATION (5% weight)
+    priority = ticket['priority']
+    if calculated is None:
+        metadata_score = check('METADATA', 'Priority Matrix Check', 'PARTIAL', 6,
+                               "Cannot validate priority - missing urgency/impact data")
+    elif calculated == assigned:
+        metadata_score = check('METADATA', 'Priority Matrix Check', 'PASS', 10,
+                               f"Priority matches urgency/impact matrix ({priority})")
+    elif abs(calculated - assigned) <= 1:
+        metadata_score = check('METADATA', 'Priority Matrix Check', 'PARTIAL', 7,
+                               f"Priority close to calculated ({priority} vs calculated {calculated})")
+    else:
+        issues.append(f"Priority mismatch: assigned {priority} (level {assigned}) but "
+                      f"urgency={ticket['urgency']} + impact={ticket['impact']} suggests priority {calculated}")
+        metadata_score = check('METADATA', 'Priority Matrix Check', 'FAIL', 3, "Priority mismatch detected")
+
+    scores = [summary_score, description_score, technical_score, business_score, metadata_score]
+    categories = [
+        {'name': name, 'score': score, 'weight': weight, 'reasoning': reasoning, 'checks': checks[name]}
+        for (name, weight, reasoning), score in zip(CATEGORIES, scores)
+    ]
+
+    # Score x weight% is exact in hundredths, as bc's scale=2 arithmetic is
+    total = sum(category['score'] * category['weight'] for category in categories)
+    if total > 500:
+        if total >= 800:
+            result = 'APPROVED'
+        elif total >= 600:
+            result = 'APPROVED_WITH_NOTES'
+        else:
+            result = 'NEEDS_CLARIFICATION'
+        routing_status, routing_label = 'Eng Queue', 'engq'
+    else:
+        result = 'PARKING_LOT'
+        routing_status, routing_label = 'Parking Lot', 'parking_lot'
+
+    return {
+        'calculated_priority': calculated,
+        'assigned_priority': assigned,
+        'categories': categories,
+        'issues': issues,
+        'total': total,
+        'result': result,
+        'routing_status': routing_status,
+        'routing_label': routing_label,
+    }
+
+# ============================================================================
+# EVALUATION COUNTS
+# ============================================================================
+
+
+def open_evaluation_store(path=None):
+    """
+    Open the evaluation-count store in triq.db, creating it if needed
+
+    The first time, counts from the old KEY:COUNT counter file are imported
+    so tickets keep their progress toward escalation.
+    """
+    conn = sqlite3.connect(path or TRIQ_DB, timeout=STORE_TIMEOUT)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    for statement in EVALUATION_SCHEMA:
+        conn.execute(statement)
+
+    empty = conn.execute('SELECT 1 FROM evaluation_counts LIMIT 1').fetchone() is None
+    if empty and os.path.exists(EVALUATION_COUNTER_FILE):
+        import_counter_file(conn, EVALUATION_COUNTER_FILE)
+    conn.commit()
+    return conn
+
+
+def import_counter_file(conn, path):
+    """Load KEY:COUNT lines from the counter file triq-monitor.sh used to keep"""
+    with open(path, encoding='utf-8') as f:
+        rows = []
+        for line in f:
+            key, _, count = line.strip().partition(':')
+            if key and count.isdigit():
+                rows.append((key, int(count)))
+    conn.executemany(
+        'INSERT OR IGNORE INTO evaluation_counts (ticket_key, evaluation_count) VALUES (?, ?)',
+        rows)
+
+
+def increment_evaluation_counts(conn, keys, evaluated_at=None):
+    """
+    Count one more evaluation for each key, all in one transaction
+
+    BEGIN IMMEDIATE takes the write lock up front, so overlapping cycles
+    queue behind each other instead of losing increments. The data
+    generation is bumped too, so cached dashboard escalations refresh.
+    Returns key -> new evaluation count.
+    """
+    keys = list(dict.fromkeys(keys))
+    evaluated_at = evaluated_at or timestamp()
+    selected = json.dumps(keys)
+
+    conn.execute('BEGIN IMMEDIATE')
+    try:
+        conn.executemany('''
+            INSERT INTO evaluation_counts (ticket_key, evaluation_count, first_evaluated, last_evaluated)
+            VALUES (?, 1, ?, ?)
+            ON CONFLICT(ticket_key) DO UPDATE SET
+                evaluation_count = evaluation_count + 1,
+                first_evaluated = COALESCE(first_evaluated, excluded.first_evaluated),
+                last_evaluated = excluded.last_evaluated
+        ''', [(key, evaluated_at, evaluated_at) for key in keys])
+        conn.execute('''
+            INSERT OR REPLACE INTO evaluation_history (ticket_key, evaluation_number, evaluated_at)
+            SELECT ticket_key, evaluation_count, last_evaluated
+            FROM evaluation_counts
+            WHERE ticket_key IN (SELECT value FROM json_each(?))
+        ''', (selected,))
+        counts = dict(conn.execute('''
+            SELECT ticket_key, evaluation_count
+            FROM evaluation_counts
+            WHERE ticket_key IN (SELECT value FROM json_each(?))
+        ''', (selected,)).fetchall())
+        conn.execute(BUMP_GENERATION)
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    return counts
+
+# ============================================================================
+# VALIDATION
+# ============================================================================
+
+
+def add_labels(key, current, added):
+    """
+    Add labels to a ticket that has current; returns its labels afterwards
+
+    acli's --labels sets the whole list, so the labels the ticket already
+    has are sent along with the new ones.
+    """
+    labels = list(dict.fromkeys([*current, *added]))
+    acli('workitem', 'edit', key, '--labels', ','.join(labels))
+    return labels
+
+
+def escalate_to_admin(log, key, count, labels):
+    """Label and write the admin notification for a ticket stuck in triage; returns its labels"""
+    log.log(f"🚨 ESCALATING TO MANUAL EVALUATION: {key}")
+    if LIVE_MODE:
+        labels = add_labels(key, labels, [MANUAL_EVAL_LABEL])
+        log.log(f"Added {MANUAL_EVAL_LABEL} label to {key}")
+    else:
+        log.log(f"Would add {MANUAL_EVAL_LABEL} label to {key}")
+
+    notification_file = os.path.join(FEEDBACK_DIR, f"admin_notification_{key}.txt")
+    with open(notification_file, 'w', encoding='utf-8') as f:
+        f.write(ADMIN_NOTIFICATION.format(key=key, count=count, generated=timestamp()))
+
+    log.log(f"Admin notification created: {notification_file}")
+    log.log(f"Ticket {key} marked for manual evaluation - excluded from future automatic processing")
+    return labels
+
+
+def log_sla(log, key, priority_level):
+    if not VERBOSE_VALIDATION_LOGGING:
+        return
+    response, resolution = SLA_EXPECTATIONS.get(priority_level, ('unknown', 'unknown'))
+    log.event('SLA', 'INFO', f"Priority {priority_level} SLA: Response within {response}, "
+                             f"Resolution within {resolution}")
+    if priority_level == 1:
+        now = datetime.now()
+        if now.hour >= 17 or now.isoweekday() in (6, 7):
+            log.event('SLA', 'WARN', "Critical Priority workflow stoppage items should only be "
+                                     "addressed after hours (after 5 PM EST or weekends/holidays)")
+
+
+def apply_routing(log, key, status, label, score, labels):
+    log.log(f"Applying routing for {key}: Status={status}, Label={label}")
+    added = [VALIDATION_LABEL, f"quality_score_{score}", label]
+    if LIVE_MODE:
+        acli('workitem', 'edit', key, '--status', status)
+        add_labels(key, labels, added)
+        log.log(f"Status updated to: {status}")
+        log.log(f"Labels updated for {key}: {','.join(added)}")
+    else:
+        log.log(f"Would update status to: {status}")
+        log.log(f"Would add labels: {','.join(added)}")
+    log.log(f"Routing applied successfully for {key}")
+
+
+def post_feedback(log, key, result, score, issues):
+    """Write the feedback file for the result and post it (live mode) or log it"""
+    feedback = FEEDBACK_TEMPLATES[result].format(
+        score=score, issues='\n'.join(f"- {issue}" for issue in issues))
+    feedback_file = os.path.join(FEEDBACK_DIR, f"feedback_{key}.txt")
+    with open(feedback_file, 'w', encoding='utf-8') as f:
+        f.write(feedback)
+
+    if LOG_FEEDBACK_CONTENT:
+        log.event('FEEDBACK', 'INFO', f"Template: {result}")
+        if VALIDATION_LOG_LEVEL == "DEBUG":
+            log.event('FEEDBACK', 'DEBUG', "Content:")
+            for line in feedback.rstrip('\n').split('\n'):
+                log.event('FEEDBACK', 'DEBUG', f"> {line}")
+
+    log.log(f"Generated feedback for {key}:")
+    log.raw(feedback)
+
+    if LIVE_MODE:
+        acli('workitem', 'comment', key, '--body', feedback)
+        log.log(f"Feedback posted to {key}")
+    else:
+        log.log("(In demo mode - feedback not posted to JIRA)")
+
+
+def validate_ticket(ticket, evaluation_count):
+    """Validate, route and give feedback on one ticket; returns its log lines"""
+    key = ticket['key']
+    log = TicketLog(key)
+    log.log(f"Processing ticket: {key}")
+    log.log(f"Validating ticket: {key}")
+
+    log.log(f"Evaluation count for {key}: {evaluation_count}")
+    labels = ticket.get('labels', [])
+    if evaluation_count >= ADMIN_REVIEW_THRESHOLD:
+        log.log(f"⚠️ ADMIN REVIEW NEEDED: {key} has been evaluated {evaluation_count} times")
+        labels = escalate_to_admin(log, key, evaluation_count, labels)
+
+    scored = score_ticket(ticket)
+    calculated = scored['calculated_priority']
+    assigned = scored['assigned_priority']
+
+    if VERBOSE_VALIDATION_LOGGING:
+        log.event('VALIDATION', 'INFO', f"=== Starting Validation (Evaluation #{evaluation_count}) ===")
+        log.event('METADATA', 'INFO', f"Priority: {ticket['priority']}, Type: {ticket['issue_type']}")
+        log.event('PRIORITY', 'INFO', f"Urgency: {ticket['urgency']}, Impact: {ticket['impact']}")
+        log.event('PRIORITY', 'INFO', f"Calculated Priority: {calculated or 'unknown'}, "
+                                      f"Assigned Priority: {assigned}")
+        if calculated is not None and calculated != assigned:
+            log.event('PRIORITY', 'WARN', "Priority mismatch detected!")
+    log_sla(log, key, assigned)
+
+    for category in scored['categories']:
+        for check in category['checks']:
+            log.detail(category['name'], *check)
+        if VERBOSE_VALIDATION_LOGGING:
+            weight = category['weight']
+            log.event(category['name'], 'INFO',
+                      f"Category Score: {category['score']}/10 "
+                      f"(Weighted: {bc_decimal(category['score'] * weight)}/{bc_decimal(10 * weight)}) "
+                      f"- {category['reasoning']}")
+
+    score = bc_decimal(scored['total'])
+    if VERBOSE_VALIDATION_LOGGING:
+        log.event('VALIDATION', 'INFO', f"=== Final Score: {score}/10.0 ({scored['result']}) ===")
+        log.event('ROUTING', 'INFO', f"Decision: {scored['routing_status']} (Score threshold: 5.0)")
+
+    if scored['issues']:
+        log.log("Issues identified:")
+        for issue in scored['issues']:
+            log.log(f"  - {issue}")
+
+    apply_routing(log, key, scored['routing_status'], scored['routing_label'], score, labels)
+    post_feedback(log, key, scored['result'], score, scored['issues'])
+    return log.lines
+
+
+def validate_tickets(tickets, workers=WORKERS, db_file=None):
+    """
+    Validate tickets concurrently, logging each ticket's block in input order
+
+    Evaluation counts for the whole batch are updated up front in one
+    transaction. Returns the number of tickets validated.
+    """
+    conn = open_evaluation_store(db_file)
+    try:
+        counts = increment_evaluation_counts(conn, [ticket['key'] for ticket in tickets])
+    finally:
+        conn.close()
+
+    def run(ticket):
+        try:
+            return validate_ticket(ticket, counts[ticket['key']])
+        except (OSError, subprocess.SubprocessError) as e:
+            return [f"[{timestamp()}] ERROR: Could not validate {ticket['key']}: {e}"]
+
+    validated = 0
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        for lines in pool.map(run, tickets):
+            write_log(lines)
+            validated += 1
+    return validated
+
+
+def ticket_table(tickets):
+    """Candidate tickets as a plain table, like acli's search listing"""
+    rows = [('Type', 'Key', 'Priority', 'Status', 'Summary')]
+    rows += [(t['issue_type'], t['key'], t['priority'], t['status'], t['summary']) for t in tickets]
+    widths = [max(len(row[i]) for row in rows) for i in range(4)]
+    return '\n'.join('   '.join(row[i].ljust(widths[i]) for i in range(4)) + '   ' + row[4]
+                     for row in rows)
+
+
+def check_new_tickets(keys=None, issues=None, workers=WORKERS, db_file=None):
+    """
+    Find tickets needing validation and validate them
+
+    keys limits the run to those tickets; issues supplies recorded search
+    results instead of querying Jira.
+    """
+    log("Checking for new Engineering Portal tickets...")
+
+    if issues is None:
+        jql = CANDIDATE_JQL
+        if keys:
+            jql = f"project = {PROJECT} AND key IN ({', '.join(keys)})"
+        try:
+            issues = search_issues(jql)
+        except (OSError, subprocess.SubprocessError, ValueError) as e:
+            log(f"ERROR: Ticket search failed: {e}")
+            return 0
+
+    tickets = sorted((ticket_from_issue(issue) for issue in issues), key=lambda t: t['key'])
+    if keys:
+        found = {ticket['key'] for ticket in tickets}
+        for key in keys:
+            if key not in found:
+                log(f"ERROR: Could not retrieve details for {key}")
+        tickets = [ticket for ticket in tickets if ticket['key'] in keys]
+
+    if not tickets:
+        log("No tickets found in Initial Review or Parking Lot statuses")
+        return 0
+
+    log("Found new tickets requiring validation:")
+    write_log(ticket_table(tickets).splitlines())
+    return validate_tickets(tickets, workers, db_file)
+
+
+# ============================================================================
+# MONITORING CYCLE
+# ============================================================================
+
+
+def parse_created(value):
+    """Timezone-aware datetime from a Jira timestamp, or None if unreadable"""
+    try:
+        return datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f%z')
+    except (TypeError, ValueError):
+        return None
+
+
+def is_candidate(issue):
+    """Whether a snapshot issue is due for validation (CANDIDATE_JQL, in memory)"""
+    fields = issue.get('fields') or {}
+    return (field_value(fields.get('status')) in TRIAGE_STATUSES
+            and MANUAL_EVAL_LABEL not in (fields.get('labels') or []))
+
+
+def fetch_snapshot():
+    """This cycle's issues and the project total: one search and one count"""
+    issues = search_issues(SNAPSHOT_JQL)
+    try:
+        total = count_issues(f"project = {PROJECT}")
+    except (OSError, subprocess.SubprocessError) as e:
+        log(f"ERROR: Project count failed: {e}")
+        total = 0
+    return issues, total
+
+
+def collect_metrics(issues, total, now=None):
+    """
+    Ticket counts, emergencies and validation candidates from one snapshot
+
+    Matches the searches triq-monitor.sh used to run separately: created in
+    the last day and week, emergency keywords in the last day's summaries,
+    and the candidate search.
+    """
+    now = now or datetime.now(timezone.utc)
+    metrics = {'today': 0, 'week': 0, 'total': total, 'emergencies': [], 'candidates': []}
+    for issue in issues:
+        if is_candidate(issue):
+            metrics['candidates'].append(issue)
+
+        created = parse_created((issue.get('fields') or {}).get('created'))
+        if created is None or now - created > timedelta(days=SNAPSHOT_DAYS):
+            continue
+        metrics['week'] += 1
+        if now - created <= timedelta(days=1):
+            metrics['today'] += 1
+            ticket = ticket_from_issue(issue)
+            if EMERGENCY_TERMS.search(ticket['summary']):
+                metrics['emergencies'].append(ticket)
+    return metrics
+
+
+def check_emergencies(tickets):
+    log("Checking for emergency situations...")
+    if tickets:
+        log("🚨 POTENTIAL EMERGENCY TICKETS FOUND:")
+        write_log(ticket_table(sorted(tickets, key=lambda t: t['key'])).splitlines())
+        # In production, would trigger alerts here
+        log("Would trigger emergency notification to on-call team")
+    else:
+        log("No emergency situations detected")
+
+
+def count_log_lines(*patterns):
+    """Lines of the monitor log containing each pattern (grep -c for each)"""
+    counts = [0] * len(patterns)
+    if not os.path.exists(LOG_FILE):
+        return counts
+    with open(LOG_FILE, encoding='utf-8', errors='ignore') as f:
+        for line in f:
+            for i, pattern in enumerate(patterns):
+                if pattern in line:
+                    counts[i] += 1
+    return counts
+
+
+def generate_report(metrics, report_file=REPORT_FILE):
+    log("Generating daily metrics...")
+    processed, completed = count_log_lines("Processing ticket:", "Validation Result:")
+    now = datetime.now()
+    report = DAILY_REPORT.format(
+        date=now.strftime('%Y-%m-%d'), time=now.strftime('%H:%M:%S'),
+        today=metrics['today'], week=metrics['week'], total=metrics['total'],
+        processed=processed, completed=completed,
+        next_run=(now + timedelta(minutes=RUN_INTERVAL_MINUTES)).strftime('%Y-%m-%d %H:%M:%S'))
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write(report)
+
+    log("Daily report generated:")
+    write_log(report.splitlines())
+
+
+def run_cycle(workers=WORKERS, db_file=None, report_file=REPORT_FILE, snapshot=None):
+    """
+    Validate candidates, check emergencies and write the daily report
+
+    snapshot is (issues, project total); without it one is fetched from Jira.
+    """
+    if snapshot is None:
+        try:
+            snapshot = fetch_snapshot()
+        except (OSError, subprocess.SubprocessError, ValueError) as e:
+            log(f"ERROR: Ticket search failed: {e}")
+            return
+    metrics = collect_metrics(*snapshot)
+
+    check_new_tickets(issues=metrics['candidates'], workers=workers, db_file=db_file)
+    check_emergencies(metrics['emergencies'])
+    generate_report(metrics, report_file)
+
+
+def main():
+    global LIVE_MODE
+
+    parser = argparse.ArgumentParser(description='Validate TriQ candidate tickets')
+    parser.add_argument('--tickets', nargs='+', help='Validate only these ticket keys')
+    parser.add_argument('--workers', type=int, default=WORKERS, help='Tickets validated concurrently')
+    parser.add_argument('--from-json', metavar='FILE',
+                        help='Use recorded `acli jira workitem search --json` output instead of Jira')
+    parser.add_argument('--live', action='store_true',
+                        help='Update status/labels and post feedback in Jira (default: demo mode)')
+    parser.add_argument('--db', default=TRIQ_DB, help='Database holding evaluation counts')
+    parser.add_argument('--cycle', action='store_true',
+                        help='Full monitoring cycle: also check emergencies and write the daily report')
+    parser.add_argument('--report', default=REPORT_FILE, help='Daily report file (with --cycle)')
+    args = parser.parse_args()
+    if args.cycle and args.tickets:
+        parser.error('--tickets cannot be combined with --cycle')
+
+    LIVE_MODE = LIVE_MODE or args.live
+    issues = None
+    if args.from_json:
+        with open(args.from_json, encoding='utf-8') as f:
+            issues = json.load(f)
+
+    if args.cycle:
+        # Recorded search output stands in for the snapshot and the project count
+        snapshot = (issues, len(issues)) if issues is not None else None
+        run_cycle(args.workers, args.db, args.report, snapshot)
+    else:
+        check_new_tickets(keys=args.tickets, issues=issues, workers=args.workers, db_file=args.db)
+
+
+if __name__ == '__main__':
+    main()
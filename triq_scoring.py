@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Vectorized TriQ Scoring
+
+Column-wise versions of the per-ticket TriQ scoring used by the CSV
+exporters. Each scorer takes a DataFrame of tickets and returns the
+TriQ_Score, Quality_Issues and Action_Required columns with exactly the
+values the scalar functions produce:
+
+    score_comprehensive  ->  generate_tri_csv.py
+    score_final          ->  create_final_csv.py
+
+Scores are accumulated in integer tenths, so no float rounding can drift
+from round(score, 1). Quality issues are combined into a bitmask per row
+and each distinct mask is rendered to text only once.
+
+Usage:
+    from triq_scoring import score_final
+    scored = score_final(df)   # df has Summary, Status, Assignee, Urgency
+"""
+
+import numpy as np
+import pandas as pd
+
+RESOLVED_STATUSES = ['Resolved', 'Closed']
+
+
+def _text(df, column):
+    """String view of a column with missing values treated as empty"""
+    return df[column].fillna('').astype(str)
+
+
+def _score_from_tenths(tenths):
+    return np.clip(tenths, 10, 100) / 10.0
+
+
+def _render_issues(masks, labels):
+    """Join the labels of set flags with '; ', one render per distinct combination
+
+    Returns the Quality_Issues strings and the integer code of each row so
+    callers can derive substring checks per code instead of per row.
+    """
+    codes = np.zeros(len(masks[0]), dtype=np.int64)
+    for bit, mask in enumerate(masks):
+        codes |= np.asarray(mask, dtype=np.int64) << bit
+
+    unique_codes, inverse = np.unique(codes, return_inverse=True)
+    rendered = []
+    for code in unique_codes:
+        issues = [label for bit, label in enumerate(labels) if code >> bit & 1]
+        rendered.append("; ".join(issues) if issues else "Standard quality")
+    rendered = np.array(rendered, dtype=object)
+    return rendered[inverse], rendered, inverse
+
+
+def _contains(rendered, inverse, needle):
+    """Per-row `needle in quality_issues` evaluated once per distinct string"""
+    return np.array([needle in text for text in rendered], dtype=bool)[inverse]
+
+
+def estimate_has_description(summary):
+    """Vectorized has_description estimate used by generate_tri_csv.py"""
+    summary = summary.fillna('').astype(str)
+    return (summary.str.len() > 50) | summary.str.lower().str.contains('detailed', regex=False)
+
+
+def score_comprehensive(df, has_description=None):
+    """Score tickets like generate_tri_csv.py
+
+    Expects Summary, Status, Assignee and Urgency columns. has_description
+    defaults to a Has_Description column, or is estimated from the summary.
+    """
+    summary = _text(df, 'Summary')
+    status = _text(df, 'Status').to_numpy()
+    assignee = _text(df, 'Assignee').to_numpy()
+    urgency = _text(df, 'Urgency').to_numpy()
+
+    if has_description is None:
+        if 'Has_Description' in df:
+            has_description = df['Has_Description']
+        else:
+            has_description = estimate_has_description(summary)
+    has_description = np.asarray(has_description, dtype=bool)
+
+    length = summary.str.len().to_numpy()
+    has_cid = summary.str.contains('CID', regex=False).to_numpy()
+    has_assignee = assignee != ''
+    assigned = has_assignee & (assignee != 'UNASSIGNED')
+    resolved = np.isin(status, RESOLVED_STATUSES)
+
+    tenths = np.full(len(df), 50, dtype=np.int64)
+    tenths += np.where(has_cid & (length > 20), 15, np.where(length > 10, 5, 0))
+    tenths += np.where(has_description, 20, -10)
+    tenths += np.where(assigned, 5, -5)
+    tenths += np.where(resolved, 5, np.where((status == 'In Progress') & has_assignee, 3, 0))
+    triq_score = _score_from_tenths(tenths)
+
+    unassigned = ~assigned
+    critical = urgency == 'Critical'
+    high = urgency == 'High'
+    quality_issues, rendered, inverse = _render_issues(
+        [
+            ~has_description,
+            unassigned & critical,
+            unassigned & high,
+            unassigned & ~critical & ~high,
+            length < 10,
+            (status == 'Waiting for customer') & ~has_description,
+            critical & ~has_description,
+            high & ~has_description,
+        ],
+        [
+            "NO DESCRIPTION",
+            "UNASSIGNED CRITICAL - SLA BREACH RISK",
+            "UNASSIGNED HIGH URGENCY",
+            "UNASSIGNED",
+            "VAGUE SUMMARY",
+            "WAITING WITHOUT INVESTIGATION",
+            "CRITICAL URGENCY LACKS DETAIL",
+            "HIGH URGENCY LACKS DETAIL",
+        ],
+    )
+
+    action_required = np.select(
+        [
+            _contains(rendered, inverse, "SLA BREACH RISK"),
+            triq_score < 5.0,
+            _contains(rendered, inverse, "UNASSIGNED"),
+            (status == 'Pending') & _contains(rendered, inverse, "Enhancement"),
+            triq_score >= 8.5,
+            resolved,
+        ],
+        [
+            "URGENT: ASSIGN + DESCRIBE",
+            "REQUEST REVISION",
+            "ASSIGN SPECIALIST",
+            "ROUTE TO PRODUCT MGMT",
+            "USE AS TEMPLATE",
+            "RESOLVED",
+        ],
+        default="STANDARD PROCESSING",
+    )
+
+    return pd.DataFrame({
+        'TriQ_Score': triq_score,
+        'Quality_Issues': quality_issues,
+        'Action_Required': action_required.astype(object),
+    }, index=df.index)
+
+
+def score_final(df):
+    """Score tickets like create_final_csv.py
+
+    Expects Summary, Status, Assignee and Urgency columns.
+    """
+    summary = _text(df, 'Summary')
+    status = _text(df, 'Status').to_numpy()
+    assignee_text = _text(df, 'Assignee')
+    assignee = assignee_text.to_numpy()
+    urgency = _text(df, 'Urgency').to_numpy()
+
+    length = summary.str.len().to_numpy()
+    has_cid = summary.str.contains('CID', regex=False).to_numpy()
+    has_colon = summary.str.contains(':', regex=False).to_numpy()
+    has_assignee = assignee != ''
+    resolved = np.isin(status, RESOLVED_STATUSES)
+    critical = urgency == 'Critical'
+    high = urgency == 'High'
+
+    tenths = np.full(len(df), 50, dtype=np.int64)
+    tenths += np.where(has_cid & has_colon, 20, np.where(has_cid, 10, 0))
+    tenths += np.where(length > 50, 10, np.where(length < 20, -10, 0))
+    tenths += np.where(has_assignee, 10, -10)
+    tenths += np.where(resolved, 5, np.where((status == 'In Progress') & has_assignee, 3, 0))
+    tenths += np.where(critical & ~has_assignee, -20, np.where(high & ~has_assignee, -10, 0))
+    triq_score = _score_from_tenths(tenths)
+
+    unassigned = (assignee_text.str.strip() == '').to_numpy()
+    quality_issues, rendered, inverse = _render_issues(
+        [
+            unassigned & critical,
+            unassigned & high,
+            unassigned & ~critical & ~high,
+            length < 20,
+            critical & (length < 30),
+            high & (length < 30),
+            (status == 'Waiting for customer') & (length < 40),
+        ],
+        [
+            "UNASSIGNED CRITICAL - SLA BREACH RISK",
+            "UNASSIGNED HIGH URGENCY",
+            "UNASSIGNED",
+            "VAGUE SUMMARY",
+            "CRITICAL URGENCY LACKS DETAIL",
+            "HIGH URGENCY LACKS DETAIL",
+            "WAITING WITHOUT PROPER INVESTIGATION",
+        ],
+    )
+
+    action_required = np.select(
+        [
+            _contains(rendered, inverse, "SLA BREACH RISK"),
+            _contains(rendered, inverse, "UNASSIGNED HIGH URGENCY"),
+            triq_score < 4.0,
+            _contains(rendered, inverse, "UNASSIGNED"),
+            triq_score >= 8.0,
+            resolved,
+            (status == 'Pending') & _contains(rendered, inverse, "Enhancement"),
+        ],
+        [
+            "URGENT: ASSIGN IMMEDIATELY",
+            "URGENT: ASSIGN SPECIALIST",
+            "REQUEST REVISION",
+            "ASSIGN TO SPECIALIST",
+            "USE AS TEMPLATE",
+            "RESOLVED",
+            "ROUTE TO PRODUCT MGMT",
+        ],
+        default="STANDARD PROCESSING",
+    )
+
+    return pd.DataFrame({
+        'TriQ_Score': triq_score,
+        'Quality_Issues': quality_issues,
+        'Action_Required': action_required.astype(object),
+    }, index=df.index)
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+TriQ Webhook Receiver
+
+Small local HTTP receiver for Jira issue-created/updated webhooks. Tickets
+that land in (or are edited while in) triage are queued and validated a
+moment later through triq_monitor.py's scoring and routing, instead of
+waiting for the next polling cycle. A burst of events for one ticket
+validates it once, with the latest payload.
+
+Updates that cannot change the score are ignored: label changes, comments
+and the status moves TriQ makes when routing, so its own edits do not
+re-trigger validation. A full polling cycle (triq_monitor.py --cycle) still
+runs every --reconcile-minutes to catch anything a webhook missed.
+
+Register http://<host>:5002/webhook in Jira (Settings > System > WebHooks)
+for "Issue created" and "Issue updated", JQL: project = EP.
+
+Usage:
+    python3 triq_webhook.py                           # receive on 127.0.0.1:5002
+    python3 triq_webhook.py --host 0.0.0.0 --secret s3cret --live
+    python3 triq_webhook.py --reconcile-minutes 0     # webhooks only, no polling
+    python3 triq_webhook.py --post payloads/*.json    # replay recorded payloads
+"""
+
+import argparse
+import glob
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import triq_monitor
+from triq_monitor import log
+
+HOST = '127.0.0.1'
+PORT = 5002
+WEBHOOK_PATH = '/webhook'
+DEBOUNCE_SECONDS = 5  # quiet time after a ticket's last event before validating
+MAX_DELAY_SECONDS = 30  # validate by then even if events keep arriving
+RECONCILE_MINUTES = 60  # full polling cycle as a fallback (0 disables)
+MAX_PAYLOAD_BYTES = 5 * 1024 * 1024
+SECRET = os.environ.get('TRIQ_WEBHOOK_SECRET', '')
+
+# Changelog fields (fieldId, or field name for older payloads) the score depends on
+SCORED_FIELDS = {'summary', 'description', 'priority', 'issuetype',
+                 triq_monitor.URGENCY_FIELD, triq_monitor.IMPACT_FIELD}
+
+# ============================================================================
+# EVENT FILTERING
+# ============================================================================
+
+
+def triggers_validation(payload):
+    """Whether a webhook event could change the ticket's validation"""
+    event = payload.get('webhookEvent')
+    if event == 'jira:issue_created':
+        return True
+    if event != 'jira:issue_updated':
+        return False
+    for item in (payload.get('changelog') or {}).get('items') or []:
+        field = item.get('fieldId') or item.get('field')
+        if field in SCORED_FIELDS:
+            return True
+        # Moved (back) into Initial Review; TriQ itself only routes out of it
+        if field == 'status' and item.get('toString') == 'Initial Review':
+            return True
+    return False
+
+
+def signature_valid(body, header, secret):
+    """Check Jira's X-Hub-Signature (sha256=<hex HMAC of the body>)"""
+    if not secret:
+        return True
+    expected = 'sha256=' + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected, header or '')
+
+# ============================================================================
+# TICKET QUEUE
+# ============================================================================
+
+
+class TicketQueue:
+    """
+    Pending tickets keyed by issue key
+
+    Each event for a queued key replaces its payload and pushes its due time
+    back by the debounce delay, up to max_delay after it was first queued.
+    """
+
+    def __init__(self, delay=DEBOUNCE_SECONDS, max_delay=MAX_DELAY_SECONDS):
+        self.delay = delay
+        self.max_delay = max_delay
+        self._pending = {}  # key -> (first queued, due, issue)
+        self._changed = threading.Condition()
+
+    def put(self, issue):
+        now = time.monotonic()
+        with self._changed:
+            first = self._pending[issue['key']][0] if issue['key'] in self._pending else now
+            due = min(now + self.delay, first + self.max_delay)
+            self._pending[issue['key']] = (first, due, issue)
+            self._changed.notify()
+
+    def take(self, timeout=None):
+        """Wait for tickets that are due and remove them; [] on timeout"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._changed:
+            while True:
+                now = time.monotonic()
+                due = [key for key, (_, at, _) in self._pending.items() if at <= now]
+                if due:
+                    return [self._pending.pop(key)[2] for key in due]
+
+                waits = [at - now for _, at, _ in self._pending.values()]
+                if deadline is not None:
+                    if now >= deadline:
+                        return []
+                    waits.append(deadline - now)
+                self._changed.wait(min(waits) if waits else None)
+
+    def __len__(self):
+        with self._changed:
+            return len(self._pending)
+
+# ============================================================================
+# VALIDATION WORKER
+# ============================================================================
+
+
+def run_worker(queue, stop, workers, db_file, reconcile_minutes):
+    """
+    Validate queued tickets, and run a full cycle every reconcile_minutes
+
+    Everything runs on this one thread, so a ticket is never validated by
+    a webhook batch and a reconciliation cycle at the same time. A failed
+    batch or cycle is logged and the loop carries on.
+    """
+    interval = reconcile_minutes * 60
+    next_reconcile = time.monotonic() + interval if interval else None
+    while not stop.is_set():
+        timeout = 1.0 if next_reconcile is None else max(0.0, min(1.0, next_reconcile - time.monotonic()))
+        issues = queue.take(timeout)
+        if issues:
+            try:
+                triq_monitor.check_new_tickets(issues=issues, workers=workers, db_file=db_file)
+            except Exception as e:
+                keys = ', '.join(issue['key'] for issue in issues)
+                log(f"ERROR: Webhook validation failed for {keys}: {e!r}")
+
+        if next_reconcile is not None and time.monotonic() >= next_reconcile:
+            log("Webhook receiver: running reconciliation cycle...")
+            try:
+                triq_monitor.run_cycle(workers=workers, db_file=db_file)
+            except Exception as e:
+                log(f"ERROR: Reconciliation cycle failed: {e!r}")
+            next_reconcile = time.monotonic() + interval
+
+# ============================================================================
+# HTTP RECEIVER
+# ============================================================================
+
+
+class WebhookHandler(BaseHTTPRequestHandler):
+    queue = None
+    secret = SECRET
+    worker = None
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == '/health':
+            # Events are still accepted if the worker died, but nothing validates them
+            if self.worker is None or not self.worker.is_alive():
+                self.send_json(503, {'status': 'unhealthy', 'worker': 'stopped', 'queued': len(self.queue)})
+            else:
+                self.send_json(200, {'status': 'healthy', 'worker': 'running', 'queued': len(self.queue)})
+        else:
+            self.send_json(404, {'error': 'Not found'})
+
+    def do_POST(self):
+        if self.path.split('?')[0] != WEBHOOK_PATH:
+            return self.send_json(404, {'error': 'Not found'})
+
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_PAYLOAD_BYTES:
+            return self.send_json(413, {'error': 'Payload too large'})
+        body = self.rfile.read(length)
+        if not signature_valid(body, self.headers.get('X-Hub-Signature'), self.secret):
+            return self.send_json(401, {'error': 'Invalid signature'})
+
+        try:
+            payload = json.loads(body)
+            issue = payload['issue']
+            key = issue['key']
+        except (ValueError, TypeError, KeyError):
+            return self.send_json(400, {'error': 'Expected a Jira issue webhook payload'})
+
+        event = payload.get('webhookEvent')
+        if not triggers_validation(payload):
+            return self.send_json(200, {'key': key, 'event': event, 'queued': False,
+                                        'reason': 'no scored field changed'})
+        if not triq_monitor.is_candidate(issue):
+            return self.send_json(200, {'key': key, 'event': event, 'queued': False,
+                                        'reason': 'not awaiting validation'})
+
+        self.queue.put(issue)
+        log(f"Webhook {event} for {key}: queued for validation")
+        self.send_json(202, {'key': key, 'event': event, 'queued': True})
+
+    def log_message(self, format, *args):
+        # Queued tickets are logged above; skip the per-request access log
+        pass
+
+
+def serve(host, port, workers, db_file, reconcile_minutes, secret):
+    queue = TicketQueue()
+    stop = threading.Event()
+    worker = threading.Thread(target=run_worker, daemon=True,
+                              args=(queue, stop, workers, db_file, reconcile_minutes))
+    worker.start()
+
+    WebhookHandler.queue = queue
+    WebhookHandler.secret = secret
+    WebhookHandler.worker = worker
+    server = ThreadingHTTPServer((host, port), WebhookHandler)
+
+    log(f"Webhook receiver listening on http://{host}:{port}{WEBHOOK_PATH}")
+    if reconcile_minutes:
+        log(f"Reconciliation cycle every {reconcile_minutes} minutes")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print()
+    finally:
+        server.server_close()
+        stop.set()
+        worker.join()
+        log("Webhook receiver stopped")
+
+# ============================================================================
+# REPLAY
+# ============================================================================
+
+
+def post_payloads(url, paths, secret):
+    """POST recorded webhook payloads (one JSON object per file) to a receiver"""
+    for path in paths:
+        with open(path, 'rb') as f:
+            body = f.read()
+        request = urllib.request.Request(url, data=body, method='POST',
+                                         headers={'Content-Type': 'application/json'})
+        if secret:
+            signature = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+            request.add_header('X-Hub-Signature', f'sha256={signature}')
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                status, reply = response.status, response.read().decode()
+        except urllib.error.HTTPError as e:
+            status, reply = e.code, e.read().decode()
+        print(f"{status} {os.path.basename(path)}: {reply}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate TriQ tickets from Jira webhooks')
+    parser.add_argument('--host', default=HOST, help='Interface to listen on')
+    parser.add_argument('--port', type=int, default=PORT, help='Port to listen on')
+    parser.add_argument('--workers', type=int, default=triq_monitor.WORKERS,
+                        help='Tickets validated concurrently')
+    parser.add_argument('--db', default=triq_monitor.TRIQ_DB, help='Database holding evaluation counts')
+    parser.add_argument('--reconcile-minutes', type=float, default=RECONCILE_MINUTES,
+                        help='Minutes between full polling cycles (0 disables)')
+    parser.add_argument('--secret', default=SECRET,
+                        help='Webhook secret for X-Hub-Signature checks (or TRIQ_WEBHOOK_SECRET)')
+    parser.add_argument('--live', action='store_true',
+                        help='Update status/labels and post feedback in Jira (default: demo mode)')
+    parser.add_argument('--post', nargs='+', metavar='FILE',
+                        help='Post recorded payload files to a running receiver and exit')
+    args = parser.parse_args()
+
+    if args.post:
+        paths = [path for pattern in args.post for path in sorted(glob.glob(pattern)) or [pattern]]
+        post_payloads(f"http://{args.host}:{args.port}{WEBHOOK_PATH}", paths, args.secret)
+        return
+
+    triq_monitor.LIVE_MODE = triq_monitor.LIVE_MODE or args.live
+    serve(args.host, args.port, args.workers, args.db, args.reconcile_minutes, args.secret)
+
+
+if __name__ == '__main__':
+    main()